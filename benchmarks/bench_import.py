@@ -0,0 +1,49 @@
+"""Benchmark of importing footings and creating many model classes.
+
+Each measurement runs in a fresh interpreter so module import costs are included.
+
+    python benchmarks/bench_import.py
+"""
+import subprocess
+import sys
+
+N_MODELS = 200
+REPEAT = 5
+
+CODE = f"""
+import time
+start = time.perf_counter()
+from footings.model import model, step, def_parameter, def_sensitivity, def_return
+imported = time.perf_counter()
+for i in range({N_MODELS}):
+    @model(steps=["_calc"])
+    class Product:
+        '''A product model.'''
+        x = def_parameter(dtype=int, description="A parameter.")
+        y = def_sensitivity(default=1, description="A sensitivity.")
+        out = def_return(dtype=int, description="A return.")
+
+        @step(uses=["x", "y"], impacts=["out"])
+        def _calc(self):
+            '''Calculate out.'''
+            self.out = self.x * self.y
+created = time.perf_counter()
+print(imported - start, created - imported)
+"""
+
+
+def main():
+    results = []
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, "-c", CODE], capture_output=True, text=True, check=True
+        )
+        results.append([float(x) for x in out.stdout.split()])
+    import_time = min(r[0] for r in results)
+    create_time = min(r[1] for r in results)
+    print(f"import footings.model      : {import_time * 1e3:.1f} ms")
+    print(f"create {N_MODELS} model classes : {create_time * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
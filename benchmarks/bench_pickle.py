@@ -0,0 +1,69 @@
+"""Benchmark of the payload size and serialization time of shipping a model instance to a worker.
+
+Compares pickling an instance with its class by reference (the default now that model classes
+keep the module they are defined in) against cloudpickle serializing the whole dynamic class
+by value (how model classes were shipped when their module could not be looked up).
+
+    python benchmarks/bench_pickle.py
+"""
+import pickle
+import sys
+import timeit
+
+import cloudpickle
+import pandas as pd
+
+from footings.model import model, step, def_parameter, def_intermediate, def_return
+
+
+@model(steps=["_step1", "_step2"])
+class PolicyModel:
+    """A small model representative of a per policy task."""
+
+    policy_id = def_parameter(description="The policy id.")
+    benefit = def_parameter(description="The benefit amount.")
+    duration = def_parameter(description="The number of years.")
+    projection = def_intermediate(description="The projection.")
+    reserve = def_return(description="The reserve.")
+
+    @step(uses=["benefit", "duration"], impacts=["projection"])
+    def _step1(self):
+        """Project benefits."""
+        self.projection = pd.DataFrame({"t": range(self.duration), "b": self.benefit})
+
+    @step(uses=["projection"], impacts=["reserve"])
+    def _step2(self):
+        """Sum benefits."""
+        self.reserve = self.projection["b"].sum()
+
+
+def _measure(dumps, value, number):
+    payload = dumps(value)
+    seconds = min(timeit.repeat(lambda: dumps(value), number=number, repeat=5))
+    return len(payload), seconds / number * 1e6
+
+
+def main(number=20_000):
+    instance = PolicyModel(policy_id="P1", benefit=100, duration=10)
+    module = sys.modules[PolicyModel.__module__]
+    results = {
+        "pickle (class by reference)": _measure(pickle.dumps, instance, number),
+        "cloudpickle (class by reference)": _measure(cloudpickle.dumps, instance, number),
+    }
+    cloudpickle.register_pickle_by_value(module)
+    try:
+        results["cloudpickle (class by value)"] = _measure(
+            cloudpickle.dumps, instance, number // 20
+        )
+    finally:
+        cloudpickle.unregister_pickle_by_value(module)
+
+    for name, (size, us) in results.items():
+        print(f"{name:<34}: {size:>7} bytes {us:>10.2f} us per task")
+
+
+if __name__ == "__main__":
+    # import the benchmark as a module so PolicyModel is importable by reference
+    import bench_pickle
+
+    bench_pickle.main()
@@ -0,0 +1,44 @@
+"""Micro-benchmark of creating a model per record against from_trusted and rebinding one instance.
+
+    python benchmarks/bench_rebind.py
+"""
+import timeit
+
+from attr.validators import instance_of
+
+from footings.model import model, step, def_parameter, def_intermediate, def_return
+
+
+@model(steps=["_step1", "_step2"])
+class TinyModel:
+    x = def_parameter(validator=instance_of(int))
+    y = def_parameter(validator=instance_of(int))
+    xy = def_intermediate()
+    out = def_return()
+
+    @step(uses=["x", "y"], impacts=["xy"])
+    def _step1(self):
+        self.xy = self.x * self.y
+
+    @step(uses=["xy"], impacts=["out"])
+    def _step2(self):
+        self.out = self.xy + 1
+
+
+def _time(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5))
+
+
+def main(number=200_000):
+    instance = TinyModel(x=2, y=3)
+    new = _time(lambda: TinyModel(x=2, y=3).run(), number)
+    trusted = _time(lambda: TinyModel.from_trusted(x=2, y=3).run(), number)
+    rebind = _time(lambda: instance.rebind(x=2, y=3).run(), number)
+    print(f"runs = {number}")
+    print(f"new instance : {new / number * 1e6:.3f} us per run")
+    print(f"from_trusted : {trusted / number * 1e6:.3f} us per run")
+    print(f"rebind       : {rebind / number * 1e6:.3f} us per run")
+
+
+if __name__ == "__main__":
+    main()
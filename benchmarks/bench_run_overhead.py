@@ -0,0 +1,45 @@
+"""Micro-benchmark of the per-run overhead of a tiny model.
+
+Compares running a model through the compiled RunPlan (the default path of Model.run) against
+the general step loop used when run options are passed.
+
+    python benchmarks/bench_run_overhead.py
+"""
+import timeit
+
+from footings.model import model, step, def_parameter, def_intermediate, def_return, _run
+
+
+@model(steps=["_step1", "_step2", "_step3"])
+class TinyModel:
+    x = def_parameter()
+    y = def_parameter()
+    xy = def_intermediate()
+    out1 = def_return()
+    out2 = def_return()
+
+    @step(uses=["x", "y"], impacts=["xy"])
+    def _step1(self):
+        self.xy = self.x * self.y
+
+    @step(uses=["xy"], impacts=["out1"])
+    def _step2(self):
+        self.out1 = self.xy + 1
+
+    @step(uses=["xy"], impacts=["out2"])
+    def _step3(self):
+        self.out2 = self.xy - 1
+
+
+def main(number=200_000):
+    instance = TinyModel(x=2, y=3)
+    general = timeit.timeit(lambda: _run(instance, to_step=None), number=number)
+    plan = timeit.timeit(lambda: instance.run(), number=number)
+    print(f"runs = {number}")
+    print(f"general loop : {general / number * 1e6:.3f} us per run")
+    print(f"run plan     : {plan / number * 1e6:.3f} us per run")
+    print(f"speedup      : {general / plan:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
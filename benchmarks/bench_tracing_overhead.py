@@ -0,0 +1,59 @@
+"""Benchmark of the overhead of the tracing checks on the hot paths when tracing is off.
+
+Compares running a tiny model directly through its RunPlan (no profiling or tracing checks)
+against Model.run with tracing off and on, and the same for a WrappedModel call.
+
+    python benchmarks/bench_tracing_overhead.py
+"""
+import timeit
+
+from footings.jigs import WrappedModel
+from footings.model import model, step, def_parameter, def_intermediate, def_return
+from footings.tracing import trace
+
+
+@model(steps=["_step1", "_step2"])
+class TinyModel:
+    k = def_parameter()
+    x = def_parameter()
+    xy = def_intermediate()
+    out = def_return()
+
+    @step(uses=["x"], impacts=["xy"])
+    def _step1(self):
+        self.xy = self.x * 2
+
+    @step(uses=["xy"], impacts=["out"])
+    def _step2(self):
+        self.out = self.xy + 1
+
+
+def _time(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number=200_000):
+    instance = TinyModel(k=1, x=2)
+    plan = TinyModel.__model_run_plan__
+    wrapped = WrappedModel(TinyModel, iterator_keys=("k",), pass_iterator_keys=("k",))
+    results = {
+        "run plan (no checks)": _time(lambda: plan(instance), number),
+        "Model.run tracing off": _time(lambda: instance.run(), number),
+        "WrappedModel tracing off": _time(lambda: wrapped(k=1, x=2), number),
+    }
+    with trace():
+        results["Model.run tracing on"] = _time(lambda: instance.run(), number // 10)
+        results["WrappedModel tracing on"] = _time(
+            lambda: wrapped(k=1, x=2), number // 10
+        )
+
+    for name, us in results.items():
+        print(f"{name:<26}: {us:.3f} us per call")
+    overhead = results["Model.run tracing off"] - results["run plan (no checks)"]
+    print(
+        f"run overhead of profiling and tracing checks when off: {overhead * 1000:.0f} ns"
+    )
+
+
+if __name__ == "__main__":
+    main()
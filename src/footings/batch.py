@@ -0,0 +1,176 @@
+from typing import Mapping, Optional, Union
+
+from attr import fields_dict
+import numpy as np
+import pandas as pd
+
+from .exceptions import ModelRunError
+
+__all__ = ["run_batch", "validate_records"]
+
+
+def _split_value(value, n: int, key_frame: Optional[pd.DataFrame]):
+    """Split a columnar return into a list of n per record values.
+
+    Scalars (and other non columnar values) are repeated for each record.
+
+    :raises ModelRunError: If a columnar return cannot be split (i.e., it does not hold the key
+        columns and does not have one row per record).
+    """
+    if isinstance(value, pd.DataFrame):
+        if key_frame is not None and all(col in value.columns for col in key_frame):
+            keys = list(key_frame.columns)
+            groups = {
+                k if isinstance(k, tuple) else (k,): v.reset_index(drop=True)
+                for k, v in value.groupby(keys, sort=False)
+            }
+            empty = value.iloc[0:0].reset_index(drop=True)
+            return [
+                groups.get(tuple(row), empty)
+                for row in key_frame.itertuples(index=False, name=None)
+            ]
+        if len(value) == n:
+            return [value.iloc[i : (i + 1)].reset_index(drop=True) for i in range(n)]
+    elif isinstance(value, pd.Series):
+        if len(value) == n:
+            return list(value)
+    elif isinstance(value, np.ndarray) and value.ndim > 0:
+        if value.shape[0] == n:
+            return list(value)
+    else:
+        return [value] * n
+    msg = (
+        f"A columnar return of length [{len(value)}] cannot be split into [{n}] records. "
+    )
+    msg += "Pass the key columns held by the return as keys or set split=False."
+    raise ModelRunError(msg)
+
+
+def _flatten_validators(validator):
+    if validator is None:
+        return []
+    if isinstance(validator, (list, tuple)):
+        return [v for val in validator for v in _flatten_validators(val)]
+    inner = getattr(validator, "_validators", None)  # attrs and_ validator
+    if inner is not None:
+        return _flatten_validators(list(inner))
+    return [validator]
+
+
+def _validate_column(validator, inst, attribute, values: pd.Series):
+    """Run a validator once over a column of values."""
+    vectorized = getattr(validator, "_call_data_dictionary", None)
+    if vectorized is not None:
+        return vectorized(inst, attribute, values)
+    try:
+        uniques = values.drop_duplicates().tolist()
+    except TypeError:  # unhashable values
+        uniques = values.tolist()
+    for value in uniques:
+        validator(inst, attribute, value)
+
+
+def validate_records(model, records: Union[pd.DataFrame, Mapping]):
+    """Run the validators of the model parameters and sensitivities once over columns of records.
+
+    Validators with a vectorized form (e.g., the footings validators used with a DataDictionary)
+    are called once with the whole column. Other validators (e.g., attrs instance_of) are called
+    for each unique value in the column. Use before running many models with from_trusted.
+
+    :param model: The model class.
+    :param records: The records as a DataFrame or a mapping of column name to array-like.
+
+    :return: True if all validators pass.
+    :rtype: bool
+
+    :raises ModelRunError: Listing the columns that failed validation.
+    """
+    if isinstance(records, pd.DataFrame):
+        columns = {col: records[col] for col in records.columns}
+    else:
+        columns = {k: pd.Series(v) for k, v in records.items()}
+    attributes = fields_dict(model)
+    init_names = model.__model_parameters__ + model.__model_sensitivities__
+    msgs = []
+    for name, values in columns.items():
+        if name not in init_names:
+            continue
+        attribute = attributes[name]
+        for validator in _flatten_validators(attribute.validator):
+            try:
+                _validate_column(validator, model, attribute, values)
+            except Exception as e:
+                msgs.append(f"The column [{name}] failed validation - {str(e)}")
+    if len(msgs) > 0:
+        raise ModelRunError("\n" + "\n".join(msgs))
+    return True
+
+
+def run_batch(
+    model,
+    records: Union[pd.DataFrame, Mapping],
+    *,
+    constant_params: Optional[Mapping] = None,
+    keys: Optional[tuple] = None,
+    split: bool = True,
+):
+    """Run a model once over a batch of records where parameters are columns.
+
+    Instead of creating and running a model for each record, the parameters and sensitivities
+    are passed as columns (i.e., pandas Series or numpy arrays) spanning all records and the steps
+    are run once over the whole batch. All steps need to be marked as vectorizable by passing
+    metadata={"vectorize": True} to step. Models mixing vectorizable steps with steps that need to
+    run per record are not supported, run those with a ForeachJig instead.
+
+    Parameter converters and validators are not run as they are written for a single value (the
+    model is created with from_trusted), validate the records in bulk (e.g., with
+    validate_records or DataDictionary.validate) before running.
+
+    :param model: The model class.
+    :param records: The records as a DataFrame or a mapping of column name to array-like.
+    :param Optional[Mapping] constant_params: Parameters that are constant for all records.
+    :param Optional[tuple] keys: Columns in records identifying each record. Key columns that are
+        not parameters are not passed to the model. When splitting, DataFrame returns holding
+        the key columns are split by grouping on the keys. Other columnar returns need one row
+        per record.
+    :param bool split: If True (default), the returns are split back into a list holding the
+        output of each record (the same as calling run on a model for each record). If False,
+        the columnar returns are returned as is.
+
+    :return: A list of the output per record when split is True, otherwise the columnar output.
+
+    :raises ModelRunError: If a step is not vectorizable, a column is not a parameter or a
+        columnar return cannot be split per record.
+    """
+    if constant_params is None:
+        constant_params = {}
+    if keys is None:
+        keys = tuple()
+    if isinstance(records, pd.DataFrame):
+        columns = {col: records[col] for col in records.columns}
+    else:
+        columns = dict(records)
+
+    steps = [getattr(model, step) for step in model.__model_steps__]
+    missing = [step.name for step in steps if step.metadata.get("vectorize") is not True]
+    if len(missing) > 0:
+        msg = f"The following steps are not marked as vectorizable - {str(missing)}."
+        raise ModelRunError(msg)
+
+    init_names = model.__model_parameters__ + model.__model_sensitivities__
+    unknown = [col for col in columns if col not in init_names and col not in keys]
+    if len(unknown) > 0:
+        msg = f"The columns {str(unknown)} are not parameters or sensitivities of the model."
+        raise ModelRunError(msg)
+
+    params = {k: v for k, v in columns.items() if k in init_names}
+    output = model.from_trusted(**params, **constant_params).run()
+    if split is False:
+        return output
+
+    n = len(next(iter(columns.values()))) if len(columns) > 0 else 0
+    key_frame = pd.DataFrame({k: columns[k] for k in keys}) if len(keys) > 0 else None
+    if len(model.__model_returns__) == 1:
+        return _split_value(output, n, key_frame)
+    splits = [_split_value(value, n, key_frame) for value in output]
+    return list(zip(*splits))
@@ -0,0 +1,378 @@
+from collections import OrderedDict
+import hashlib
+import os
+import pathlib
+import pickle
+from threading import Lock, get_ident
+from types import ModuleType
+
+from typing import Optional
+
+from attr import attrs, attrib
+from attr.validators import instance_of, optional
+
+__all__ = ["LRUCache", "DiskCache", "CacheStats", "fingerprint", "shared_cache"]
+
+
+def fingerprint(*values):
+    """Create a fingerprint (i.e., a hex digest) of the pickled values.
+
+    :param values: The values to fingerprint.
+
+    :return: The fingerprint.
+    :rtype: str
+
+    :raises TypeError: If the values cannot be pickled.
+    """
+    try:
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError) as e:
+        raise TypeError(str(e))
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _code_identity(code):
+    """The parts of a code object defining its behavior (excludes file names and line numbers)."""
+    consts = tuple(
+        _code_identity(const) if hasattr(const, "co_code") else const
+        for const in code.co_consts
+    )
+    return (code.co_code, consts, code.co_names, code.co_varnames, code.co_freevars)
+
+
+def _global_names(code):
+    """The names a code object (and the code objects nested in it) may load as globals."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            names |= _global_names(const)
+    return names
+
+
+def _value_identity(value, seen: frozenset):
+    """The identity of a value a function closes over or reads as a global."""
+    if isinstance(value, ModuleType):
+        return value.__name__
+    if isinstance(value, type):
+        return (value.__module__, value.__qualname__)
+    if hasattr(value, "__code__"):
+        if id(value) in seen:  # a recursive function
+            return value.__qualname__
+        return _function_identity(value, seen)
+    return value  # fingerprinted by value (the same as the uses)
+
+
+def _function_identity(func, seen: frozenset = frozenset()):
+    """The parts of a function defining its behavior (code, defaults, the values it closes over
+    and the module globals it reads, with functions recursively replaced by their identity)."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    seen = seen | {id(func)}
+    closure = getattr(func, "__closure__", None) or ()
+    namespace = getattr(func, "__globals__", {})
+    return (
+        _code_identity(code),
+        getattr(func, "__defaults__", None),
+        getattr(func, "__kwdefaults__", None),
+        tuple(_value_identity(cell.cell_contents, seen) for cell in closure),
+        tuple(
+            (name, _value_identity(namespace[name], seen))
+            for name in sorted(_global_names(code))
+            if name in namespace
+        ),
+    )
+
+
+@attrs(slots=True, repr=False)
+class DiskCache:
+    """A cache storing pickled step results as files within a directory.
+
+    Entries are never evicted, clear the directory to free space. The keys created by
+    run_cached_step detect edits to the step, the functions it calls by name and the values it
+    closes over or reads as module globals, but not edits to code reached through a module or
+    class (e.g., ``tables.load(...)``). Change the version when such code changes so the stored
+    entries are not reused.
+
+    :param str directory: The directory to store results in (created if it does not exist).
+    :param Optional[str] version: An optional version salting the keys (entries are stored in a
+        subdirectory per version).
+    """
+
+    directory = attrib(type=pathlib.Path, converter=pathlib.Path)
+    version = attrib(
+        type=Optional[str],
+        default=None,
+        kw_only=True,
+        validator=optional(instance_of(str)),
+    )
+    _root = attrib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._root = self.directory
+        if self.version is not None:
+            self._root = self.directory / self.version
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str):
+        return self._root / f"{key}.pkl"
+
+    def get(self, key: str):
+        """Get the pickled value stored under key or None if the key is missing."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes):
+        """Store the pickled value under key."""
+        path = self._path(key)
+        # unique per thread so concurrent sets of the same key do not share the file
+        tmp = path.with_suffix(f".{os.getpid()}.{get_ident()}.tmp")
+        tmp.write_bytes(value)
+        tmp.replace(path)
+
+    def __repr__(self):
+        version = "" if self.version is None else f", version={self.version}"
+        return f"DiskCache(directory={str(self.directory)}{version})"
+
+    def to_audit_json(self):
+        return repr(self)
+
+    def to_audit_xlsx(self):
+        return repr(self)
+
+
+@attrs(frozen=True, slots=True)
+class CacheStats:
+    """The statistics of a LRUCache.
+
+    :param int hits: The number of gets that found a value.
+    :param int misses: The number of gets that did not find a value.
+    :param int evictions: The number of entries evicted to stay within the limits.
+    :param int entries: The number of entries held in memory.
+    :param int nbytes: The number of bytes held in memory.
+    """
+
+    hits = attrib(type=int)
+    misses = attrib(type=int)
+    evictions = attrib(type=int)
+    entries = attrib(type=int)
+    nbytes = attrib(type=int)
+
+    @property
+    def hit_rate(self):
+        """The share of gets that found a value."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+@attrs(slots=True, repr=False)
+class LRUCache:
+    """An in-memory least recently used cache of pickled step results with a byte budget.
+
+    :param int max_bytes: The maximum number of bytes to hold. When exceeded, the least recently
+        used entries are evicted. Values larger than max_bytes are not stored in memory.
+    :param Optional[int] max_entries: An optional maximum number of entries to hold. When
+        exceeded, the least recently used entries are evicted.
+    :param Optional[DiskCache] backing: An optional cache to check on a miss and to write every
+        value to (e.g., a DiskCache so results persist across processes).
+    :param Optional[str] name: The name of the cache when created with shared_cache.
+    """
+
+    max_bytes = attrib(type=int, validator=instance_of(int))
+    max_entries = attrib(
+        type=Optional[int],
+        default=None,
+        kw_only=True,
+        validator=optional(instance_of(int)),
+    )
+    backing = attrib(default=None, kw_only=True)
+    name = attrib(
+        type=Optional[str],
+        default=None,
+        kw_only=True,
+        validator=optional(instance_of(str)),
+    )
+    _entries = attrib(init=False, factory=OrderedDict)
+    _nbytes = attrib(init=False, default=0)
+    _hits = attrib(init=False, default=0)
+    _misses = attrib(init=False, default=0)
+    _evictions = attrib(init=False, default=0)
+    _lock = attrib(init=False, factory=Lock)
+
+    @property
+    def nbytes(self):
+        """The number of bytes held in memory."""
+        return self._nbytes
+
+    @property
+    def stats(self):
+        """The hit, miss and eviction statistics of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+            )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str):
+        """Get the pickled value stored under key or None if the key is missing."""
+        with self._lock:
+            value = self._entries.get(key, None)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+        if self.backing is not None:
+            value = self.backing.get(key)
+            if value is not None:
+                self._store(key, value)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: bytes):
+        """Store the pickled value under key."""
+        self._store(key, value)
+        if self.backing is not None:
+            self.backing.set(key, value)
+
+    def _store(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return None
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= len(old)
+            self._entries[key] = value
+            self._nbytes += len(value)
+            max_entries = self.max_entries
+            while self._nbytes > self.max_bytes or (
+                max_entries is not None and len(self._entries) > max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= len(evicted)
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all entries held in memory and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def __reduce__(self):
+        # entries are not shipped to other processes, a shared cache resolves to the cache with
+        # the same name in the process it is unpickled in
+        if self.name is not None:
+            return (
+                shared_cache,
+                (self.name, self.max_bytes, self.max_entries, self.backing),
+            )
+        return (
+            _new_lru_cache,
+            (self.max_bytes, self.max_entries, self.backing),
+        )
+
+    def __repr__(self):
+        name = "" if self.name is None else f"name={self.name}, "
+        return f"LRUCache({name}max_bytes={self.max_bytes}, backing={repr(self.backing)})"
+
+    def to_audit_json(self):
+        return repr(self)
+
+    def to_audit_xlsx(self):
+        return repr(self)
+
+
+def _new_lru_cache(max_bytes, max_entries, backing):
+    return LRUCache(max_bytes, max_entries=max_entries, backing=backing)
+
+
+_SHARED_CACHES = {}
+_SHARED_CACHES_LOCK = Lock()
+
+
+def shared_cache(
+    name: str,
+    max_bytes: int = 256 * 1024 ** 2,
+    max_entries: Optional[int] = None,
+    backing=None,
+):
+    """Get the process-wide LRUCache registered under name, creating it on first use.
+
+    All steps passing the same named cache share its entries. Entries are shared across model
+    instances of a class and, for steps with a "cache_key" in the step metadata, across model
+    classes whose steps have the same code, impacts and cache_key (see run_cached_step). When a
+    model is shipped to another process, the cache resolves to the cache with the same name in
+    that process so each worker builds its entries once.
+
+    :param str name: The name of the cache.
+    :param int max_bytes: The maximum number of bytes to hold (only used on creation).
+    :param Optional[int] max_entries: An optional maximum number of entries (only used on creation).
+    :param Optional[DiskCache] backing: An optional backing cache (only used on creation).
+
+    :return: The LRUCache.
+    :rtype: LRUCache
+    """
+    with _SHARED_CACHES_LOCK:
+        cache = _SHARED_CACHES.get(name, None)
+        if cache is None:
+            cache = _SHARED_CACHES[name] = LRUCache(
+                max_bytes, max_entries=max_entries, backing=backing, name=name
+            )
+        return cache
+
+
+def run_cached_step(model, step, cache):
+    """Run a step using the cache to restore the step impacts when the step uses are unchanged.
+
+    The cache key is a fingerprint of the model class, the step name, the step code (bytecode,
+    constants, names, defaults, closure values and the module globals it reads, see DiskCache
+    for the limits) and the values of the attributes the step uses. When the step metadata has
+    a "cache_key", the key is instead a fingerprint of the step code, the names of the impacts
+    and the names and values of the attributes listed (so the entries are shared by model
+    classes with the same step). If the uses, the values the step code reads or the impacts
+    cannot be pickled, the step is run without the cache.
+
+    :param model: The model instance.
+    :param step: The Step to run.
+    :param cache: An object with get(key) and set(key, value) methods (e.g., LRUCache).
+    """
+    cls = type(model)
+    cache_key = step.metadata.get("cache_key", None)
+    names = [impact.split(".")[1] for impact in step.impacts]
+    try:
+        code = _function_identity(step.method)
+        if cache_key is None:
+            uses = tuple(getattr(model, use.split(".")[1]) for use in step.uses)
+            key = fingerprint(cls.__module__, cls.__qualname__, step.name, code, uses)
+        else:
+            uses = tuple((name, getattr(model, name)) for name in cache_key)
+            key = fingerprint(code, tuple(names), uses)
+    except (TypeError, ValueError):  # ValueError for an empty closure cell
+        return step.method(model)
+
+    hit = cache.get(key)
+    if hit is not None:
+        for name, value in pickle.loads(hit).items():
+            setattr(model, name, value)
+        return None
+
+    ret = step.method(model)
+    impacts = {name: getattr(model, name) for name in names}
+    try:
+        value = pickle.dumps(impacts, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return ret
+    cache.set(key, value)
+    return ret
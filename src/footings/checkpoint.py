@@ -0,0 +1,122 @@
+import pathlib
+import pickle
+from typing import Optional
+
+from attr import attrs, attrib
+from attr.validators import instance_of, optional
+import pandas as pd
+
+from .cache import fingerprint
+from .exceptions import ModelRunError
+
+__all__ = ["Checkpoint"]
+
+
+def _parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _parameters_fingerprint(model):
+    names = model.__model_parameters__ + model.__model_sensitivities__
+    try:
+        return fingerprint(tuple((name, getattr(model, name)) for name in names))
+    except TypeError:
+        return None
+
+
+@attrs(frozen=True, slots=True)
+class Checkpoint:
+    """Persist the state of a model at step boundaries so a run can be resumed.
+
+    After each selected step, the intermediates and returns impacted by that step and all prior
+    steps are written to directory/<model name>/<step>. DataFrames are written to parquet when
+    pyarrow is installed and everything else is pickled. A fingerprint of the parameters and
+    sensitivities is stored with the state so it is only restored into a model with the same
+    inputs.
+
+    :param str directory: The directory to write checkpoints to.
+    :param Optional[tuple] steps: The steps to checkpoint after (default is all steps).
+    :param bool parquet: If True (default), write DataFrames to parquet when pyarrow is installed.
+    """
+
+    directory = attrib(type=pathlib.Path, converter=pathlib.Path)
+    steps = attrib(
+        type=Optional[tuple], default=None, validator=optional(instance_of(tuple))
+    )
+    parquet = attrib(type=bool, default=True, kw_only=True, validator=instance_of(bool))
+
+    def _path(self, model, step: str):
+        return self.directory / type(model).__qualname__ / step
+
+    def _impacted(self, model, step: str):
+        graph = model.__model_step_graph__
+        position = graph.steps.index(step)
+        impacts = set().union(
+            *[graph.impacts[prior] for prior in graph.steps[: (position + 1)]]
+        )
+        return [name.split(".")[1] for name in sorted(impacts)]
+
+    def selects(self, step: str):
+        """Test if the checkpoint is saved after step."""
+        return self.steps is None or step in self.steps
+
+    def save(self, model, step: str):
+        """Save the state of model after step.
+
+        :param model: The model instance.
+        :param str step: The step that just finished.
+        """
+        path = self._path(model, step)
+        path.mkdir(parents=True, exist_ok=True)
+        use_parquet = self.parquet and _parquet_available()
+        state, frames = {}, []
+        for name in self._impacted(model, step):
+            value = getattr(model, name)
+            if use_parquet and isinstance(value, pd.DataFrame):
+                try:
+                    value.to_parquet(path / f"{name}.parquet")
+                    frames.append(name)
+                    continue
+                except (ValueError, TypeError, ImportError):
+                    pass
+            state[name] = value
+        contents = {
+            "step": step,
+            "fingerprint": _parameters_fingerprint(model),
+            "state": state,
+            "frames": frames,
+        }
+        tmp = path / "state.pkl.tmp"
+        tmp.write_bytes(pickle.dumps(contents, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp.replace(path / "state.pkl")
+
+    def exists(self, model, step: str):
+        """Test if a checkpoint exists for model after step."""
+        return (self._path(model, step) / "state.pkl").exists()
+
+    def load(self, model, step: str):
+        """Restore the state of model saved after step.
+
+        :param model: The model instance.
+        :param str step: The step the state was saved after.
+
+        :raises ModelRunError: If the checkpoint is missing or was saved with different
+            parameters or sensitivities.
+        """
+        path = self._path(model, step)
+        if self.exists(model, step) is False:
+            msg = f"A checkpoint does not exist for step [{step}] under [{str(path)}]."
+            raise ModelRunError(msg)
+        contents = pickle.loads((path / "state.pkl").read_bytes())
+        if contents["fingerprint"] != _parameters_fingerprint(model):
+            msg = f"The checkpoint for step [{step}] was saved with different parameters "
+            msg += "or sensitivities than the model being resumed."
+            raise ModelRunError(msg)
+        for name, value in contents["state"].items():
+            setattr(model, name, value)
+        for name in contents["frames"]:
+            setattr(model, name, pd.read_parquet(path / f"{name}.parquet"))
@@ -1,11 +1,13 @@
 from enum import Enum
 from functools import partial
+import pathlib
 from typing import List, Mapping, Optional, Union
 
 from attr import attrs, attrib, make_class, evolve
 from attr.validators import instance_of, optional
 import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from .model import def_parameter
 from .exceptions import (
@@ -15,7 +17,7 @@ from .exceptions import (
 )
 
 
-__all__ = ["PandasDtype", "data_dictionary", "def_column"]
+__all__ = ["PandasDtype", "ValidationReport", "data_dictionary", "def_column"]
 
 
 class PandasDtype(Enum):
@@ -104,6 +106,67 @@ PANDAS_DTYPE_CONVERSION = {
 }
 
 
+# dtypes that readers cannot parse directly, they are read as objects and converted
+_READ_AFTER_CONVERSION = {
+    PandasDtype.DateTime: pd.to_datetime,
+    PandasDtype.Timedelta: pd.to_timedelta,
+    PandasDtype.Complex: lambda x: x.astype("complex128"),
+    PandasDtype.Complex64: lambda x: x.astype("complex64"),
+    PandasDtype.Complex128: lambda x: x.astype("complex128"),
+    PandasDtype.Complex256: lambda x: x.astype("complex256"),
+}
+
+
+# dtypes read as objects and parsed leniently when validating files so unparseable values
+# are reported as failing rows instead of failing the whole file
+_LENIENT_CONVERSION = {
+    PandasDtype.DateTime: partial(pd.to_datetime, errors="coerce"),
+    PandasDtype.Timedelta: partial(pd.to_timedelta, errors="coerce"),
+    **{
+        dtype: partial(pd.to_numeric, errors="coerce")
+        for dtype in PandasDtype
+        if dtype.name.startswith(("Float", "Int", "UInt"))
+    },
+}
+
+
+_INT_DTYPES = {
+    "int64": (["int8", "int16", "int32"], ["uint8", "uint16", "uint32"]),
+    "Int64": (["Int8", "Int16", "Int32"], ["UInt8", "UInt16", "UInt32"]),
+    "Int32": (["Int8", "Int16"], ["UInt8", "UInt16"]),
+    "Int16": (["Int8"], ["UInt8"]),
+}
+
+
+def _declared_dtype(column):
+    """Get the dtype declared for a column (object when no dtype is declared)."""
+    return "object" if column.dtype is None else column.dtype.value
+
+
+def _dtype_matches(declared: str, dtype):
+    """Test if dtype is the declared dtype or a form of it returned by read_csv and read_parquet
+    (an integer downcast from the declared dtype or a categorical of the declared dtype)."""
+    if dtype.name == declared:
+        return True
+    if isinstance(dtype, pd.CategoricalDtype):
+        return declared == "object" or _dtype_matches(declared, dtype.categories.dtype)
+    signed, unsigned = _INT_DTYPES.get(declared, ((), ()))
+    return dtype.name in signed or dtype.name in unsigned
+
+
+def _smallest_int_dtype(dtype, low, high):
+    """Get the smallest integer dtype holding low to high or None if dtype cannot be downcast."""
+    candidates = _INT_DTYPES.get(dtype.name, None)
+    if candidates is None:
+        return None
+    signed, unsigned = candidates
+    for candidate in unsigned if low >= 0 else signed:
+        info = np.iinfo(candidate.lower())
+        if info.min <= low and high <= info.max:
+            return candidate
+    return None
+
+
 def converter_pandas_dtype(x: Union[str, PandasDtype]):
     if x is None:
         return None
@@ -219,6 +282,114 @@ def def_column(
     )
 
 
+def _failure_mask(validator, inst, column, values: pd.Series):
+    """Get a boolean mask of the rows in values that fail validator.
+
+    Validators with a mask method are evaluated once over the column. Other validators are
+    called with the whole column and, only if that raises, called with each unique value to
+    find the failing rows (if no single value fails, all rows are marked as failing).
+    """
+    mask = getattr(validator, "mask", None)
+    if mask is not None:
+        return np.asarray(mask(values), dtype=bool)
+    try:
+        validator(inst=inst, attr=column, value=values)
+        return np.zeros(len(values), dtype=bool)
+    except:
+        pass
+    try:
+        uniques = pd.unique(values)
+    except TypeError:  # unhashable values
+        uniques = values.tolist()
+    failed = []
+    for value in uniques:
+        try:
+            validator(inst=None, attr=column, value=value)
+        except:
+            failed.append(value)
+    if len(failed) == 0:
+        return np.ones(len(values), dtype=bool)
+    return np.asarray(values.isin(failed), dtype=bool)
+
+
+@attrs(frozen=True, slots=True, repr=False)
+class ValidationReport:
+    """A report of validating a dataframe against a DataDictionary.
+
+    :param int rows: The number of rows validated.
+    :param np.ndarray mask: A boolean mask of the rows failing any validator.
+    :param dict column_failures: The number of rows failing any validator by column.
+    :param dict validator_failures: The number of rows failing by (column, validator).
+    :param tuple messages: The messages describing each failure (columns, types and validators).
+    """
+
+    rows = attrib(type=int)
+    mask = attrib(type=np.ndarray)
+    column_failures = attrib(type=dict)
+    validator_failures = attrib(type=dict)
+    messages = attrib(type=tuple)
+
+    @property
+    def valid(self):
+        """True if no failures are found."""
+        return len(self.messages) == 0
+
+    @property
+    def failing_rows(self):
+        """The positions of the rows failing any validator."""
+        return np.flatnonzero(self.mask)
+
+    def summary(self):
+        """Show the number of rows passing and failing by column as a DataFrame."""
+        records = [
+            {"column": col, "passed": self.rows - failed, "failed": failed}
+            for col, failed in self.column_failures.items()
+        ]
+        return pd.DataFrame.from_records(records, columns=["column", "passed", "failed"])
+
+    def split(self, dataframe: pd.DataFrame):
+        """Split the validated dataframe into the rows passing and the rows failing validators.
+
+        :param pd.DataFrame dataframe: The dataframe the report was created from.
+
+        :return: A tuple of (passing rows, failing rows).
+        """
+        return dataframe[~self.mask], dataframe[self.mask]
+
+    @classmethod
+    def concat(cls, reports):
+        """Combine the reports of consecutive chunks of rows into a single report.
+
+        Failure counts are summed, masks are concatenated and repeated messages are dropped.
+
+        :param reports: The reports in the order of the chunks.
+
+        :return: ValidationReport
+        """
+        reports = list(reports)
+        column_failures, validator_failures = {}, {}
+        for report in reports:
+            for k, v in report.column_failures.items():
+                column_failures[k] = column_failures.get(k, 0) + v
+            for k, v in report.validator_failures.items():
+                validator_failures[k] = validator_failures.get(k, 0) + v
+        messages = tuple(
+            dict.fromkeys(msg for report in reports for msg in report.messages)
+        )
+        masks = [report.mask for report in reports]
+        return cls(
+            rows=sum(report.rows for report in reports),
+            mask=np.concatenate(masks) if len(masks) > 0 else np.zeros(0, dtype=bool),
+            column_failures=column_failures,
+            validator_failures=validator_failures,
+            messages=messages,
+        )
+
+    def __repr__(self):
+        failed = int(self.mask.sum())
+        return f"ValidationReport(rows={self.rows}, failed_rows={failed}, valid={self.valid})"
+
+
 @attrs(frozen=True, slots=True, repr=False)
 class DataDictionary:
     """The parent class of a container that provides information on a tabular data structure."""
@@ -259,38 +430,454 @@ class DataDictionary:
                 results.append(True)
         return results, msgs
 
+    def _type_checks(self, dataframe: pd.DataFrame):
+        """Generate (column, dtype in dataframe, matches) for each typed column in dataframe.
+
+        Integers downcast from the declared dtype and categoricals of the declared dtype match.
+        """
+        for dd_col in self.list_columns():
+            df_col = dataframe.get(dd_col.name, None)
+            if df_col is None or dd_col.dtype is None:
+                continue
+            yield dd_col, df_col.dtype, _dtype_matches(dd_col.dtype.value, df_col.dtype)
+
+    @staticmethod
+    def _type_message(column, dtype):
+        msg = f"The column [{column.name}] in the DataDictionary has type [{column.dtype.value}] "
+        msg += f"which is different from type in the dataframe passed [{dtype.name}]."
+        return msg
+
     def _types_valid(self, dataframe: pd.DataFrame):
         """Test column types in dataframe."""
         results, msgs = [], []
-        for dd_col in self.list_columns():
-            df_col = dataframe.get(dd_col.name, None)
-            test_eq = dd_col.dtype.value == df_col.dtype.name
+        for col, dtype, test_eq in self._type_checks(dataframe):
             if test_eq is False:
-                msg = f"The column [{dd_col.name}] in the DataDictionary has type [{dd_col.dtype.value}] "
-                msg += f"which is different from type in the dataframe passed [{df_col.dtype.name}]."
-                msgs.append(msg)
+                msgs.append(self._type_message(col, dtype))
             results.append(test_eq)
 
         return results, msgs
 
+    def _validator_masks(self, dataframe: pd.DataFrame):
+        """Generate (column, validator, failure mask) for each validator of the columns in dataframe."""
+        for col in self.list_columns():
+            df_col = dataframe.get(col.name, None)
+            if df_col is None:
+                continue
+            for validator in col.validator:
+                yield col, validator, _failure_mask(validator, self, col, df_col)
+
     def _validators_valid(self, dataframe: pd.DataFrame):
         """Test validators for columns in dataframe."""
         results, msgs = [], []
-        for col in self.list_columns():
-            df_col = dataframe.get(col.name)
-            if len(col.validator) > 0:
-                for validator in col.validator:
-                    try:
-                        validator(inst=self, attr=col, value=df_col)
-                        results.append(True)
-                    except:
-                        results.append(False)
-                        msgs.append(
-                            f"The column [{col.name}] failed {str(validator)[1:-1]}."
-                        )
+        for col, validator, mask in self._validator_masks(dataframe):
+            results.append(not mask.any())
+            if results[-1] is False:
+                msgs.append(f"The column [{col.name}] failed {str(validator)[1:-1]}.")
 
         return results, msgs
 
+    def validation_report(
+        self, dataframe: pd.DataFrame, types: bool = True, validators: bool = True
+    ):
+        """Validate passed dataframe returning a report instead of raising an error.
+
+        Each validator is evaluated once over its column (validators with a mask method are
+        vectorized) to get the rows that fail so bad records can be split out.
+
+        :param pd.DataFrame dataframe: The dataframe to validate.
+        :param bool types: Test DataDictionary types against dataframe. Default is True.
+        :param bool validators: Test DataDictionary validators against dataframe. Default is True.
+
+        :return: The report of failures by column and validator with a row level failure mask.
+        :rtype: ValidationReport
+        """
+        return self._report(dataframe, types=types, validators=validators)
+
+    def _report(
+        self,
+        dataframe: pd.DataFrame,
+        types: bool = True,
+        validators: bool = True,
+        parse_failures: Optional[Mapping] = None,
+    ):
+        """Create a ValidationReport including the rows of columns that could not be parsed."""
+        if parse_failures is None:
+            parse_failures = {}
+        _, msgs = self._cols_valid(dataframe)
+        if types is True:
+            # columns that failed to parse are reported with their failing rows below
+            msgs.extend(
+                self._type_message(col, dtype)
+                for col, dtype, test_eq in self._type_checks(dataframe)
+                if test_eq is False and col.name not in parse_failures
+            )
+        rows = len(dataframe)
+        mask = np.zeros(rows, dtype=bool)
+        column_failures, validator_failures = {}, {}
+        column_masks = {}
+        for name, col_mask in parse_failures.items():
+            dtype = getattr(self, name).dtype.value
+            validator_failures[(name, f"type conversion to [{dtype}]")] = int(
+                col_mask.sum()
+            )
+            msgs.append(
+                f"The column [{name}] has values that cannot be converted to type [{dtype}]."
+            )
+            column_masks[name] = col_mask
+        if validators is True:
+            for col, validator, col_mask in self._validator_masks(dataframe):
+                if col.name in parse_failures:  # only reported as failing to convert
+                    col_mask = col_mask & ~parse_failures[col.name]
+                failed = int(col_mask.sum())
+                validator_failures[(col.name, str(validator)[1:-1])] = failed
+                if failed > 0:
+                    msgs.append(f"The column [{col.name}] failed {str(validator)[1:-1]}.")
+                prior = column_masks.get(col.name, None)
+                column_masks[col.name] = col_mask if prior is None else prior | col_mask
+        for name, col_mask in column_masks.items():
+            column_failures[name] = int(col_mask.sum())
+            mask |= col_mask
+        return ValidationReport(
+            rows=rows,
+            mask=mask,
+            column_failures=column_failures,
+            validator_failures=validator_failures,
+            messages=tuple(msgs),
+        )
+
+    def _reader_dtypes(self, lenient: bool = False):
+        """Get the dtypes to pass to a reader and the columns to convert after reading."""
+        dtypes, converters = {}, {}
+        for col in self.list_columns():
+            if col.dtype is None:
+                continue
+            if col.dtype in _READ_AFTER_CONVERSION or (
+                lenient is True and col.dtype in _LENIENT_CONVERSION
+            ):
+                dtypes[col.name] = "object"
+                converters[col.name] = col.dtype
+            else:
+                dtypes[col.name] = col.dtype.value
+        return dtypes, converters
+
+    def _coerce(self, dataframe: pd.DataFrame, skip: tuple = ()):
+        """Convert the columns of a chunk read from a file to the DataDictionary dtypes."""
+        for col in self.list_columns():
+            if col.dtype is None or col.name not in dataframe or col.name in skip:
+                continue
+            if dataframe[col.name].dtype.name == col.dtype.value:
+                continue
+            values = dataframe[col.name]
+            convert = _READ_AFTER_CONVERSION.get(col.dtype, None)
+            if convert is not None:
+                values = convert(values)
+            dataframe[col.name] = values.astype(col.dtype.value)
+        return dataframe
+
+    def _coerce_lenient(self, dataframe: pd.DataFrame):
+        """Convert the columns of a chunk to the DataDictionary dtypes where values can be parsed.
+
+        :return: A tuple of the chunk and a dict of column name to the mask of the rows that
+            could not be parsed (only columns with failures are included).
+        """
+        failures = {}
+        for col in self.list_columns():
+            if col.dtype not in _LENIENT_CONVERSION or col.name not in dataframe:
+                continue
+            values = dataframe[col.name]
+            try:
+                dataframe[col.name] = self._coerce(values.to_frame())[col.name]
+                continue
+            except (ValueError, TypeError, OverflowError):
+                pass
+            converted = _LENIENT_CONVERSION[col.dtype](values)
+            failed = converted.isna() & values.notna()
+            if col.dtype.value in ("int64", "float16"):  # cannot hold missing values
+                failed |= values.isna()
+            if col.dtype.name.startswith(("Int", "UInt")):
+                failed |= converted.notna() & (converted % 1 != 0)
+            converted = converted.where(~failed)
+            try:
+                converted = converted.astype(col.dtype.value)
+            except (ValueError, TypeError, OverflowError):
+                pass  # left with the parsed dtype (e.g., float64 when missing from an int64)
+            dataframe[col.name] = converted
+            failures[col.name] = np.asarray(failed, dtype=bool)
+        return dataframe, failures
+
+    @staticmethod
+    def _file_type(file: str, file_type: Optional[str]):
+        """Get the type of file (csv or parquet) based on the suffix when not passed."""
+        if file_type is None:
+            suffixes = pathlib.Path(file).suffixes
+            if ".csv" in suffixes:
+                file_type = "csv"
+            elif ".parquet" in suffixes or ".pq" in suffixes:
+                file_type = "parquet"
+        if file_type not in ("csv", "parquet"):
+            msg = f"The file [{str(file)}] is not a csv or parquet file."
+            raise ValueError(msg)
+        return file_type
+
+    def _file_chunks(
+        self, file: str, chunksize: int, file_type: str, lenient: bool, **kwargs,
+    ):
+        """Create an iterator reading a csv or parquet file in chunks (without converting)."""
+        if file_type == "csv":
+            dtypes, _ = self._reader_dtypes(lenient=lenient)
+            return pd.read_csv(file, dtype=dtypes, chunksize=chunksize, **kwargs)
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file)
+        names = parquet_file.schema_arrow.names
+        missing = [
+            name for name in kwargs.get("columns", None) or [] if name not in names
+        ]
+        if len(missing) > 0:  # pyarrow skips missing columns instead of raising
+            raise ValueError(f"The columns {str(missing)} are missing from the file.")
+        batches = parquet_file.iter_batches(batch_size=chunksize, **kwargs)
+        return (batch.to_pandas() for batch in batches)
+
+    def iter_file(
+        self,
+        file: str,
+        chunksize: int = 100_000,
+        file_type: Optional[str] = None,
+        **kwargs,
+    ):
+        """Read a csv or parquet file in chunks with the dtypes of the DataDictionary columns.
+
+        :param str file: The file to read (.csv, optionally compressed, or .parquet).
+        :param int chunksize: The number of rows per chunk.
+        :param Optional[str] file_type: Either csv or parquet (default is based on the suffix).
+        :param kwargs: Additional kwargs to pass to pandas.read_csv or ParquetFile.iter_batches.
+
+        :return: An iterator of DataFrames.
+
+        :raises DataDictionaryValidateError: If a chunk cannot be converted to the dtypes.
+        :raises ValueError: If the file type is not supported.
+        """
+        file_type = self._file_type(file, file_type)
+        try:
+            chunks = self._file_chunks(
+                file, chunksize, file_type, lenient=False, **kwargs
+            )
+            for chunk in chunks:
+                yield self._coerce(chunk)
+        except (ValueError, TypeError, OverflowError) as e:
+            msg = f"The file [{str(file)}] could not be read with the DataDictionary dtypes - {str(e)}"
+            raise DataDictionaryValidateError(msg)
+
+    def validate_file(
+        self,
+        file: str,
+        chunksize: int = 100_000,
+        file_type: Optional[str] = None,
+        types: bool = True,
+        validators: bool = True,
+        **kwargs,
+    ):
+        """Validate a csv or parquet file in chunks without holding the whole file in memory.
+
+        Each chunk is read with the dtypes of the DataDictionary columns and validated with
+        validation_report. The reports of the chunks are combined so the row positions of the
+        failure mask are positions within the file. Values of numeric, datetime and timedelta
+        columns that cannot be parsed to the column dtype are reported as failing rows (instead
+        of failing the file).
+
+        :param str file: The file to validate (.csv, optionally compressed, or .parquet).
+        :param int chunksize: The number of rows per chunk.
+        :param Optional[str] file_type: Either csv or parquet (default is based on the suffix).
+        :param bool types: Test DataDictionary types against the file. Default is True.
+        :param bool validators: Test DataDictionary validators against the file. Default is True.
+        :param kwargs: Additional kwargs to pass to pandas.read_csv or ParquetFile.iter_batches.
+
+        :return: The combined report of all chunks.
+        :rtype: ValidationReport
+
+        :raises DataDictionaryValidateError: If a chunk cannot be converted to the dtypes of
+            columns that are not parsed leniently (e.g., bool or complex).
+        :raises ValueError: If the file type is not supported.
+        """
+        reports = []
+        file_type = self._file_type(file, file_type)
+        try:
+            chunks = self._file_chunks(file, chunksize, file_type, lenient=True, **kwargs)
+            for chunk in chunks:
+                chunk, failures = self._coerce_lenient(chunk)
+                chunk = self._coerce(chunk, skip=tuple(failures))
+                report = self._report(chunk, types, validators, parse_failures=failures)
+                reports.append(report)
+        except (ValueError, TypeError, OverflowError) as e:
+            msg = f"The file [{str(file)}] could not be read with the DataDictionary dtypes - {str(e)}"
+            raise DataDictionaryValidateError(msg)
+        return ValidationReport.concat(reports)
+
+    def _downcast(self, dataframe: pd.DataFrame):
+        """Downcast integer columns to the smallest dtype holding the range of their validators."""
+        for col in self.list_columns():
+            if col.name not in dataframe:
+                continue
+            bounds = [getattr(v, "bounds", None) for v in col.validator]
+            bounds = [bound for bound in bounds if bound is not None]
+            if len(bounds) == 0:
+                continue
+            values = dataframe[col.name]
+            low = max(bound[0] for bound in bounds)
+            high = min(bound[1] for bound in bounds)
+            if len(values) > 0 and values.notna().any():
+                low, high = min(low, values.min()), max(high, values.max())
+            dtype = _smallest_int_dtype(values.dtype, low, high)
+            if dtype is not None:
+                dataframe[col.name] = values.astype(dtype)
+        return dataframe
+
+    def _read_columns(self, columns):
+        """Get the DataDictionary columns to read given the usecols or columns passed."""
+        if columns is None:
+            return list(self.columns)
+        if callable(columns):
+            return [name for name in self.columns if columns(name)]
+        unknown = [name for name in columns if name not in self.columns]
+        if len(unknown) > 0:
+            msg = f"The columns {str(unknown)} passed to read are not in the DataDictionary."
+            raise ValueError(msg)
+        return [name for name in self.columns if name in columns]
+
+    def _read(
+        self,
+        file: str,
+        file_type: str,
+        categorical: Union[bool, tuple],
+        max_category_ratio: float,
+        downcast: bool,
+        chunksize: int,
+        **kwargs,
+    ):
+        keyword = "usecols" if file_type == "csv" else "columns"
+        columns = self._read_columns(kwargs.pop(keyword, None))
+        if categorical is True:
+            categorical = tuple(
+                col.name
+                for col in self.list_columns()
+                if col.dtype in (PandasDtype.String, PandasDtype.Object)
+            )
+        elif categorical is False:
+            categorical = tuple()
+        categorical = tuple(name for name in categorical if name in columns)
+        kwargs[keyword] = columns
+        chunks = []
+        for chunk in self.iter_file(file, chunksize, file_type=file_type, **kwargs):
+            if downcast is True:
+                chunk = self._downcast(chunk)
+            for name in categorical:
+                chunk[name] = chunk[name].astype("category")
+            chunks.append(chunk)
+        if len(chunks) == 0:
+            dtypes = {name: _declared_dtype(getattr(self, name)) for name in columns}
+            return pd.DataFrame({k: pd.Series(dtype=v) for k, v in dtypes.items()})
+
+        # categoricals are combined separately so differing categories are not made objects
+        frame = pd.concat(
+            [chunk.drop(columns=list(categorical)) for chunk in chunks], ignore_index=True
+        )
+        for name in categorical:
+            values = pd.Series(
+                union_categoricals([chunk[name] for chunk in chunks]), name=name
+            )
+            if (
+                len(values) > 0
+                and len(values.cat.categories) / len(values) > max_category_ratio
+            ):
+                values = values.astype(_declared_dtype(getattr(self, name)))
+            frame[name] = values
+        return frame[[name for name in self.columns if name in frame]]
+
+    def read_csv(
+        self,
+        file: str,
+        *,
+        categorical: Union[bool, tuple] = False,
+        max_category_ratio: float = 0.5,
+        downcast: bool = True,
+        chunksize: int = 100_000,
+        **kwargs,
+    ):
+        """Read a csv file with the exact dtypes of the DataDictionary columns.
+
+        Only the DataDictionary columns are read (as usecols) with their declared dtypes so
+        nothing is inferred as object or float64. The file is read in chunks so the memory
+        needed is roughly the size of the returned DataFrame. Downcast and categorical columns
+        still pass the type test of validate.
+
+        :param str file: The file to read.
+        :param Union[bool, tuple] categorical: The string columns to read as categoricals. If
+            True, all string and object columns are candidates. Default is False.
+        :param float max_category_ratio: A categorical column is kept only when the number of
+            categories divided by the number of rows is at most this ratio (i.e., low cardinality).
+        :param bool downcast: If True (default), integer columns with range validators (e.g.,
+            in_range) are read with the smallest integer dtype holding the range.
+        :param int chunksize: The number of rows to read at a time.
+        :param kwargs: Additional kwargs to pass to pandas.read_csv (usecols may select a subset
+            of the DataDictionary columns).
+
+        :return: The DataFrame.
+        :rtype: pd.DataFrame
+
+        :raises DataDictionaryValidateError: If the file cannot be converted to the dtypes.
+        :raises ValueError: If usecols lists columns that are not in the DataDictionary.
+        """
+        return self._read(
+            file,
+            "csv",
+            categorical=categorical,
+            max_category_ratio=max_category_ratio,
+            downcast=downcast,
+            chunksize=chunksize,
+            **kwargs,
+        )
+
+    def read_parquet(
+        self,
+        file: str,
+        *,
+        categorical: Union[bool, tuple] = False,
+        max_category_ratio: float = 0.5,
+        downcast: bool = True,
+        chunksize: int = 100_000,
+        **kwargs,
+    ):
+        """Read a parquet file with the exact dtypes of the DataDictionary columns.
+
+        The same as read_csv for parquet files (requires pyarrow).
+
+        :param str file: The file to read.
+        :param Union[bool, tuple] categorical: The string columns to read as categoricals. If
+            True, all string and object columns are candidates. Default is False.
+        :param float max_category_ratio: A categorical column is kept only when the number of
+            categories divided by the number of rows is at most this ratio (i.e., low cardinality).
+        :param bool downcast: If True (default), integer columns with range validators (e.g.,
+            in_range) are read with the smallest integer dtype holding the range.
+        :param int chunksize: The number of rows to read at a time.
+        :param kwargs: Additional kwargs to pass to ParquetFile.iter_batches (columns may select
+            a subset of the DataDictionary columns).
+
+        :return: The DataFrame.
+        :rtype: pd.DataFrame
+
+        :raises DataDictionaryValidateError: If the file cannot be converted to the dtypes.
+        :raises ValueError: If columns lists columns that are not in the DataDictionary.
+        """
+        return self._read(
+            file,
+            "parquet",
+            categorical=categorical,
+            max_category_ratio=max_category_ratio,
+            downcast=downcast,
+            chunksize=chunksize,
+            **kwargs,
+        )
+
     def validate(
         self, dataframe: pd.DataFrame, types: bool = True, validators: bool = True
     ):
@@ -305,23 +892,13 @@ class DataDictionary:
 
         :raises DataDictionaryValidateError: If any of the following rules are broken -
             - All columns present in the data dictionary are in the dataframe and vice versa.
-            - If types is True, test the data types of the dataframe match the data dictionary.
+            - If types is True, test the data types of the dataframe match the data dictionary
+              (integers downcast from and categoricals of the declared dtype match).
             - If validators is True, test that any attached validator pass for a column.
         """
-        rets, msgs = self._cols_valid(dataframe)
-
-        def _update_ret_msg(fn, dataframe):
-            ret, msg = fn(dataframe)
-            rets.extend(ret)
-            msgs.extend(msg)
-
-        if types is True:
-            _update_ret_msg(self._types_valid, dataframe)
-        if validators is True:
-            _update_ret_msg(self._validators_valid, dataframe)
-
-        if not all(rets):
-            msg = "\n".join(msgs)
+        report = self.validation_report(dataframe, types=types, validators=validators)
+        if report.valid is False:
+            msg = "\n".join(report.messages)
             raise DataDictionaryValidateError("\n" + msg)
         return True
 
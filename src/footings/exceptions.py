@@ -45,6 +45,10 @@ class ModelCreationError(Exception):
     """Error occured when creating a footings model."""
 
 
+class StepConflictWarning(UserWarning):
+    """Steps of a footings model impact the same attribute without the later step using it."""
+
+
 class DataDictionaryValidatorsConversionError(Exception):
     """Error occured when converting validator to Column."""
 
@@ -1,11 +1,18 @@
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
 from inspect import signature, Signature, Parameter
+from itertools import islice
+from math import ceil
 from typing import Optional, Callable, Tuple, Dict, Iterable, Union
+import os
 import sys
+import threading
 
 from attr import attrs, attrib
 from attr.validators import instance_of, is_callable, optional
 
 from .exceptions import Error
+from .tracing import active_tracer
 
 __all__ = ["create_foreach_jig"]
 
@@ -22,6 +29,58 @@ def _get_key(keys: tuple, **kwargs):
     return iter_key if iter_key != tuple() else None
 
 
+_POOL = threading.local()
+
+
+def _pooled_model(model):
+    """Create a callable returning the instance of model kept for the current thread rebound
+    to the kwargs passed."""
+
+    def inner(**kwargs):
+        pool = getattr(_POOL, "models", None)
+        if pool is None:
+            pool = _POOL.models = {}
+        inst = pool.get(model, None)
+        if inst is None:
+            inst = pool[model] = model.from_trusted(**kwargs)
+            return inst
+        return inst.rebind(**kwargs)
+
+    return inner
+
+
+def _traced_run(tracer, create_model, model_kwargs: dict):
+    with tracer.span("WrappedModel.construct", "jig"):
+        model = create_model(**model_kwargs)
+    with tracer.span(f"{type(model).__qualname__}.run", "model"):
+        return model.run()
+
+
+def _chunk(iterator, chunk_size: int):
+    """Split an iterator into lists of (at most) chunk_size items."""
+    iterator = iter(iterator)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _run_chunk(model, entries: list, kwargs: dict):
+    """Call model for each entry in a chunk returning the list of results."""
+    return [model(**entry, **kwargs) for entry in entries]
+
+
+def _defer_chunk(func):
+    """Chunk wrapper deferring the running of a chunk to compute (e.g., to run on a worker
+    that already holds the model)."""
+
+    def inner(model, entries, kwargs):
+        return (entries, kwargs)
+
+    return inner
+
+
 def _make_mapping_signature(iterator_keys: tuple):
     params = [Parameter(name=key, kind=Parameter.KEYWORD_ONLY) for key in iterator_keys]
     params.append(Parameter(name="kwargs", kind=Parameter.VAR_KEYWORD))
@@ -46,6 +105,11 @@ class WrappedModel:
     :param Optional[Tuple] pass_iterator_keys: The iterator keys to pass into the model.
     :param Optional[Callable] parallel_wrap: An optional wrapper to make the model parallel (e.g., dask.delayed).
     :param  Optional[Dict] parallel_kwargs: Optional kwargs to pass to parallel_wrap.
+    :param bool trusted: If True, the model is created with from_trusted which skips converters
+        and validators (validate the records in bulk beforehand).
+    :param bool pooled: If True, each thread (or worker process) keeps one instance of the model
+        that is rebound to each record with Model.rebind instead of creating a new model. Like
+        trusted, converters and validators are not run.
 
     :return: The output of the wrapped model when calling model.run() when no
         errors occur. If an error occurs during instantiation or running the model
@@ -69,19 +133,35 @@ class WrappedModel:
         kw_only=True,
         validator=optional(instance_of(dict)),
     )
+    trusted = attrib(type=bool, default=False, kw_only=True, validator=instance_of(bool))
+    pooled = attrib(type=bool, default=False, kw_only=True, validator=instance_of(bool))
     wrapped_model = attrib(default=None, init=False, repr=False)
 
     def __attrs_post_init__(self):
         object.__setattr__(self, "__signature__", signature(self.model))
 
+    def model_factory(self):
+        """Get the callable used to create the model (depending on trusted and pooled)."""
+        if self.pooled is True:
+            return _pooled_model(self.model)
+        if self.trusted is True:
+            return self.model.from_trusted
+        return self.model
+
     def create_wrapped_model(self):
+        create_model = self.model_factory()
+
         def wrapper(**kwargs):
             try:
                 excluded_keys = _exclude_iterator_keys(
                     self.iterator_keys, self.pass_iterator_keys
                 )
                 model_kwargs = {k: v for k, v in kwargs.items() if k not in excluded_keys}
-                ret = self.model(**model_kwargs).run()
+                tracer = active_tracer()
+                if tracer is None:
+                    ret = create_model(**model_kwargs).run()
+                else:
+                    ret = _traced_run(tracer, create_model, model_kwargs)
             except:
                 ex_type, ex_value, ex_trace = sys.exc_info()
                 key = ({k: kwargs[k] for k in self.iterator_keys},)
@@ -128,6 +208,8 @@ class MappedModel:
         pass_iterator_keys: Optional[Tuple] = None,
         parallel_wrap: Optional[Callable] = None,
         parallel_kwargs: Optional[Dict] = None,
+        trusted: bool = False,
+        pooled: bool = False,
     ):
         """Create a MappedModel.
 
@@ -142,6 +224,8 @@ class MappedModel:
             (passed to model_wrapper).
         :param  Optional[Dict] parallel_kwargs: Optional kwargs to pass to parallel_wrap.
             (passed to model_wrapper).
+        :param bool trusted: If True, models are created with from_trusted (passed to model_wrapper).
+        :param bool pooled: If True, model instances are reused with rebind (passed to model_wrapper).
 
         :return: WrappedModel
         """
@@ -150,6 +234,8 @@ class MappedModel:
             "pass_iterator_keys": pass_iterator_keys,
             "parallel_wrap": parallel_wrap,
             "parallel_kwargs": parallel_kwargs,
+            "trusted": trusted,
+            "pooled": pooled,
         }
         mapping = {k: model_wrapper(v, **kws) for k, v in mapping.items()}
         sig = _make_mapping_signature(iterator_keys)
@@ -197,6 +283,15 @@ class ForeachJig:
         return on the modeled objects. This is to be paired with parallel tools such as
         dask.compute or ray.get.
     :param Optional[Dict] compute_kwargs: Optional kwargs to pass into compute.
+    :param Optional[int] chunk_size: If set, the items are split into chunks of chunk_size
+        and the model is called for each item of a chunk within a single task.
+    :param Optional[int] partitions: If set, the items are split into this number of chunks
+        (an alternative to chunk_size).
+    :param Optional[Callable] chunk_wrap: An optional wrapper to make the running of a chunk
+        parallel (e.g., dask.delayed).
+    :param Optional[Callable] broadcast: An optional function called once per call with the
+        constant params returning the params to pass to the models (e.g., handles to data
+        shipped once to each worker instead of with each task).
     """
 
     model = attrib(
@@ -209,6 +304,38 @@ class ForeachJig:
     error_wrap = attrib(type=Optional[Callable], validator=optional(is_callable()))
     compute = attrib(type=Optional[Callable], validator=optional(is_callable()))
     compute_kwargs = attrib(type=Optional[Dict], validator=instance_of(dict))
+    chunk_size = attrib(
+        type=Optional[int],
+        default=None,
+        kw_only=True,
+        validator=optional(instance_of(int)),
+    )
+    partitions = attrib(
+        type=Optional[int],
+        default=None,
+        kw_only=True,
+        validator=optional(instance_of(int)),
+    )
+    chunk_wrap = attrib(
+        type=Optional[Callable],
+        default=None,
+        kw_only=True,
+        validator=optional(is_callable()),
+    )
+    broadcast = attrib(
+        type=Optional[Callable],
+        default=None,
+        kw_only=True,
+        validator=optional(is_callable()),
+    )
+
+    def __attrs_post_init__(self):
+        if self.chunk_size is not None and self.partitions is not None:
+            raise ValueError("Only one of chunk_size and partitions can be set.")
+        for name in ["chunk_size", "partitions"]:
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"The {name} must be greater than 0.")
 
     @classmethod
     def create(
@@ -220,6 +347,10 @@ class ForeachJig:
         error_wrap: Optional[Callable] = None,
         compute: Optional[Callable] = None,
         compute_kwargs: Optional[Dict] = None,
+        chunk_size: Optional[int] = None,
+        partitions: Optional[int] = None,
+        chunk_wrap: Optional[Callable] = None,
+        broadcast: Optional[Callable] = None,
     ):
         """A model runs a WrappedModel or MappedModels for each item in an iterator.
 
@@ -239,6 +370,15 @@ class ForeachJig:
             return on the modeled objects. This is to be paired with parallel tools such as
             dask.compute or ray.get.
         :param Optional[Dict] compute_kwargs: Optional kwargs to pass into compute.
+        :param Optional[int] chunk_size: If set, the items are split into chunks of chunk_size
+            and the model is called for each item of a chunk within a single task.
+        :param Optional[int] partitions: If set, the items are split into this number of chunks
+            (an alternative to chunk_size).
+        :param Optional[Callable] chunk_wrap: An optional wrapper to make the running of a chunk
+            parallel (e.g., dask.delayed).
+        :param Optional[Callable] broadcast: An optional function called once per call with the
+            constant params returning the params to pass to the models (e.g., handles to data
+            shipped once to each worker instead of with each task).
         """
 
         if constant_params is None:
@@ -256,8 +396,38 @@ class ForeachJig:
             error_wrap=error_wrap,
             compute=compute,
             compute_kwargs=compute_kwargs,
+            chunk_size=chunk_size,
+            partitions=partitions,
+            chunk_wrap=chunk_wrap,
+            broadcast=broadcast,
         )
 
+    @property
+    def chunked(self):
+        """Test if the items are run in chunks."""
+        return self.chunk_size is not None or self.partitions is not None
+
+    def _chunks(self, iterator):
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            if not hasattr(iterator, "__len__"):
+                iterator = list(iterator)
+            chunk_size = max(ceil(len(iterator) / self.partitions), 1)
+        return _chunk(iterator, chunk_size)
+
+    def _dispatch(self, iterator, kwargs):
+        if self.chunked is False:
+            return [self.model(**entry, **kwargs) for entry in iterator]
+        run_chunk = _run_chunk if self.chunk_wrap is None else self.chunk_wrap(_run_chunk)
+        return [run_chunk(self.model, chunk, kwargs) for chunk in self._chunks(iterator)]
+
+    def _compute(self, output):
+        if self.compute is not None:
+            output = self.compute(output, **self.compute_kwargs)
+        if self.chunked is True:
+            output = [result for chunk in output for result in chunk]
+        return output
+
     def __call__(self, **kwargs):
         """Calls the underlying WrappedModel or MappedModel for each item in the named iterator.
 
@@ -267,9 +437,86 @@ class ForeachJig:
         iterator = kwargs.pop(self.iterator_name)
         if not isinstance(iterator, Iterable):
             raise TypeError("The specified iterator object is not an iterator.")
-        output = [self.model(**entry, **kwargs) for entry in iterator]
-        if self.compute is not None:
-            output = self.compute(output, **self.compute_kwargs)
+        if self.broadcast is not None:
+            kwargs = self.broadcast(kwargs)
+        tracer = active_tracer()
+        if tracer is not None:
+            return self._traced_call(tracer, iterator, kwargs)
+        output = self._compute(self._dispatch(iterator, kwargs))
+        return self._partition(output)
+
+    def _run_batch(self, batch: list, kwargs: dict):
+        return self._partition(self._compute(self._dispatch(batch, kwargs)))
+
+    def stream(
+        self,
+        *,
+        batch_size: int = 1,
+        max_in_flight: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        ordered: bool = False,
+        **kwargs,
+    ):
+        """Lazily run the underlying models over the named iterator yielding results in batches.
+
+        The iterator is consumed batch_size items at a time and each batch is run, computed (when
+        using a parallel tool) and split into successes and errors with success_wrap and
+        error_wrap applied to the batch. Only the batches in flight are held in memory so a
+        generator of items can be streamed to a writer as results become available.
+
+        :param int batch_size: The number of items in each batch (default 1).
+        :param Optional[int] max_in_flight: The maximum number of batches submitted to executor
+            that have not been yielded (default twice the number of CPUs). Once reached, no more
+            items are read from the iterator until a batch is yielded.
+        :param Optional[Executor] executor: An optional executor to run batches on. If None, each
+            batch is run in the calling thread as it is requested.
+        :param bool ordered: If True, batches are yielded in the order of the iterator. Otherwise,
+            batches are yielded as they finish (only applicable with an executor).
+        :param kwargs: The iterator and constant parameters (the same as when calling the jig).
+
+        :return: A generator of tuples where the first item are the successes of a batch and the
+            second item are the errors of a batch.
+        """
+        if batch_size < 1:
+            raise ValueError("The batch_size must be greater than 0.")
+        iterator = kwargs.pop(self.iterator_name)
+        if not isinstance(iterator, Iterable):
+            raise TypeError("The specified iterator object is not an iterator.")
+        if self.broadcast is not None:
+            kwargs = self.broadcast(kwargs)
+        batches = _chunk(iterator, batch_size)
+        if executor is None:
+            for batch in batches:
+                yield self._run_batch(batch, kwargs)
+            return
+
+        if max_in_flight is None:
+            max_in_flight = 2 * (os.cpu_count() or 1)
+        if max_in_flight < 1:
+            raise ValueError("The max_in_flight must be greater than 0.")
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(self._run_batch, batch, kwargs))
+                while len(pending) >= max_in_flight:
+                    yield from self._finished(pending, ordered)
+            while len(pending) > 0:
+                yield from self._finished(pending, ordered)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _finished(pending: deque, ordered: bool):
+        if ordered is True:
+            yield pending.popleft().result()
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in [future for future in pending if future in done]:
+            pending.remove(future)
+            yield future.result()
+
+    def _partition(self, output):
         successes, errors = [], []
         for result in output:
             (errors if isinstance(result, Error) else successes).append(result)
@@ -279,6 +526,17 @@ class ForeachJig:
             errors = self.error_wrap(errors)
         return (successes, errors)
 
+    def _traced_call(self, tracer, iterator, kwargs):
+        with tracer.span("ForeachJig.dispatch", "jig"):
+            output = self._dispatch(iterator, kwargs)
+        if self.compute is not None:
+            with tracer.span("ForeachJig.compute", "jig"):
+                output = self._compute(output)
+        else:
+            output = self._compute(output)
+        with tracer.span("ForeachJig.partition", "jig", {"items": len(output)}):
+            return self._partition(output)
+
 
 def create_foreach_jig(
     model,
@@ -290,6 +548,8 @@ def create_foreach_jig(
     pass_iterator_keys: Optional[Tuple] = None,
     success_wrap: Optional[Callable] = None,
     error_wrap: Optional[Callable] = None,
+    trusted: bool = False,
+    pooled: bool = False,
 ):
     """Create a ForeachJig that runs a WrappedModel or MappedModels for each item in an iterator.
 
@@ -310,19 +570,39 @@ def create_foreach_jig(
         return on the modeled objects. This is to be paired with parallel tools such as
         dask.compute or ray.get.
     :param Optional[Dict] compute_kwargs: Optional kwargs to pass into compute.
+    :param bool trusted: If True, models are created with from_trusted which skips converters and
+        validators for each item (validate the items in bulk beforehand, e.g., with
+        footings.batch.validate_records).
+    :param bool pooled: If True, each thread keeps one instance of a model that is rebound to
+        each item with Model.rebind instead of creating a model per item (implies trusted).
 
     :return: ForeachJig (with updated signature)
     """
+    if pass_iterator_keys is None:
+        pass_iterator_keys = tuple()
+
     if isinstance(model, dict):
+        if mapped_keys is None:
+            msg = (
+                "When passing a dict of models, the keys used must be set in mapped_keys."
+            )
+            raise ValueError(msg)
         model = MappedModel.create(
             model,
+            model_wrapper=WrappedModel,
             iterator_keys=iterator_keys,
             mapped_keys=mapped_keys,
             pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
         )
     else:
         model = WrappedModel(
-            model, iterator_keys=iterator_keys, pass_iterator_keys=pass_iterator_keys
+            model,
+            iterator_keys=iterator_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
         )
 
     return ForeachJig.create(
@@ -1,18 +1,27 @@
+import asyncio
+from collections import Counter
+from copy import copy
 from enum import Enum, auto
 from functools import partial
+import inspect
+from operator import attrgetter
 import sys
+from threading import Lock
 from traceback import extract_tb, format_list
 from typing import Any, List, Optional
+import warnings
 
-from attr import attrs, attrib, make_class, evolve, NOTHING
+from attr import attrs, attrib, fields, fields_dict, make_class, evolve, Factory, NOTHING
 from attr.setters import NO_OP
 from attr._make import _CountingAttr
 from attr.setters import frozen
-import numpydoc.docscrape as numpydoc
 
 from .audit import run_model_audit
-from .doc_tools.docscrape import FootingsDoc
-from .exceptions import ModelCreationError, ModelRunError
+from .cache import run_cached_step
+from .exceptions import ModelCreationError, ModelRunError, StepConflictWarning
+from .profiling import ProfileReport, active_profiler
+from .tracing import active_tracer
+from .scheduler import StepGraph, run_steps_async, run_steps_concurrently
 from .visualize import visualize_model
 
 
@@ -28,6 +37,15 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    # FootingsDoc is imported lazily so numpydoc is not imported with footings.model
+    if name == "FootingsDoc":
+        from .doc_tools.docscrape import FootingsDoc
+
+        return FootingsDoc
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class ModelAttributeType(Enum):
     """Allowed dodel attribute types belonging to a model."""
 
@@ -227,7 +245,226 @@ def def_return(
     )
 
 
-def _run(self, to_step):
+def _step_error(step):
+    exc_type, exc_value, exc_trace = sys.exc_info()
+    msg = f"At step [{step}], an error occured.\n"
+    msg += f"  Error Type = {exc_type.__name__}\n"
+    msg += f"  Error Message = {exc_value}\n"
+    msg += f"  Error Trace = {format_list(extract_tb(exc_trace))}\n"
+    return ModelRunError(msg)
+
+
+def _run_step(model, step):
+    try:
+        cache = getattr(type(model), step).metadata.get("cache", None)
+        if cache is not None:
+            return run_cached_step(model, getattr(type(model), step), cache)
+        return getattr(model, step)()
+    except:
+        raise _step_error(step)
+
+
+@attrs(frozen=True, slots=True)
+class RunPlan:
+    """A plan to run all the steps of a model that is compiled once per model class.
+
+    The plan holds the step functions and a return extractor so running a model does not need to
+    look up steps, create bound methods or check the model for steps and returns on every run.
+
+    :param tuple steps: A tuple of (name, function, Step or None) for each step where the Step
+        is only included when the step is cached.
+    :param callable get_returns: A callable that takes the model and returns the returns.
+    :param Optional[str] error: An error message to raise when the model cannot be run.
+    """
+
+    steps = attrib(type=tuple)
+    get_returns = attrib(type=callable)
+    error = attrib(type=Optional[str], default=None)
+
+    @classmethod
+    def create(cls, model_cls: type):
+        """Create a RunPlan.
+
+        :param type model_cls: The model class.
+
+        :return: RunPlan
+        """
+        error = None
+        if len(model_cls.__model_steps__) == 0:
+            error = "Not able to run model because no steps are registered."
+        elif len(model_cls.__model_returns__) == 0:
+            error = "Not able to run model because no return attributes are registered."
+        steps = []
+        for name in model_cls.__model_steps__:
+            step = getattr(model_cls, name)
+            cached = step if step.metadata.get("cache", None) is not None else None
+            # async steps are called through the Step which runs them on a new event loop
+            steps.append((name, step if step.is_async else step.method, cached))
+        returns = model_cls.__model_returns__
+        get_returns = attrgetter(*returns) if len(returns) > 0 else None
+        return cls(steps=tuple(steps), get_returns=get_returns, error=error)
+
+    def __call__(self, model):
+        if self.error is not None:
+            raise ModelRunError(self.error)
+        _set_run_complete(model, False)
+        for name, method, cached in self.steps:
+            try:
+                if cached is None:
+                    method(model)
+                else:
+                    run_cached_step(model, cached, cached.metadata["cache"])
+            except:
+                raise _step_error(name)
+        _set_run_complete(model, True)
+        return self.get_returns(model)
+
+
+def _set_run_complete(model, complete: bool):
+    """Record if the model holds the state of a full run (assigned without the frozen check)."""
+    object.__setattr__(model, "__model_run_complete__", complete)
+
+
+def _make_trusted_function(model_cls: type, name: str, create: bool):
+    """Generate a function assigning the passed values and defaults to a model instance.
+
+    The function is generated (the same as attrs generates __init__) so the keyword arguments
+    are checked by python and each attribute is assigned without any lookups at run time.
+    Passed values are trusted, but defaults are run through their converter (the same as
+    __init__) with plain defaults converted once when the function is generated.
+    """
+    args, lines = [], []
+    namespace = {
+        "_NOTHING": NOTHING,
+        "_new": object.__new__,
+        "_get": object.__setattr__.__get__,
+    }
+    for attribute in fields(model_cls):
+        attr_name, default = attribute.name, attribute.default
+        if attribute.init is False and default is NOTHING:
+            continue
+        converter = attribute.converter
+        if converter is not None:
+            namespace[f"_convert_{attr_name}"] = converter
+        if isinstance(default, Factory):
+            namespace[f"_factory_{attr_name}"] = default.factory
+            value = f"_factory_{attr_name}({'_inst' if default.takes_self else ''})"
+            if converter is not None:
+                value = f"_convert_{attr_name}({value})"
+            if attribute.init is True:
+                args.append(f"{attr_name}=_NOTHING")
+                lines.append(f"if {attr_name} is _NOTHING:")
+                lines.append(f"    {attr_name} = {value}")
+                value = attr_name
+        elif default is NOTHING:
+            args.append(attr_name)
+            value = attr_name
+        else:
+            value = f"_default_{attr_name}"
+            if converter is not None:
+                try:
+                    default = converter(default)
+                except Exception:
+                    # raise when the default is used (the same as __init__), not here
+                    value = f"_convert_{attr_name}({value})"
+            namespace[f"_default_{attr_name}"] = default
+            if attribute.init is True:
+                if value == f"_default_{attr_name}":
+                    args.append(f"{attr_name}={value}")
+                else:
+                    args.append(f"{attr_name}=_NOTHING")
+                    lines.append(f"if {attr_name} is _NOTHING:")
+                    lines.append(f"    {attr_name} = {value}")
+                value = attr_name
+        lines.append(f"_setattr('{attr_name}', {value})")
+    if hasattr(model_cls, "__attrs_post_init__"):
+        lines.append("_inst.__attrs_post_init__()")
+
+    first = "_cls" if create is True else "_inst"
+    signature = ", ".join([first] + (["*"] + args if len(args) > 0 else []))
+    body = ["_inst = _new(_cls)"] if create is True else []
+    body += ["_setattr = _get(_inst)"] + lines + ["return _inst"]
+    source = f"def {name}({signature}):\n" + "\n".join("    " + line for line in body)
+    exec(
+        compile(source, f"<footings {name} {model_cls.__qualname__}>", "exec"), namespace
+    )
+    return namespace[name]
+
+
+def _set_trusted_functions(model_cls: type):
+    """Replace from_trusted and rebind on the model class with functions generated for it."""
+    from_trusted = _make_trusted_function(model_cls, "from_trusted", create=True)
+    from_trusted.__doc__ = Model.from_trusted.__doc__
+    model_cls.from_trusted = classmethod(from_trusted)
+    rebind = _make_trusted_function(model_cls, "rebind", create=False)
+    rebind.__doc__ = Model.rebind.__doc__
+    model_cls.rebind = rebind
+
+
+def _initial_value(self, name):
+    default = fields_dict(type(self))[name].default
+    if isinstance(default, Factory):
+        return default.factory(self) if default.takes_self else default.factory()
+    return default
+
+
+def _releasing_run_step(self, steps):
+    """Create a run_step that resets intermediates to their initial value after their last use."""
+    graph = self.__model_step_graph__
+    attribute_map = self.__model_attribute_map__
+    intermediates = {attribute_map[name]: name for name in self.__model_intermediates__}
+    counts = Counter(
+        attribute
+        for step in steps
+        for attribute in graph.uses[step] | graph.impacts[step]
+        if attribute in intermediates
+    )
+    lock = Lock()
+
+    def run_step(step):
+        _run_step(self, step)
+        with lock:
+            for attribute in graph.uses[step] | graph.impacts[step]:
+                if attribute not in counts:
+                    continue
+                counts[attribute] -= 1
+                if counts[attribute] == 0:
+                    name = intermediates[attribute]
+                    setattr(self, name, _initial_value(self, name))
+
+    return run_step
+
+
+def _checkpointing_run_step(self, run_step, checkpoint):
+    def inner(step):
+        run_step(step)
+        if checkpoint.selects(step):
+            checkpoint.save(self, step)
+
+    return inner
+
+
+def _instrument(self, run_step, profile=None):
+    """Wrap run_step to measure each step when profiling and/or tracing are active."""
+    if profile is None:
+        profile = active_profiler()
+    elif not isinstance(profile, ProfileReport):
+        msg = (
+            "The profile passed to run must be a footings.profiling.ProfileReport (e.g., "
+        )
+        msg += "profile=ProfileReport()) so the measurements can be retrieved, not "
+        msg += f"[{type(profile).__name__}]. Use the profile context manager to profile a block."
+        raise TypeError(msg)
+    if profile is not None:
+        run_step = profile.wrap(self, run_step)
+    tracer = active_tracer()
+    if tracer is not None:
+        run_step = tracer.wrap(self, run_step)
+    return run_step
+
+
+def _select_steps(self, to_step, returns, checkpoint=None, from_step=None):
+    """Get the steps to run and the normalized returns for the run options."""
     if len(self.__model_steps__) == 0:
         raise ModelRunError("Not able to run model because no steps are registered.")
     if len(self.__model_returns__) == 0:
@@ -244,27 +481,159 @@ def _run(self, to_step):
             msg = f"The step passed to to_step '{to_step}' does not exist as a step."
             raise e(msg)
 
-    def _run_step(step):
-        try:
-            return getattr(self, step)()
-        except:
-            exc_type, exc_value, exc_trace = sys.exc_info()
-            msg = f"At step [{step}], an error occured.\n"
-            msg += f"  Error Type = {exc_type.__name__}\n"
-            msg += f"  Error Message = {exc_value}\n"
-            msg += f"  Error Trace = {format_list(extract_tb(exc_trace))}\n"
+    if from_step is not None:
+        if from_step not in self.__model_steps__:
+            msg = f"The step passed to from_step '{from_step}' does not exist as a step."
+            raise ModelRunError(msg)
+        position = self.__model_steps__.index(from_step)
+        if position > 0:
+            checkpoint.load(self, self.__model_steps__[position - 1])
+        steps = tuple(step for step in steps if step in self.__model_steps__[position:])
+
+    graph = self.__model_step_graph__
+    if returns is not None:
+        if isinstance(returns, str):
+            returns = (returns,)
+        unknown = [ret for ret in returns if ret not in self.__model_returns__]
+        if len(unknown) > 0:
+            msg = f"The returns {str(unknown)} are not return attributes of the model."
             raise ModelRunError(msg)
+        attribute_map = self.__model_attribute_map__
+        steps = graph.required(tuple(attribute_map[ret] for ret in returns), steps)
+    return steps, returns
 
-    for step in steps:
-        _run_step(step)
 
+def _output(self, to_step, returns):
     if to_step is not None:
         return self
+    if returns is not None:
+        if len(returns) > 1:
+            return tuple(getattr(self, ret) for ret in returns)
+        return getattr(self, returns[0])
+    return _get_returns(self)
+
+
+def _run(
+    self,
+    to_step,
+    executor=None,
+    returns=None,
+    release_intermediates=False,
+    checkpoint=None,
+    from_step=None,
+    profile=None,
+):
+    steps, returns = _select_steps(self, to_step, returns, checkpoint, from_step)
+    graph = self.__model_step_graph__
+    _set_run_complete(self, False)
+    if release_intermediates is True:
+        if to_step is not None:
+            msg = "Not able to release intermediates when to_step is passed."
+            raise ModelRunError(msg)
+        run_step = _releasing_run_step(self, steps)
+    else:
+        run_step = partial(_run_step, self)
+
+    if checkpoint is not None:
+        if executor is not None:
+            msg = "Not able to checkpoint a model run with an executor."
+            raise ModelRunError(msg)
+        run_step = _checkpointing_run_step(self, run_step, checkpoint)
+
+    run_step = _instrument(self, run_step, profile)
+
+    if executor is None:
+        for step in steps:
+            run_step(step)
+    else:
+        run_steps_concurrently(steps, graph, run_step, executor)
+
+    if to_step is None and returns is None and release_intermediates is False:
+        _set_run_complete(self, True)
+    return _output(self, to_step, returns)
+
+
+async def _arun_step(model, step, executor):
+    obj = getattr(type(model), step)
+    if obj.is_async is False:
+        if executor is None:
+            return _run_step(model, step)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _run_step, model, step)
+    try:
+        return await obj.method(model)
+    except Exception:
+        raise _step_error(step)
+
+
+async def _arun(self, to_step, returns=None, executor=None):
+    steps, returns = _select_steps(self, to_step, returns)
+    graph = self.__model_step_graph__
+    _set_run_complete(self, False)
+    await run_steps_async(steps, graph, partial(_arun_step, self, executor=executor))
+    if to_step is None and returns is None:
+        _set_run_complete(self, True)
+    return _output(self, to_step, returns)
+
+
+def _get_returns(self):
     if len(self.__model_returns__) > 1:
         return tuple(getattr(self, ret) for ret in self.__model_returns__)
     return getattr(self, self.__model_returns__[0])
 
 
+def _fork(self, changes, steps, resets):
+    """Create a model with changes reusing the state of self and run only steps on it.
+
+    Reused values that are used or impacted by steps are copied (i.e., copy-on-write) so self
+    is left unchanged. The caller needs to ensure self holds the results of all other steps.
+    """
+    attribute_map = self.__model_attribute_map__
+    graph = self.__model_step_graph__
+    touched = set().union(*[graph.uses[step] | graph.impacts[step] for step in steps])
+
+    new = evolve(self, **changes)
+    for name in self.__model_intermediates__ + self.__model_returns__:
+        if attribute_map[name] in resets:
+            continue
+        value = getattr(self, name)
+        if attribute_map[name] in touched:
+            value = copy(value)
+        setattr(new, name, value)
+
+    run_step = _instrument(new, partial(_run_step, new))
+    for step in steps:
+        run_step(step)
+    _set_run_complete(new, True)
+    return new
+
+
+def _rerun(self, changes):
+    allowed = self.__model_parameters__ + self.__model_sensitivities__
+    unknown = [name for name in changes if name not in allowed]
+    if len(unknown) > 0:
+        msg = f"The attributes {str(unknown)} are not parameters or sensitivities of the model."
+        raise ModelRunError(msg)
+    if self.__model_run_complete__ is False:
+        msg = "Not able to rerun the model because it has not completed a full run (i.e., run "
+        msg += "without to_step, returns or release_intermediates)."
+        raise ModelRunError(msg)
+
+    attribute_map = self.__model_attribute_map__
+    graph = self.__model_step_graph__
+    steps, resets = graph.invalidated(tuple(attribute_map[name] for name in changes))
+    return _get_returns(_fork(self, changes, steps, resets))
+
+
+def _rebuild_model(cls, params, state):
+    """Rebuild a model pickled with Model.__reduce__."""
+    inst = cls.from_trusted(**params)
+    _set_run_complete(inst, state.pop("__model_run_complete__", False))
+    for name, value in state.items():
+        setattr(inst, name, value)
+    return inst
+
+
 @attrs(slots=True, repr=False)
 class Model:
     """The parent modeling class providing the key methods of run, audit, and visualize."""
@@ -276,6 +645,83 @@ class Model:
     __model_intermediates__: tuple = attrib(init=False, repr=False)
     __model_returns__: tuple = attrib(init=False, repr=False)
     __model_attribute_map__: dict = attrib(init=False, repr=False)
+    __model_step_graph__: StepGraph = attrib(init=False, repr=False)
+    __model_run_plan__: RunPlan = attrib(init=False, repr=False)
+    __model_run_complete__: bool = attrib(init=False, default=False, repr=False, eq=False)
+
+    @classmethod
+    def from_trusted(cls, **kwargs):
+        """Create a model from trusted values without running converters or validators.
+
+        The values passed are assigned as is, while the defaults of the attributes not passed
+        are converted the same as calling the model. Use when the values have already been converted and validated in bulk (e.g., with
+        DataDictionary.validate or footings.batch.validate_records) so the per instance
+        validation is pure overhead.
+
+        Parameters
+        ----------
+        kwargs
+            The parameters and sensitivities of the model.
+
+        Returns
+        -------
+        Model
+            The model instance, the same as calling the model with valid values.
+
+        Raises
+        ------
+        TypeError
+            If a required parameter is missing or an unknown parameter is passed.
+        """
+        return _make_trusted_function(cls, "from_trusted", create=True)(cls, **kwargs)
+
+    def rebind(self, **kwargs):
+        """Reuse this instance for new parameters without creating a new model.
+
+        The parameters and sensitivities are replaced with the values passed (sensitivities not
+        passed are set to their converted default) and all intermediates and returns are reset
+        to their init_value, leaving the instance in the same state as a newly created model.
+        Like from_trusted, converters and validators are not run on the values passed.
+
+        Values returned by a prior run are not modified as attributes are reassigned, not
+        cleared. Note an init_value that is not a Factory is shared across runs (the same as
+        creating new models).
+
+        Parameters
+        ----------
+        kwargs
+            The parameters and sensitivities of the model.
+
+        Returns
+        -------
+        Model
+            This instance.
+
+        Raises
+        ------
+        TypeError
+            If a required parameter is missing or an unknown parameter is passed.
+        """
+        return _make_trusted_function(type(self), "rebind", create=False)(self, **kwargs)
+
+    def __reduce__(self):
+        # pickle as (class reference, parameters, state) instead of every slot so the payload
+        # only holds the values passed and the intermediates and returns that have been set
+        params = {
+            name: getattr(self, name)
+            for name in self.__model_parameters__ + self.__model_sensitivities__
+        }
+        attributes = fields_dict(type(self))
+        state = {}
+        for name in self.__model_intermediates__ + self.__model_returns__:
+            value = getattr(self, name)
+            default = attributes[name].default
+            if value is default and not isinstance(default, Factory):
+                continue
+            state[name] = value
+        if self.__model_run_complete__ is True:
+            state["__model_run_complete__"] = True
+        return (_rebuild_model, (type(self), params, state))
 
     def visualize(self):
         """Visualize the model to get an understanding of what model attributes are used and when."""
@@ -298,16 +744,140 @@ class Model:
         """
         return run_model_audit(model=self, file=file, **kwargs)
 
-    def run(self, to_step=None):
+    def run(
+        self,
+        to_step=None,
+        *,
+        returns=None,
+        executor=None,
+        release_intermediates=False,
+        checkpoint=None,
+        profile=None,
+    ):
         """Runs the model and returns any returns defined.
 
         Parameters
         ----------
         to_step : str, optional
             The name of the step to run model to.
+        returns : tuple, optional
+            The names of the returns to compute. When passed, only the steps needed to compute
+            the returns (as declared by uses and impacts) are run and the requested returns are
+            returned in the order given.
+        executor : concurrent.futures.Executor, optional
+            A thread based executor (e.g., ThreadPoolExecutor). When passed, the steps are run on
+            the executor as soon as the steps they depend on (as declared by uses and impacts) have
+            finished, so independent steps run concurrently. The returns are the same as running
+            the steps in order. Steps impacting the same attribute are run in declaration order
+            (conflicting steps are reported with a StepConflictWarning when the model is created).
+        release_intermediates : bool, optional
+            If True, each intermediate is reset to its initial value as soon as the last step
+            using or impacting it (as declared by uses and impacts) has finished so the memory it
+            holds can be freed during the run. Returns are never released. Cannot be used with
+            to_step.
+        checkpoint : footings.checkpoint.Checkpoint, optional
+            When passed, the state of the model is saved after the steps selected by the
+            checkpoint so the run can be continued with resume. Cannot be used with an executor.
+        profile : footings.profiling.ProfileReport, optional
+            When passed, the wall time, CPU time, peak memory and size of the impacted attributes
+            of each step are added to the report (a TypeError is raised for anything else, e.g.,
+            True). Pass the same report to many runs to aggregate the measurements or use the
+            footings.profiling.profile context manager to profile all runs within a block.
+
+        """
+        if (
+            to_step is None
+            and returns is None
+            and executor is None
+            and release_intermediates is False
+            and checkpoint is None
+            and profile is None
+            and active_profiler() is None
+            and active_tracer() is None
+        ):
+            return self.__model_run_plan__(self)
+        return _run(
+            self,
+            to_step=to_step,
+            executor=executor,
+            returns=returns,
+            release_intermediates=release_intermediates,
+            checkpoint=checkpoint,
+            profile=profile,
+        )
+
+    async def arun(self, to_step=None, *, returns=None, executor=None):
+        """Runs the model on the running event loop and returns any returns defined.
+
+        Steps defined with async def are awaited and, like running with an executor, each step
+        starts as soon as the steps it depends on (as declared by uses and impacts) have
+        finished so independent steps overlap. Steps that are not async are run on the event
+        loop (blocking it) unless an executor is passed.
+
+        Parameters
+        ----------
+        to_step : str, optional
+            The name of the step to run model to.
+        returns : tuple, optional
+            The names of the returns to compute (see run).
+        executor : concurrent.futures.Executor, optional
+            A thread based executor to run the steps that are not async on.
+
+        Returns
+        -------
+        Any
+            The returns of the model, the same as calling run.
+        """
+        return await _arun(self, to_step=to_step, returns=returns, executor=executor)
+
+    def resume(self, from_step, checkpoint, *, returns=None):
+        """Resume a run from a step using the state saved by a checkpoint.
+
+        The state saved after the step prior to from_step is restored and the remaining steps
+        are run (continuing to save checkpoints). The model needs to be created with the same
+        parameters and sensitivities as the model that saved the checkpoint.
+
+        Parameters
+        ----------
+        from_step : str
+            The name of the step to resume the run from.
+        checkpoint : footings.checkpoint.Checkpoint
+            The checkpoint the state was saved to.
+        returns : tuple, optional
+            The names of the returns to compute (see run).
+
+        Returns
+        -------
+        Any
+            The returns of the model, the same as calling run.
+        """
+        return _run(
+            self,
+            to_step=None,
+            returns=returns,
+            checkpoint=checkpoint,
+            from_step=from_step,
+        )
+
+    def rerun(self, **changes):
+        """Rerun a model that has already been run with changes to parameters or sensitivities.
 
+        A new model is created with the changes and only the steps impacted by the changes (as
+        declared by uses and impacts) are run. All other intermediates and returns are reused
+        from this model. Reused values that are used or impacted by the steps being rerun are
+        copied (using copy.copy) so this model is left unchanged.
+
+        Parameters
+        ----------
+        changes
+            The parameters and/or sensitivities to change.
+
+        Returns
+        -------
+        Any
+            The returns of the new model, the same as calling run.
         """
-        return _run(self, to_step=to_step)
+        return _rerun(self, changes)
 
 
 @attrs(frozen=True, slots=True)
@@ -319,6 +889,7 @@ class Step:
     uses = attrib(type=List[str])
     impacts = attrib(type=List[str])
     metadata = attrib(type=dict, factory=dict)
+    is_async = attrib(type=bool, default=False)
 
     @classmethod
     def create(
@@ -331,6 +902,10 @@ class Step:
         metadata: Optional[dict] = None,
     ):
         method_name = method.__qualname__.split(".")[1]
+        is_async = inspect.iscoroutinefunction(method)
+        if is_async is True and metadata is not None and "cache" in metadata:
+            msg = f"The step [{method_name}] is async which cannot be cached."
+            raise ModelCreationError(msg)
         return cls(
             name=name if name is not None else method_name,
             docstring=docstring if docstring is not None else method.__doc__,
@@ -339,6 +914,7 @@ class Step:
             uses=uses,
             impacts=impacts,
             metadata={} if metadata is None else metadata,
+            is_async=is_async,
         )
 
     def __doc__(self):
@@ -350,6 +926,8 @@ class Step:
         return partial(self, obj)
 
     def __call__(self, *args, **kwargs):
+        if self.is_async is True:
+            return asyncio.run(self.method(*args, **kwargs))
         return self.method(*args, **kwargs)
 
 
@@ -367,13 +945,26 @@ def step(
     Parameters
     ----------
     method : callable, optional
-        The method to decorate, by default None.
+        The method to decorate, by default None. The method can be defined with async def
+        (e.g., to fetch data) in which case Model.arun awaits it, overlapping with independent
+        steps, and Model.run runs it on a new event loop. Async steps cannot be cached.
     uses : List[str]
         A list of the object names used by the step.
     impacts : List[str]
         A list of the object names that are impacted by the step (i.e., the returns and intermediates).
-    wrap : callable, optional
-        Wrap or source the docstring from another object, by default None.
+    name : str, optional
+        The name of the step, by default the method name.
+    docstring : str, optional
+        The docstring of the step, by default the method docstring.
+    metadata : dict, optional
+        Metadata to attach to the step. Pass a cache (e.g., footings.cache.LRUCache) under the
+        key "cache" to memoize the step - when the values the step uses match a prior run, the
+        impacts are restored from the cache without calling the method (use
+        footings.cache.shared_cache to share a cache process-wide). Pass a subset of uses under
+        the key "cache_key" to key the cache on those values only (e.g., a table path shared by
+        many policies) - the impacts need to depend only on them. Pass True under the
+        key "vectorize" to mark the step as able to run over columns of records (see
+        footings.batch.run_batch).
 
     Returns
     -------
@@ -412,9 +1003,9 @@ def _make_doc_parameter(attribute):
             atype = str(attribute.type)
         except:
             atype = ""
-    return numpydoc.Parameter(
-        attribute.name, atype, [attribute.metadata.get("description", "")]
-    )
+    from numpydoc.docscrape import Parameter
+
+    return Parameter(attribute.name, atype, [attribute.metadata.get("description", "")])
 
 
 def _parse_attriubtes(cls):
@@ -444,10 +1035,19 @@ def _generate_steps_sections(cls, steps):
     ]
 
 
-def _attr_doc(cls, steps):
+def _source_doc(cls):
+    """Get the docstring written for the model (or inherited) before it is generated."""
+    for base in cls.__mro__[1:]:
+        if base is not object and base.__doc__ is not None:
+            return inspect.cleandoc(base.__doc__)
+    return ""
+
+
+def _generate_doc(cls, steps):
+    from .doc_tools.docscrape import FootingsDoc
 
     parsed_attributes = _parse_attriubtes(cls)
-    doc = FootingsDoc(cls)
+    doc = FootingsDoc(cls, doc=_source_doc(cls))
 
     doc["Parameters"] = parsed_attributes["Parameters"]
     doc["Sensitivities"] = parsed_attributes["Sensitivities"]
@@ -457,7 +1057,38 @@ def _attr_doc(cls, steps):
     doc["Steps"] = _generate_steps_sections(cls, steps)
     doc["Methods"] = []
 
-    cls.__doc__ = str(doc)
+    return str(doc)
+
+
+class _LazyModelDoc:
+    """A descriptor generating the model docstring the first time __doc__ is accessed.
+
+    Generating the docstring requires numpydoc which is only imported when needed so creating
+    model classes stays cheap.
+    """
+
+    __slots__ = ("steps", "doc", "generating")
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.doc = None
+        self.generating = False
+
+    def __get__(self, obj, objtype=None):
+        if self.doc is None:
+            if self.generating is True:  # __doc__ is accessed while generating
+                return None
+            cls = objtype if objtype is not None else type(obj)
+            self.generating = True
+            try:
+                self.doc = _generate_doc(cls, self.steps)
+            finally:
+                self.generating = False
+        return self.doc
+
+
+def _attr_doc(cls, steps):
+    cls.__doc__ = _LazyModelDoc(tuple(steps))
     return cls
 
 
@@ -570,6 +1201,15 @@ def model(cls: type = None, *, steps: List[str] = []):
         }
 
         for step in steps:
+            cache_key = getattr(cls, step).metadata.get("cache_key", None)
+            if cache_key is not None:
+                unknown = [
+                    name for name in cache_key if name not in getattr(cls, step).uses
+                ]
+                if len(unknown) > 0:
+                    raise ModelCreationError(
+                        f"The cache_key of step [{step}] lists {str(unknown)} which are not in uses."
+                    )
             use_old = getattr(cls, step).uses
             use_new = _update_uses_impacts(use_old, attribute_map)
             impact_old = getattr(cls, step).impacts
@@ -577,6 +1217,16 @@ def model(cls: type = None, *, steps: List[str] = []):
             new_step = evolve(getattr(cls, step), uses=use_new, impacts=tuple(impact_new))
             setattr(cls, step, new_step)
         cls.__model_attribute_map__ = attribute_map
+        cls.__model_step_graph__ = StepGraph.create(
+            {
+                step: (getattr(cls, step).uses, getattr(cls, step).impacts)
+                for step in steps
+            }
+        )
+        if len(cls.__model_step_graph__.conflicts) > 0:
+            msg = f"The model [{cls.__qualname__}] has the following step conflicts -\n"
+            msg += "\n".join(cls.__model_step_graph__.conflicts)
+            warnings.warn(msg, StepConflictWarning, stacklevel=3)
 
         exclude = [x for x in Model.__dict__.keys() if x[0] != "_"]
         attrs = {
@@ -586,6 +1236,7 @@ def model(cls: type = None, *, steps: List[str] = []):
         }
 
         # Make attrs dataclass and update signature
+        module = cls.__module__
         cls = make_class(
             cls.__name__,
             attrs=attrs,
@@ -595,6 +1246,11 @@ def model(cls: type = None, *, steps: List[str] = []):
             repr=False,
             slots=True,
         )
+        cls.__model_run_plan__ = RunPlan.create(cls)
+        # make_class sets __module__ to footings.model, point it back to the module defining
+        # the model so classes (and instances) are pickled by reference
+        cls.__module__ = module
+        _set_trusted_functions(cls)
         return _attr_doc(cls, steps)
 
     return inner(cls)
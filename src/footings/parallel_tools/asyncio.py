@@ -0,0 +1,153 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+import sys
+from typing import Optional, Callable, Tuple
+
+from attr import attrs, attrib
+
+from ..exceptions import Error
+from ..jigs import (
+    WrappedModel,
+    MappedModel,
+    ForeachJig,
+    _exclude_iterator_keys,
+)
+
+__all__ = ["AsyncWrappedModel", "create_asyncio_foreach_jig"]
+
+
+@attrs(frozen=True)
+class AsyncWrappedModel(WrappedModel):
+    """Model wrapper returning a coroutine that runs the model with Model.arun and catches errors.
+
+    Takes the same arguments as WrappedModel plus an executor. The pooled option is not
+    supported as many models run at the same time on one thread.
+
+    :param Optional[Executor] executor: An optional executor to run the steps that are not async on.
+    """
+
+    executor = attrib(type=Optional[Executor], default=None, kw_only=True)
+
+    def __attrs_post_init__(self):
+        if self.pooled is True:
+            raise ValueError("An AsyncWrappedModel cannot be pooled.")
+        super().__attrs_post_init__()
+
+    def create_wrapped_model(self):
+        create_model = self.model_factory()
+
+        async def wrapper(**kwargs):
+            try:
+                excluded_keys = _exclude_iterator_keys(
+                    self.iterator_keys, self.pass_iterator_keys
+                )
+                model_kwargs = {k: v for k, v in kwargs.items() if k not in excluded_keys}
+                ret = await create_model(**model_kwargs).arun(executor=self.executor)
+            except Exception:
+                key = ({k: kwargs[k] for k in self.iterator_keys},)
+                ret = Error.create(key=key, sys_info=sys.exc_info())
+            return ret
+
+        object.__setattr__(self, "wrapped_model", wrapper)
+
+
+async def gather_limited(coroutines, max_concurrency: Optional[int] = None):
+    """Await coroutines with at most max_concurrency running at the same time.
+
+    :param coroutines: The coroutines to await.
+    :param Optional[int] max_concurrency: The maximum number running at once (default no limit).
+
+    :return: A list of the results in the same order as coroutines.
+    """
+    if max_concurrency is None:
+        return await asyncio.gather(*coroutines)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[limited(coroutine) for coroutine in coroutines])
+
+
+def compute_wrapper(output, max_concurrency: Optional[int] = None):
+    return asyncio.run(gather_limited(output, max_concurrency))
+
+
+def create_asyncio_foreach_jig(
+    model,
+    *,
+    iterator_name: str,
+    iterator_keys: tuple,
+    mapped_keys: Optional[Tuple] = None,
+    constant_params: Optional[Tuple] = None,
+    pass_iterator_keys: Optional[Tuple] = None,
+    success_wrap: Optional[Callable] = None,
+    error_wrap: Optional[Callable] = None,
+    max_concurrency: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    trusted: bool = False,
+):
+    """Create an asyncio backed ForeachJig that runs models concurrently on one event loop.
+
+    Each model is run with Model.arun so while a model awaits an async step (e.g., fetching
+    data) other models make progress. This gives high concurrency for I/O heavy models without
+    a thread or process per model. The jig runs a new event loop so it cannot be called from
+    a running event loop.
+
+    :param model: The models to call.
+    :type model: Union[WrappedModel, MappedModel]
+    :param str iterator_name: The name to assign the iterator to be passed (will be used in
+        signature of the returned model).
+    :param Optional[Tuple] mapped_keys: The keys to be used to lookup the model in mapping.
+    :param Optional[Tuple] constant_params: The parameter names which will be constant for all
+        items in the iterator.
+    :param Optional[Callable] success_wrap: An optional function to call upon running the model
+        on the items that returned without error (note if none return without error an empty
+        list is returned).
+    :param Optional[Callable] error_wrap: An optional function to call upon running the model
+        on the items that returned with error (note if none return with error an empty list is
+        returned).
+    :param Optional[int] max_concurrency: The maximum number of models running at the same time
+        (default no limit).
+    :param Optional[Executor] executor: An optional executor to run the steps that are not async on.
+    :param bool trusted: If True, models are created with from_trusted.
+
+    :return: ForeachJig (with updated signature)
+    """
+    if pass_iterator_keys is None:
+        pass_iterator_keys = tuple()
+
+    model_wrapper = partial(AsyncWrappedModel, executor=executor)
+    if isinstance(model, dict):
+        if mapped_keys is None:
+            msg = (
+                "When passing a dict of models, the keys used must be set in mapped_keys."
+            )
+            raise ValueError(msg)
+        model = MappedModel.create(
+            model,
+            model_wrapper=model_wrapper,
+            iterator_keys=iterator_keys,
+            mapped_keys=mapped_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+        )
+    else:
+        model = model_wrapper(
+            model,
+            iterator_keys=iterator_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+        )
+
+    return ForeachJig.create(
+        model=model,
+        iterator_name=iterator_name,
+        constant_params=constant_params,
+        success_wrap=success_wrap,
+        error_wrap=error_wrap,
+        compute=compute_wrapper,
+        compute_kwargs={"max_concurrency": max_concurrency},
+    )
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Optional, Callable, Dict, Tuple
 
 from dask import delayed, compute
@@ -11,6 +12,26 @@ def compute_wrapper(output, **compute_kwargs):
     return compute(output, **compute_kwargs)[0]
 
 
+def broadcast_wrapper(constant_params: dict):
+    """Ship each constant param once instead of embedding it in the task of every item.
+
+    With a dask.distributed client, the params are scattered to all workers. Otherwise, each
+    param becomes a single node in the graph that the tasks depend on.
+    """
+    try:
+        from distributed import default_client
+
+        client = default_client()
+    except (ImportError, ValueError):
+        client = None
+    if client is not None:
+        return {
+            k: client.scatter(v, broadcast=True, hash=False)
+            for k, v in constant_params.items()
+        }
+    return {k: delayed(v, traverse=False) for k, v in constant_params.items()}
+
+
 def create_dask_foreach_jig(
     model,
     *,
@@ -23,9 +44,14 @@ def create_dask_foreach_jig(
     error_wrap: Optional[Callable] = None,
     dask_delayed_kwargs: Optional[Dict] = None,
     dask_compute_kwargs: Optional[Dict] = None,
+    chunk_size: Optional[int] = None,
+    partitions: Optional[int] = None,
 ):
     """Create a dask backed ForeachJig that runs a WrappedModel or MappedModels for each item in an iterator.
 
+    The constant params are shipped once (scattered to the workers of a dask.distributed
+    client or added as a single node of the graph) and referenced by the task of each item.
+
     :param model: The models to call.
     :type model: Union[WrappedModel, MappedModel]
     :param str iterator_name: The name to assign the iterator to be passed (will be used in
@@ -41,9 +67,18 @@ def create_dask_foreach_jig(
         returned).
     :param Optional[Dict] dask_delayed_kwargs: Optional kwargs to pass into dask.dealyed.
     :param Optional[Dict] dask_compute_kwargs: Optional kwargs to pass into dask.compute.
+    :param Optional[int] chunk_size: If set, each delayed task runs a chunk of chunk_size items
+        instead of a single item. This keeps the size of the task graph manageable for large
+        iterators (the results are the same as without chunking).
+    :param Optional[int] partitions: If set, the items are split into this number of delayed
+        tasks (an alternative to chunk_size).
 
     :return: ForeachJig (with updated signature)
     """
+    parallel_wrap, chunk_wrap = delayed, None
+    if chunk_size is not None or partitions is not None:
+        parallel_wrap = None
+        chunk_wrap = partial(delayed, **(dask_delayed_kwargs or {}))
 
     if isinstance(model, dict):
         if mapped_keys is None:
@@ -57,7 +92,7 @@ def create_dask_foreach_jig(
             iterator_keys=iterator_keys,
             mapped_keys=mapped_keys,
             pass_iterator_keys=pass_iterator_keys,
-            parallel_wrap=delayed,
+            parallel_wrap=parallel_wrap,
             parallel_kwargs=dask_delayed_kwargs,
         )
     else:
@@ -65,7 +100,7 @@ def create_dask_foreach_jig(
             model,
             iterator_keys=iterator_keys,
             pass_iterator_keys=pass_iterator_keys,
-            parallel_wrap=delayed,
+            parallel_wrap=parallel_wrap,
             parallel_kwargs=dask_delayed_kwargs,
         )
 
@@ -77,4 +112,8 @@ def create_dask_foreach_jig(
         error_wrap=error_wrap,
         compute=compute_wrapper,
         compute_kwargs=dask_compute_kwargs,
+        chunk_size=chunk_size,
+        partitions=partitions,
+        chunk_wrap=chunk_wrap,
+        broadcast=broadcast_wrapper,
     )
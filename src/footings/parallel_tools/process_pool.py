@@ -0,0 +1,203 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+from threading import Lock
+from typing import Optional, Callable, Tuple
+
+from attr import attrs, attrib
+
+from ..jigs import WrappedModel, MappedModel, ForeachJig, _defer_chunk, _run_chunk
+
+__all__ = ["ProcessPoolCompute", "create_process_pool_foreach_jig"]
+
+
+_WORKER_MODEL = None
+_WORKER_KWARGS = None
+
+
+def _init_worker(model, kwargs: dict):
+    """Keep the WrappedModel or MappedModel and the constant params for the worker process
+    (called once per process)."""
+    global _WORKER_MODEL, _WORKER_KWARGS
+    _WORKER_MODEL, _WORKER_KWARGS = model, kwargs
+
+
+def _run_worker_chunk(entries: list):
+    return _run_chunk(_WORKER_MODEL, entries, _WORKER_KWARGS)
+
+
+def _same_params(params: dict, other: dict):
+    """Test if two sets of constant params hold the same objects (or equal scalars)."""
+    if params.keys() != other.keys():
+        return False
+    for k, v in params.items():
+        o = other[k]
+        if v is o:
+            continue
+        if not isinstance(v, (type(None), bool, int, float, str, bytes)) or v != o:
+            return False
+    return True
+
+
+@attrs(slots=True, repr=False)
+class ProcessPoolCompute:
+    """The compute of a process pool ForeachJig that keeps one pool of workers across calls.
+
+    The pool is started on the first call with each worker initialized with the wrapped models
+    and the constant params. Later calls (e.g., each batch of ForeachJig.stream) passing the same
+    constant params (compared by identity) reuse the pool. When the constant params change,
+    the pool is restarted. Call shutdown (or use the compute as a context manager) to stop the
+    workers, otherwise they are stopped when the interpreter exits.
+
+    :param model: The WrappedModel or MappedModel to run on the workers.
+    :param Optional[int] max_workers: The number of worker processes (default is the number of
+        CPUs).
+    :param bool ordered: If True (default), results are in the order of the iterator. Otherwise,
+        results are collected in the order chunks finish.
+    :param mp_context: An optional multiprocessing context.
+    """
+
+    model = attrib()
+    max_workers = attrib(type=Optional[int], default=None)
+    ordered = attrib(type=bool, default=True)
+    mp_context = attrib(default=None)
+    _executor = attrib(init=False, default=None)
+    _params = attrib(init=False, default=None)
+    _lock = attrib(init=False, factory=Lock)
+
+    def _pool(self, params: dict):
+        with self._lock:
+            if self._executor is not None and not _same_params(self._params, params):
+                self._executor.shutdown()
+                self._executor = None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers or os.cpu_count() or 1,
+                    mp_context=self.mp_context,
+                    initializer=_init_worker,
+                    initargs=(self.model, params),
+                )
+                self._params = params
+            return self._executor
+
+    def __call__(self, output):
+        """Run the deferred chunks on the pool (the constant params are not sent with each chunk)."""
+        if len(output) == 0:
+            return []
+        # the constant params are shared by all chunks
+        executor = self._pool(output[0][1])
+        entries = [chunk[0] for chunk in output]
+        if self.ordered is True:
+            return list(executor.map(_run_worker_chunk, entries))
+        futures = [executor.submit(_run_worker_chunk, chunk) for chunk in entries]
+        return [future.result() for future in as_completed(futures)]
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes (a new pool is started if called again)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+            self._executor, self._params = None, None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def __repr__(self):
+        running = self._executor is not None
+        return f"ProcessPoolCompute(max_workers={self.max_workers}, running={running})"
+
+
+def create_process_pool_foreach_jig(
+    model,
+    *,
+    iterator_name: str,
+    iterator_keys: tuple,
+    mapped_keys: Optional[Tuple] = None,
+    constant_params: Optional[Tuple] = None,
+    pass_iterator_keys: Optional[Tuple] = None,
+    success_wrap: Optional[Callable] = None,
+    error_wrap: Optional[Callable] = None,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    mp_context=None,
+    trusted: bool = False,
+    pooled: bool = False,
+):
+    """Create a ForeachJig that runs a WrappedModel or MappedModels for each item in an iterator
+    on a pool of processes (concurrent.futures.ProcessPoolExecutor).
+
+    The jig keeps one pool of workers (see ProcessPoolCompute) started on the first call and
+    reused by later calls with the same constant params. Each worker process is initialized
+    once with the wrapped models and the constant params (importing the model classes or
+    unpickling them depending on the start method) and the items are sent to the workers in
+    chunks of chunksize. Stop the workers with ``jig.compute.shutdown()`` or
+    ``with jig.compute:``.
+
+    :param model: The models to call.
+    :type model: Union[WrappedModel, MappedModel]
+    :param str iterator_name: The name to assign the iterator to be passed (will be used in
+        signature of the returned model).
+    :param Optional[Tuple] mapped_keys: The keys to be used to lookup the model in mapping.
+    :param Optional[Tuple] constant_params: The parameter names which will be constant for all
+        items in the iterator.
+    :param Optional[Callable] success_wrap: An optional function to call upon running the model
+        on the items that returned without error (note if none return without error an empty
+        list is returned).
+    :param Optional[Callable] error_wrap: An optional function to call upon running the model
+        on the items that returned with error (note if none return with error an empty list is
+        returned).
+    :param Optional[int] max_workers: The number of worker processes (default is the number of
+        CPUs).
+    :param int chunksize: The number of items sent to a worker in a single task (default 1).
+    :param bool ordered: If True (default), results are in the order of the iterator. Otherwise,
+        results are collected in the order chunks finish.
+    :param mp_context: An optional multiprocessing context (e.g.,
+        multiprocessing.get_context("spawn")).
+    :param bool trusted: If True, models are created with from_trusted.
+    :param bool pooled: If True, each worker keeps one instance of a model that is rebound to
+        each item with Model.rebind.
+
+    :return: ForeachJig (with updated signature)
+    """
+    if pass_iterator_keys is None:
+        pass_iterator_keys = tuple()
+
+    if isinstance(model, dict):
+        if mapped_keys is None:
+            msg = (
+                "When passing a dict of models, the keys used must be set in mapped_keys."
+            )
+            raise ValueError(msg)
+        model = MappedModel.create(
+            model,
+            model_wrapper=WrappedModel,
+            iterator_keys=iterator_keys,
+            mapped_keys=mapped_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
+        )
+    else:
+        model = WrappedModel(
+            model,
+            iterator_keys=iterator_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
+        )
+
+    return ForeachJig.create(
+        model=model,
+        iterator_name=iterator_name,
+        constant_params=constant_params,
+        success_wrap=success_wrap,
+        error_wrap=error_wrap,
+        compute=ProcessPoolCompute(
+            model, max_workers=max_workers, ordered=ordered, mp_context=mp_context
+        ),
+        chunk_size=chunksize,
+        chunk_wrap=_defer_chunk,
+    )
@@ -1,17 +1,42 @@
 from typing import Optional, Callable, Dict, Tuple
 
-# import ray
-#
-# from ..jigs import WrappedModel, MappedModel, ForeachJig
-#
-# __all__ = ["create_ray_foreach_jig"]
-#
-#
-# def ray_wrapper(func, **kwargs):
-#     def inner(func, **kwargs):
-#         return ray.remote(func, **kwargs)
-#
-#     return inner(func, **kwargs).remote
+import ray
+
+from ..jigs import WrappedModel, MappedModel, ForeachJig, _defer_chunk, _run_chunk
+
+__all__ = ["create_ray_foreach_jig"]
+
+
+def compute_wrapper(
+    output,
+    *,
+    model,
+    ray_remote_kwargs: Optional[Dict] = None,
+    ray_get_kwargs: Optional[Dict] = None,
+    wait: bool = False,
+):
+    """Run the deferred chunks as ray tasks with the model and constant params put in the
+    object store once."""
+    if len(output) == 0:
+        return []
+    if ray_get_kwargs is None:
+        ray_get_kwargs = {}
+    if ray_remote_kwargs:
+        run_chunk = ray.remote(**ray_remote_kwargs)(_run_chunk)
+    else:
+        run_chunk = ray.remote(_run_chunk)
+
+    model_ref = ray.put(model)
+    kwargs_ref = ray.put(output[0][1])  # the constant params are shared by all chunks
+    refs = [run_chunk.remote(model_ref, entries, kwargs_ref) for entries, _ in output]
+    if wait is False:
+        return ray.get(refs, **ray_get_kwargs)
+
+    results = []
+    while len(refs) > 0:
+        done, refs = ray.wait(refs, num_returns=1)
+        results.extend(ray.get(done, **ray_get_kwargs))
+    return results
 
 
 def create_ray_foreach_jig(
@@ -26,9 +51,18 @@ def create_ray_foreach_jig(
     error_wrap: Optional[Callable] = None,
     ray_remote_kwargs: Optional[Dict] = None,
     ray_get_kwargs: Optional[Dict] = None,
+    chunk_size: int = 1,
+    partitions: Optional[int] = None,
+    wait: bool = False,
+    trusted: bool = False,
+    pooled: bool = False,
 ):
     """Create a ray backed ForeachJig that runs a WrappedModel or MappedModels for each item in an iterator.
 
+    The items are split into chunks with each chunk run as a ray task. The wrapped models and
+    the constant params are put in the object store once per call (instead of being serialized
+    with each task). Ray needs to be initialized (i.e., ray.init) before calling the jig.
+
     :param model: The models to call.
     :type model: Union[WrappedModel, MappedModel]
     :param str iterator_name: The name to assign the iterator to be passed (will be used in
@@ -44,43 +78,61 @@ def create_ray_foreach_jig(
         returned).
     :param Optional[Dict] ray_remote_kwargs: Optional kwargs to pass into ray.remote.
     :param Optional[Dict] ray_get_kwargs: Optional kwargs to pass into ray.get.
+    :param int chunk_size: The number of items run in each ray task (default 1).
+    :param Optional[int] partitions: If set, the items are split into this number of ray tasks
+        (an alternative to chunk_size).
+    :param bool wait: If True, results are collected with ray.wait as tasks finish (i.e., in the
+        order tasks finish). Otherwise, results are collected with ray.get in the order of the
+        iterator.
+    :param bool trusted: If True, models are created with from_trusted.
+    :param bool pooled: If True, each ray worker keeps one instance of a model that is rebound
+        to each item with Model.rebind.
 
     :return: ForeachJig (with updated signature)
     """
-    pass
+    if pass_iterator_keys is None:
+        pass_iterator_keys = tuple()
+    if partitions is not None:
+        chunk_size = None
 
+    if isinstance(model, dict):
+        if mapped_keys is None:
+            msg = (
+                "When passing a dict of models, the keys used must be set in mapped_keys."
+            )
+            raise ValueError(msg)
+        model = MappedModel.create(
+            model,
+            model_wrapper=WrappedModel,
+            iterator_keys=iterator_keys,
+            mapped_keys=mapped_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
+        )
+    else:
+        model = WrappedModel(
+            model,
+            iterator_keys=iterator_keys,
+            pass_iterator_keys=pass_iterator_keys,
+            trusted=trusted,
+            pooled=pooled,
+        )
 
-#     if isinstance(model, dict):
-#         if mapped_keys is None:
-#             msg = (
-#                 "When passing a dict of models, the keys used must be set in mapped_keys."
-#             )
-#             raise ValueError(msg)
-#         model = MappedModel.create(
-#             model,
-#             model_wrapper=WrappedModel,
-#             iterator_keys=iterator_keys,
-#             mapped_keys=mapped_keys,
-#             pass_iterator_keys=pass_iterator_keys,
-#             parallel_wrap=ray_wrapper,
-#             parallel_kwargs=ray_remote_kwargs,
-#         )
-#     else:
-#         model = WrappedModel(
-#             model,
-#             iterator_keys=iterator_keys,
-#             pass_iterator_keys=pass_iterator_keys,
-#             parallel_wrap=ray_wrapper,
-#             parallel_kwargs=ray_remote_kwargs,
-#         )
-#
-#     return ForeachJig.create(
-#         model=model,
-#         iterator_name=iterator_name,
-#         constant_params=constant_params,
-#         success_wrap=success_wrap,
-#         error_wrap=error_wrap,
-#         compute=ray.get,
-#         compute_kwargs=ray_get_kwargs,
-#     )
-#
+    return ForeachJig.create(
+        model=model,
+        iterator_name=iterator_name,
+        constant_params=constant_params,
+        success_wrap=success_wrap,
+        error_wrap=error_wrap,
+        compute=compute_wrapper,
+        compute_kwargs={
+            "model": model,
+            "ray_remote_kwargs": ray_remote_kwargs,
+            "ray_get_kwargs": ray_get_kwargs,
+            "wait": wait,
+        },
+        chunk_size=chunk_size,
+        partitions=partitions,
+        chunk_wrap=_defer_chunk,
+    )
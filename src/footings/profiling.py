@@ -0,0 +1,204 @@
+from contextlib import contextmanager
+import sys
+from threading import Lock
+from time import perf_counter, thread_time
+import tracemalloc
+
+from attr import attrs, attrib, evolve
+from attr.validators import instance_of
+import numpy as np
+import pandas as pd
+
+__all__ = ["StepProfile", "ProfileReport", "profile"]
+
+
+_PROFILER = None
+
+
+def active_profiler():
+    """Get the ProfileReport recording model runs or None when profiling is off."""
+    return _PROFILER
+
+
+def _sizeof(value):
+    """Estimate the number of bytes held by a value."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+@attrs(frozen=True, slots=True)
+class StepProfile:
+    """The aggregated measurements of a step across one or more runs.
+
+    :param str model: The name of the model.
+    :param str step: The name of the step.
+    :param int calls: The number of times the step was run.
+    :param float wall_time: The total wall time in seconds.
+    :param float cpu_time: The total CPU time in seconds of the thread running the step.
+    :param int peak_memory: The largest peak of memory allocated (as traced by tracemalloc)
+        while running the step in bytes (0 when memory is not traced).
+    :param int impact_size: The largest estimated size in bytes of the objects impacted by the step.
+    """
+
+    model = attrib(type=str, validator=instance_of(str))
+    step = attrib(type=str, validator=instance_of(str))
+    calls = attrib(type=int, default=0)
+    wall_time = attrib(type=float, default=0.0)
+    cpu_time = attrib(type=float, default=0.0)
+    peak_memory = attrib(type=int, default=0)
+    impact_size = attrib(type=int, default=0)
+
+    def merge(self, other):
+        """Combine the measurements of two StepProfiles for the same model and step."""
+        return evolve(
+            self,
+            calls=self.calls + other.calls,
+            wall_time=self.wall_time + other.wall_time,
+            cpu_time=self.cpu_time + other.cpu_time,
+            peak_memory=max(self.peak_memory, other.peak_memory),
+            impact_size=max(self.impact_size, other.impact_size),
+        )
+
+
+@attrs(slots=True, repr=False)
+class ProfileReport:
+    """A report of the measurements of each model step, aggregated across runs.
+
+    :param bool memory: If True, the peak memory allocated by each step is traced.
+    """
+
+    memory = attrib(type=bool, default=True, validator=instance_of(bool))
+    _steps = attrib(init=False, factory=dict)
+    _lock = attrib(init=False, factory=Lock)
+
+    @property
+    def steps(self):
+        """The StepProfiles keyed by (model, step) in the order first run."""
+        return dict(self._steps)
+
+    def add(self, step_profile: StepProfile):
+        """Add the measurements of a StepProfile to the report."""
+        key = (step_profile.model, step_profile.step)
+        with self._lock:
+            current = self._steps.get(key, None)
+            self._steps[key] = (
+                step_profile if current is None else current.merge(step_profile)
+            )
+
+    def merge(self, other):
+        """Combine two reports (e.g., from different workers) into a new report."""
+        report = ProfileReport(memory=self.memory and other.memory)
+        for step_profile in list(self._steps.values()) + list(other._steps.values()):
+            report.add(step_profile)
+        return report
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    @classmethod
+    def aggregate(cls, reports):
+        """Combine many reports into a single report."""
+        report = cls()
+        for other in reports:
+            report = report.merge(other)
+        return report
+
+    def wrap(self, model, run_step):
+        """Wrap run_step so each step run on model is measured and added to the report."""
+        name = type(model).__qualname__
+        graph = model.__model_step_graph__
+
+        def inner(step):
+            if self.memory is True:
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+                start_memory = tracemalloc.get_traced_memory()[0]
+            start_wall, start_cpu = perf_counter(), thread_time()
+            try:
+                return run_step(step)
+            finally:
+                wall_time = perf_counter() - start_wall
+                cpu_time = thread_time() - start_cpu
+                peak_memory = 0
+                if self.memory is True:
+                    peak_memory = max(
+                        tracemalloc.get_traced_memory()[1] - start_memory, 0
+                    )
+                impact_size = sum(
+                    _sizeof(getattr(model, impact.split(".")[1]))
+                    for impact in graph.impacts[step]
+                )
+                self.add(
+                    StepProfile(
+                        model=name,
+                        step=step,
+                        calls=1,
+                        wall_time=wall_time,
+                        cpu_time=cpu_time,
+                        peak_memory=peak_memory,
+                        impact_size=impact_size,
+                    )
+                )
+
+        return inner
+
+    def to_dataframe(self):
+        """Show the report as a DataFrame with a row per model step."""
+        columns = [
+            "model",
+            "step",
+            "calls",
+            "wall_time",
+            "cpu_time",
+            "peak_memory",
+            "impact_size",
+        ]
+        records = [
+            {col: getattr(step_profile, col) for col in columns}
+            for step_profile in self._steps.values()
+        ]
+        frame = pd.DataFrame.from_records(records, columns=columns)
+        frame["mean_wall_time"] = frame["wall_time"] / frame["calls"]
+        return frame
+
+    def __repr__(self):
+        return f"ProfileReport(steps={len(self._steps)})"
+
+
+@contextmanager
+def profile(memory: bool = True):
+    """A context manager recording the measurements of every model step run within it.
+
+    Like tracing, profiling is process-wide so runs on other threads (e.g., models run by a
+    ForeachJig on an executor) are recorded. When memory is True, tracemalloc is started (if not
+    already tracing) which slows down runs, so wall and CPU times are best compared with
+    memory=False. When steps are run concurrently the traced memory is shared across the steps
+    running at the same time.
+
+    :param bool memory: If True (default), trace the peak memory allocated by each step.
+
+    :return: The ProfileReport the measurements are added to.
+
+    Examples
+    --------
+    >>> with profile() as report:
+    >>>     model.run()
+    >>> report.to_dataframe()
+    """
+    global _PROFILER
+    report = ProfileReport(memory=memory)
+    started = False
+    if memory is True and tracemalloc.is_tracing() is False:
+        tracemalloc.start()
+        started = True
+    prior = _PROFILER
+    _PROFILER = report
+    try:
+        yield report
+    finally:
+        _PROFILER = prior
+        if started is True:
+            tracemalloc.stop()
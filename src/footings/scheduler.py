@@ -0,0 +1,209 @@
+import asyncio
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Optional, Tuple
+
+from attr import attrs, attrib
+from attr.validators import instance_of
+
+__all__ = ["StepGraph", "run_steps_concurrently", "run_steps_async"]
+
+
+@attrs(frozen=True, slots=True)
+class StepGraph:
+    """A directed acyclic graph of model steps built from the declared uses and impacts.
+
+    A step depends on an earlier step when it uses an attribute the earlier step impacts, when
+    it impacts an attribute the earlier step uses or when both impact the same attribute. Running
+    the steps in any order that respects these dependencies gives the same result as running
+    them in declaration order.
+
+    :param tuple steps: The step names in declaration order.
+    :param dict uses: A mapping of step name to the attributes used by the step.
+    :param dict impacts: A mapping of step name to the attributes impacted by the step.
+    :param dict predecessors: A mapping of step name to the steps that need to finish before it can run.
+    :param tuple conflicts: Messages describing any steps that impact the same attribute where the
+        later step does not use the attribute (i.e., the later step blindly overwrites the earlier one).
+    """
+
+    steps = attrib(type=tuple, validator=instance_of(tuple))
+    uses = attrib(type=dict, validator=instance_of(dict))
+    impacts = attrib(type=dict, validator=instance_of(dict))
+    predecessors = attrib(type=dict, validator=instance_of(dict))
+    conflicts = attrib(type=tuple, validator=instance_of(tuple))
+
+    @classmethod
+    def create(cls, steps: Dict[str, Tuple[tuple, tuple]]):
+        """Create a StepGraph.
+
+        :param dict steps: An ordered mapping of step name to a tuple of (uses, impacts).
+
+        :return: StepGraph
+        """
+        uses = {name: frozenset(step_uses) for name, (step_uses, _) in steps.items()}
+        impacts = {
+            name: frozenset(step_impacts) for name, (_, step_impacts) in steps.items()
+        }
+        names = tuple(steps)
+        predecessors, conflicts = {}, []
+        for position, step in enumerate(names):
+            preceding = []
+            for prior in names[:position]:
+                shared = impacts[prior] & impacts[step]
+                if (
+                    impacts[prior] & uses[step]
+                    or uses[prior] & impacts[step]
+                    or len(shared) > 0
+                ):
+                    preceding.append(prior)
+                for attribute in sorted(shared - uses[step]):
+                    msg = f"The steps [{prior}] and [{step}] both impact [{attribute}] "
+                    msg += f"but [{step}] does not use it."
+                    conflicts.append(msg)
+            predecessors[step] = tuple(preceding)
+
+        return cls(
+            steps=names,
+            uses=uses,
+            impacts=impacts,
+            predecessors=predecessors,
+            conflicts=tuple(conflicts),
+        )
+
+    def required(self, attributes: tuple, steps: Optional[tuple] = None):
+        """Find the steps needed to compute the given attributes.
+
+        Walks the steps backwards keeping any step that impacts a needed attribute and adding the
+        attributes it uses to those needed.
+
+        :param tuple attributes: The attributes to compute.
+        :param Optional[tuple] steps: The steps to choose from (default is all steps).
+
+        :return: The needed steps in declaration order.
+        :rtype: tuple
+        """
+        if steps is None:
+            steps = self.steps
+        needed, kept = set(attributes), []
+        for step in reversed(steps):
+            if self.impacts[step] & needed:
+                kept.append(step)
+                needed |= self.uses[step]
+        return tuple(reversed(kept))
+
+    def invalidated(self, attributes: tuple):
+        """Find the steps that need to be rerun when the given attributes change.
+
+        Beyond the steps downstream of the changed attributes, a step is also rerun when it
+        impacts an attribute impacted by an earlier rerun step or when it produced an attribute
+        that a rerun step uses but that is overwritten at or after the rerun step (i.e., the
+        value held at the end of the prior run is not the value the rerun step needs). If no
+        step produced such an attribute, it needs to be reset to its initial value.
+
+        :param tuple attributes: The changed attributes.
+
+        :return: A tuple of the steps to rerun (in declaration order) and a tuple of the
+            attributes to reset to their initial values.
+        :rtype: Tuple[tuple, tuple]
+        """
+        changed = frozenset(attributes)
+        dirty = {step for step in self.steps if self.uses[step] & changed}
+        resets = set()
+        checked = set()
+        while len(checked) < len(dirty):
+            step = min(dirty - checked, key=self.steps.index)
+            checked.add(step)
+            position = self.steps.index(step)
+            for later in self.steps[(position + 1) :]:
+                if self.uses[later] & self.impacts[step]:
+                    dirty.add(later)
+                elif self.impacts[later] & self.impacts[step]:
+                    dirty.add(later)
+            for attribute in self.uses[step]:
+                overwritten = any(
+                    attribute in self.impacts[later] for later in self.steps[position:]
+                )
+                if overwritten is False:
+                    continue
+                producers = [
+                    prior
+                    for prior in self.steps[:position]
+                    if attribute in self.impacts[prior]
+                ]
+                if len(producers) > 0:
+                    dirty.add(producers[-1])
+                else:
+                    resets.add(attribute)
+
+        steps = tuple(step for step in self.steps if step in dirty)
+        return steps, tuple(sorted(resets))
+
+
+def run_steps_concurrently(
+    steps: tuple, graph: StepGraph, run_step: Callable, executor: Executor
+):
+    """Run steps on an executor as soon as the steps they depend on have finished.
+
+    Predecessors that are not in steps are treated as already complete. If any step raises, the
+    steps already submitted are allowed to finish before the first error is raised.
+
+    :param tuple steps: The step names to run.
+    :param StepGraph graph: The graph holding the dependencies between steps.
+    :param Callable run_step: A callable taking a step name that runs the step.
+    :param Executor executor: The executor used to run steps (e.g., a ThreadPoolExecutor).
+    """
+    remaining = {
+        step: set(graph.predecessors[step]).intersection(steps) for step in steps
+    }
+    pending = {}
+
+    def _submit_ready():
+        for step in [step for step, deps in remaining.items() if len(deps) == 0]:
+            del remaining[step]
+            pending[executor.submit(run_step, step)] = step
+
+    _submit_ready()
+    while len(pending) > 0:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            step = pending.pop(future)
+            if future.exception() is not None:
+                wait(pending)
+                raise future.exception()
+            for deps in remaining.values():
+                deps.discard(step)
+        _submit_ready()
+
+
+async def run_steps_async(steps: tuple, graph: StepGraph, run_step: Callable):
+    """Run steps on the running event loop as soon as the steps they depend on have finished.
+
+    The asyncio version of run_steps_concurrently where run_step returns an awaitable. If any
+    step raises, the steps already started are allowed to finish before the first error is raised.
+
+    :param tuple steps: The step names to run.
+    :param StepGraph graph: The graph holding the dependencies between steps.
+    :param Callable run_step: A callable taking a step name that returns an awaitable running
+        the step.
+    """
+    remaining = {
+        step: set(graph.predecessors[step]).intersection(steps) for step in steps
+    }
+    pending = {}
+
+    def _submit_ready():
+        for step in [step for step, deps in remaining.items() if len(deps) == 0]:
+            del remaining[step]
+            pending[asyncio.ensure_future(run_step(step))] = step
+
+    _submit_ready()
+    while len(pending) > 0:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            step = pending.pop(future)
+            if future.exception() is not None:
+                if len(pending) > 0:
+                    await asyncio.wait(pending)
+                raise future.exception()
+            for deps in remaining.values():
+                deps.discard(step)
+        _submit_ready()
@@ -0,0 +1,59 @@
+from itertools import product
+from typing import Iterable, Mapping
+
+from attr import evolve
+
+from .exceptions import ModelRunError
+from .model import _fork, _get_returns, _run_step
+
+__all__ = ["run_sensitivity_grid"]
+
+
+def run_sensitivity_grid(model, grid: Mapping[str, Iterable], *, executor=None):
+    """Run a model for every combination of a grid of sensitivity values.
+
+    Using the uses and impacts of each step, the steps that do not depend on any swept
+    sensitivity are run once and their intermediates and returns are shared across all
+    scenarios. Only the steps that depend on a swept sensitivity are run for each scenario. Shared
+    values that a scenario step uses or impacts are copied (i.e., copy-on-write) so scenarios do
+    not affect one another.
+
+    :param model: A model instance created with the base parameters (it is not modified).
+    :param Mapping[str, Iterable] grid: A mapping of sensitivity name to the values to sweep.
+    :param Optional[Executor] executor: An optional executor (e.g., a ThreadPoolExecutor) used to
+        run the scenarios in parallel.
+
+    :return: A list of tuples of (scenario, output) for each combination where scenario is a dict
+        of the sensitivity values and output is the same as calling run.
+    :rtype: list
+
+    :raises ModelRunError: If a key in grid is not a sensitivity of the model.
+    """
+    unknown = [name for name in grid if name not in model.__model_sensitivities__]
+    if len(unknown) > 0:
+        msg = f"The attributes {str(unknown)} are not sensitivities of the model."
+        raise ModelRunError(msg)
+    if len(model.__model_returns__) == 0:
+        msg = "Not able to run model because no return attributes are registered."
+        raise ModelRunError(msg)
+
+    attribute_map = model.__model_attribute_map__
+    graph = model.__model_step_graph__
+    steps, resets = graph.invalidated(tuple(attribute_map[name] for name in grid))
+
+    base = evolve(model)
+    for step in graph.steps:
+        if step not in steps:
+            _run_step(base, step)
+
+    names = list(grid)
+    scenarios = [dict(zip(names, values)) for values in product(*grid.values())]
+
+    def _run_scenario(scenario):
+        return _get_returns(_fork(base, scenario, steps, resets))
+
+    if executor is None:
+        outputs = [_run_scenario(scenario) for scenario in scenarios]
+    else:
+        outputs = list(executor.map(_run_scenario, scenarios))
+    return list(zip(scenarios, outputs))
@@ -0,0 +1,128 @@
+from contextlib import contextmanager
+import json
+import os
+import pathlib
+from threading import get_ident
+from time import perf_counter_ns
+from typing import Optional
+
+from attr import attrs, attrib
+
+__all__ = ["Tracer", "trace"]
+
+
+_TRACER = None
+
+
+def active_tracer():
+    """Get the Tracer recording spans or None when tracing is off."""
+    return _TRACER
+
+
+@attrs(slots=True, repr=False)
+class Tracer:
+    """A recorder of spans (i.e., named intervals of time) exported as Chrome trace events.
+
+    Spans are recorded for each model step run, each WrappedModel call (split into construct
+    and run) and the dispatch, compute and partition phases of ForeachJig calls. The trace can
+    be viewed with chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    _events = attrib(init=False, factory=list)
+    _start = attrib(init=False, factory=perf_counter_ns)
+
+    @property
+    def events(self):
+        """The recorded trace events."""
+        return list(self._events)
+
+    def add(
+        self, name: str, category: str, start: int, end: int, args: Optional[dict] = None
+    ):
+        """Add a span.
+
+        :param str name: The name of the span.
+        :param str category: The category of the span (e.g., step or jig).
+        :param int start: The start time from time.perf_counter_ns.
+        :param int end: The end time from time.perf_counter_ns.
+        :param Optional[dict] args: Optional arguments shown with the span.
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._start) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": get_ident(),
+        }
+        if args is not None:
+            event["args"] = args
+        self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Optional[dict] = None):
+        """A context manager recording a span around the code within it.
+
+        :param str name: The name of the span.
+        :param str category: The category of the span.
+        :param Optional[dict] args: Optional arguments shown with the span.
+        """
+        start = perf_counter_ns()
+        try:
+            yield self
+        finally:
+            self.add(name, category, start, perf_counter_ns(), args)
+
+    def wrap(self, model, run_step):
+        """Wrap run_step so a span is recorded for each step run on model."""
+        name = type(model).__qualname__
+
+        def inner(step):
+            start = perf_counter_ns()
+            try:
+                return run_step(step)
+            finally:
+                self.add(f"{name}.{step}", "step", start, perf_counter_ns())
+
+        return inner
+
+    def to_chrome_trace(self):
+        """Export the spans as a Chrome trace event object."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def dump(self, file: str):
+        """Write the spans as Chrome trace event JSON to file."""
+        path = pathlib.Path(file)
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str))
+        return path
+
+    def __repr__(self):
+        return f"Tracer(events={len(self._events)})"
+
+
+@contextmanager
+def trace(file: Optional[str] = None):
+    """A context manager recording spans for model runs and jigs within it.
+
+    Tracing is process-wide so spans are recorded from all threads (e.g., dask's threaded
+    scheduler). When tracing is off, the instrumented code paths only check a module global.
+
+    :param Optional[str] file: An optional file to write the Chrome trace event JSON to on exit.
+
+    :return: The Tracer the spans are added to.
+
+    Examples
+    --------
+    >>> with trace("model.trace.json") as tracer:
+    >>>     model.run()
+    """
+    global _TRACER
+    prior = _TRACER
+    tracer = _TRACER = Tracer()
+    try:
+        yield tracer
+    finally:
+        _TRACER = prior
+        if file is not None:
+            tracer.dump(file)
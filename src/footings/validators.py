@@ -1,4 +1,7 @@
 from attr import attrs, attrib
+import numpy as np
+import pandas as pd
+
 from .data_dictionary import DataDictionary
 
 # from attr.validators import (
@@ -16,6 +19,7 @@ from .data_dictionary import DataDictionary
 __all__ = [
     "equal_to",
     "not_equal_to",
+    "in_range",
     "isin",
 ]
 
@@ -23,7 +27,6 @@ __all__ = [
 # "greater_than_or_equal_to",
 # "less_than",
 # "less_than_or_equal_to",
-# "in_range",
 # "is_in",
 # "not_in",
 # "str_contains",
@@ -40,9 +43,12 @@ __all__ = [
 class _EqualToValidator:
     value = attrib()
 
+    def mask(self, values):
+        """Get a boolean mask of the values that fail the validator."""
+        return values != self.value
+
     def _call_data_dictionary(self, inst, attr, value):
-        test = value != self.value
-        fails = sum(test)
+        fails = int(self.mask(value).sum())
         if fails > 0:
             msg = f"{attr.name} failed {repr(self)[1:-1]} {fails} out of {str(len(value))} rows."
             raise ValueError(msg)
@@ -82,9 +88,12 @@ def equal_to(value):
 class _NotEqualToValidator:
     value = attrib()
 
+    def mask(self, values):
+        """Get a boolean mask of the values that fail the validator."""
+        return values == self.value
+
     def _call_data_dictionary(self, inst, attr, value):
-        test = value == self.value
-        fails = sum(test)
+        fails = int(self.mask(value).sum())
         if fails > 0:
             msg = f"{attr.name} failed {repr(self)[1:-1]} {fails} out of {str(len(value))} rows."
             raise ValueError(msg)
@@ -120,6 +129,66 @@ def not_equal_to(value):
     return _NotEqualToValidator(value)
 
 
+@attrs(repr=False, slots=True, hash=True)
+class _InRangeValidator:
+    min_value = attrib()
+    max_value = attrib()
+
+    @property
+    def bounds(self):
+        """The (min, max) values allowed, used to pick the smallest dtype holding a column."""
+        return (self.min_value, self.max_value)
+
+    def mask(self, values):
+        """Get a boolean mask of the values that fail the validator (missing values fail)."""
+        within = (values >= self.min_value) & (values <= self.max_value)
+        return ~np.asarray(pd.Series(within).fillna(False), dtype=bool)
+
+    def _call_data_dictionary(self, inst, attr, value):
+        fails = int(self.mask(value).sum())
+        if fails > 0:
+            msg = f"{attr.name} failed {repr(self)[1:-1]} {fails} out of {str(len(value))} rows."
+            raise ValueError(msg)
+
+    def __call__(self, inst, attr, value):
+        if isinstance(inst, DataDictionary):
+            return self._call_data_dictionary(inst, attr, value)
+        if not (value >= self.min_value and value <= self.max_value):  # NaN fails
+            msg = (
+                f"{attr.name} value of {str(value)} is not between {str(self.min_value)} "
+            )
+            msg += f"and {str(self.max_value)}."
+            raise ValueError(msg)
+
+    def __repr__(self):
+        return f"<in_range(min_value={str(self.min_value)}, max_value={str(self.max_value)}) validator>"
+
+
+def in_range(min_value, max_value):
+    """A validator that raises a `ValueError` if the initializer is called with a value
+    that is less than min_value or greater than max_value (the bounds are inclusive). Missing
+    values (NaN) are not in range.
+
+    Can be used under both a `DataDictionary` and a `Model`. When used under a `DataDictionary`,
+    integer columns are read with the smallest dtype holding the range (see
+    `DataDictionary.read_csv`).
+
+    Parameters
+    ----------
+    min_value : Any
+        The minimum value allowed.
+    max_value : Any
+        The maximum value allowed.
+
+    Raises
+    ------
+    ValueError
+        With a human readable error message, the attribute (of type `attr.Attribute`), the
+        bounds, and the value passed.
+    """
+    return _InRangeValidator(min_value, max_value)
+
+
 def isin(options):
     pass
 
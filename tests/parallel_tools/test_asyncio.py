@@ -0,0 +1,74 @@
+import asyncio
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_return,
+)
+from footings.jigs import Error
+from footings.parallel_tools.asyncio import create_asyncio_foreach_jig
+
+RUNNING = []
+
+
+@model(steps=["_fetch_a", "_add_a_b"])
+class AsyncModel:
+    k1 = def_parameter()
+    k2 = def_parameter()
+    a = def_parameter()
+    b = def_parameter()
+    fetched = def_return()
+    r = def_return()
+
+    @step(uses=["a"], impacts=["fetched"])
+    async def _fetch_a(self):
+        RUNNING.append(1)
+        await asyncio.sleep(0.05)
+        RUNNING.append(len(RUNNING))
+        self.fetched = self.a
+
+    @step(uses=["fetched", "b"], impacts=["r"])
+    def _add_a_b(self):
+        self.r = self.fetched + self.b
+
+
+def test_create_asyncio_foreach_jig():
+    records = [{"k1": str(i), "k2": "1", "a": 1} for i in range(4)]
+    foreach_model = create_asyncio_foreach_jig(
+        AsyncModel,
+        iterator_name="records",
+        iterator_keys=("k1",),
+        pass_iterator_keys=("k1",),
+        constant_params=("b",),
+        max_concurrency=2,
+    )
+    RUNNING.clear()
+    successes, errors = foreach_model(records=records, b=2)
+    assert successes == [(1, 3)] * 4
+    assert errors == []
+    # with a limit of 2, at most 2 models have started before one finishes
+    assert RUNNING[:3] == [1, 1, 2]
+
+    successes, errors = foreach_model(records=records + [{"k1": "x", "a": 1}], b=2)
+    assert len(successes) == 4
+    assert len(errors) == 1 and isinstance(errors[0], Error)
+
+
+@model(steps=["_fetch_a"])
+class AsyncKeylessModel:
+    a = def_parameter()
+    r = def_return()
+
+    @step(uses=["a"], impacts=["r"])
+    async def _fetch_a(self):
+        await asyncio.sleep(0)
+        self.r = self.a * 2
+
+
+def test_create_asyncio_foreach_jig_without_pass_iterator_keys():
+    records = [{"k1": str(i), "a": i} for i in range(3)]
+    foreach_model = create_asyncio_foreach_jig(
+        AsyncKeylessModel, iterator_name="records", iterator_keys=("k1",)
+    )
+    assert foreach_model(records=records) == ([0, 2, 4], [])
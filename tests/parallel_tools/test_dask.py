@@ -1,10 +1,13 @@
+from dask.delayed import Delayed
+import pytest
+
 from footings.model import (
     model,
     step,
     def_parameter,
     def_return,
 )
-from footings.parallel_tools.dask import create_dask_foreach_jig
+from footings.parallel_tools.dask import broadcast_wrapper, create_dask_foreach_jig
 
 
 @model(steps=["_add_a_b"])
@@ -30,3 +33,53 @@ def test_create_dask_foreach_jig():
         constant_params=("b",),
     )
     assert foreach_model(records=records, b=2) == ([3, 3], [])
+
+
+def test_create_dask_foreach_jig_chunked():
+    records = [{"k1": str(i), "k2": "1", "a": i} for i in range(7)]
+    records.append({"k1": "x", "a": 1})
+    kwargs = {
+        "iterator_name": "records",
+        "iterator_keys": ("k1",),
+        "pass_iterator_keys": ("k1",),
+        "constant_params": ("b",),
+    }
+    expected = create_dask_foreach_jig(Model1, **kwargs)(records=records, b=2)
+    for chunking in [{"chunk_size": 3}, {"partitions": 2}, {"chunk_size": 100}]:
+        foreach_model = create_dask_foreach_jig(Model1, **chunking, **kwargs)
+        successes, errors = foreach_model(records=records, b=2)
+        assert successes == expected[0] == [2, 3, 4, 5, 6, 7, 8]
+        assert len(errors) == len(expected[1]) == 1
+        assert errors[0].key == expected[1][0].key
+
+
+def test_dask_broadcast_constant_params():
+    handles = broadcast_wrapper({"b": 2})
+    assert isinstance(handles["b"], Delayed)
+    assert handles["b"].compute() == 2
+
+
+def test_dask_broadcast_distributed():
+    distributed = pytest.importorskip("distributed")
+    records = [{"k1": str(i), "k2": "1", "a": i} for i in range(7)]
+    records.append({"k1": "x", "a": 1})
+    kwargs = {
+        "iterator_name": "records",
+        "iterator_keys": ("k1",),
+        "pass_iterator_keys": ("k1",),
+        "constant_params": ("b",),
+    }
+    expected = create_dask_foreach_jig(Model1, **kwargs)(records=records, b=2)
+    cluster = distributed.LocalCluster(
+        n_workers=2, processes=False, dashboard_address=None
+    )
+    with cluster, distributed.Client(cluster):
+        handles = broadcast_wrapper({"b": 2})
+        assert isinstance(handles["b"], distributed.Future)
+        assert handles["b"].result() == 2
+        # the scattered params are resolved on the workers, nested in the kwargs of chunks
+        for chunking in [{}, {"chunk_size": 3}, {"partitions": 2}]:
+            foreach_model = create_dask_foreach_jig(Model1, **chunking, **kwargs)
+            successes, errors = foreach_model(records=records, b=2)
+            assert successes == expected[0] == [2, 3, 4, 5, 6, 7, 8]
+            assert len(errors) == 1 and errors[0].key == expected[1][0].key
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_return,
+)
+from footings.jigs import Error
+from footings.parallel_tools.process_pool import create_process_pool_foreach_jig
+
+
+@model(steps=["_add_a_b"])
+class Model1:
+    k1 = def_parameter()
+    k2 = def_parameter()
+    a = def_parameter()
+    b = def_parameter()
+    r = def_return()
+    pid = def_return()
+
+    @step(uses=["a", "b"], impacts=["r", "pid"])
+    def _add_a_b(self):
+        self.r = self.a + self.b
+        self.pid = os.getpid()
+
+
+PICKLED = []
+
+
+class Constant:
+    def __init__(self, value):
+        self.value = value
+
+    def __reduce__(self):
+        PICKLED.append(self.value)
+        return (Constant, (self.value,))
+
+    def __radd__(self, other):
+        return other + self.value
+
+
+def test_create_process_pool_foreach_jig():
+    records = [{"k1": str(i), "k2": "1", "a": i} for i in range(6)]
+    records.append({"k1": "x", "k2": "1", "a": None})
+    foreach_model = create_process_pool_foreach_jig(
+        Model1,
+        iterator_name="records",
+        iterator_keys=("k1",),
+        pass_iterator_keys=("k1",),
+        constant_params=("b",),
+        max_workers=2,
+        chunksize=2,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    with foreach_model.compute:
+        successes, errors = foreach_model(records=records, b=2)
+        assert [r for r, _ in successes] == [2, 3, 4, 5, 6, 7]
+        pids = {pid for _, pid in successes}
+        assert os.getpid() not in pids
+        assert len(errors) == 1 and isinstance(errors[0], Error)
+
+        # the pool is reused by later calls and batches of stream (at most max_workers pids)
+        successes, _ = foreach_model(records=records[:6], b=2)
+        pids |= {pid for _, pid in successes}
+        batches = list(foreach_model.stream(records=records[:6], b=2, batch_size=2))
+        assert [r for successes, _ in batches for r, _ in successes] == [2, 3, 4, 5, 6, 7]
+        pids |= {pid for successes, _ in batches for _, pid in successes}
+        assert len(pids) <= 2
+
+        # the pool is restarted when the constant params change
+        successes, _ = foreach_model(records=records[:6], b=3)
+        assert [r for r, _ in successes] == [3, 4, 5, 6, 7, 8]
+        assert {pid for _, pid in successes}.isdisjoint(pids)
+    assert "running=False" in repr(foreach_model.compute)
+
+    foreach_model = create_process_pool_foreach_jig(
+        {"1": Model1},
+        iterator_name="records",
+        iterator_keys=("k1", "k2"),
+        mapped_keys=("k2",),
+        pass_iterator_keys=("k1", "k2"),
+        constant_params=("b",),
+        ordered=False,
+        trusted=True,
+    )
+    with foreach_model.compute:
+        successes, errors = foreach_model(records=records[:6], b=2)
+    assert sorted(r for r, _ in successes) == [2, 3, 4, 5, 6, 7]
+    assert errors == []
+
+
+def test_process_pool_broadcast_constant_params():
+    records = [{"k1": str(i), "k2": "1", "a": i} for i in range(8)]
+    foreach_model = create_process_pool_foreach_jig(
+        Model1,
+        iterator_name="records",
+        iterator_keys=("k1",),
+        pass_iterator_keys=("k1",),
+        constant_params=("b",),
+        max_workers=2,
+        chunksize=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    PICKLED.clear()
+    with foreach_model.compute:
+        successes, errors = foreach_model(records=records, b=Constant(2))
+    assert [r for r, _ in successes] == [2, 3, 4, 5, 6, 7, 8, 9]
+    # the constant is sent once per worker process, not once per chunk
+    assert len(PICKLED) <= 2
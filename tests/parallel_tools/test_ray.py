@@ -1,38 +1,65 @@
-# import ray
-
-# from footings.model import (
-#     model,
-#     step,
-#     def_parameter,
-#     def_return,
-# )
-# from footings.parallel_tools.ray import create_ray_foreach_jig
-
-
-# ray.init(local_mode=True)
-#
-#
-# @model(steps=["_add_a_b"])
-# class Model1:
-#     k1 = def_parameter()
-#     k2 = def_parameter()
-#     a = def_parameter()
-#     b = def_parameter()
-#     r = def_return()
-#
-#     @step(uses=["a", "b"], impacts=["r"])
-#     def _add_a_b(self):
-#         self.r = self.a + self.b
-#
-#
-# def test_create_ray_foreach_jig():
-#     records = [{"k1": "1", "k2": "1", "a": 1}, {"k1": "2", "k2": "1", "a": 1}]
-#     foreach_model = create_ray_foreach_jig(
-#         Model1,
-#         iterator_name="records",
-#         iterator_keys=("k1",),
-#         pass_iterator_keys=("k1",),
-#         constant_params=("b",),
-#     )
-#     assert foreach_model(records=records, b=2) == ([3, 3], [])
-#
+import os
+
+import pytest
+
+ray = pytest.importorskip("ray")
+
+from footings.model import (  # noqa: E402
+    model,
+    step,
+    def_parameter,
+    def_return,
+)
+from footings.jigs import Error  # noqa: E402
+from footings.parallel_tools.ray import create_ray_foreach_jig  # noqa: E402
+
+
+@pytest.fixture(scope="module", autouse=True)
+def ray_local():
+    # the workers import this module to load Model1
+    runtime_env = {"env_vars": {"PYTHONPATH": os.path.dirname(__file__)}}
+    ray.init(num_cpus=2, include_dashboard=False, runtime_env=runtime_env)
+    yield
+    ray.shutdown()
+
+
+@model(steps=["_add_a_b"])
+class Model1:
+    k1 = def_parameter()
+    k2 = def_parameter()
+    a = def_parameter()
+    b = def_parameter()
+    r = def_return()
+
+    @step(uses=["a", "b"], impacts=["r"])
+    def _add_a_b(self):
+        self.r = self.a + self.b
+
+
+def test_create_ray_foreach_jig():
+    records = [{"k1": "1", "k2": "1", "a": 1}, {"k1": "2", "k2": "1", "a": 1}]
+    foreach_model = create_ray_foreach_jig(
+        Model1,
+        iterator_name="records",
+        iterator_keys=("k1",),
+        pass_iterator_keys=("k1",),
+        constant_params=("b",),
+    )
+    assert foreach_model(records=records, b=2) == ([3, 3], [])
+
+
+def test_create_ray_foreach_jig_chunked():
+    records = [{"k1": str(i), "k2": "1", "a": i} for i in range(7)]
+    records.append({"k1": "x", "k2": "1", "a": None})
+    for options in [{"chunk_size": 3}, {"partitions": 2, "wait": True}]:
+        foreach_model = create_ray_foreach_jig(
+            Model1,
+            iterator_name="records",
+            iterator_keys=("k1",),
+            pass_iterator_keys=("k1",),
+            constant_params=("b",),
+            **options,
+        )
+        successes, errors = foreach_model(records=records, b=2)
+        assert sorted(successes) == [2, 3, 4, 5, 6, 7, 8]
+        assert len(errors) == 1 and isinstance(errors[0], Error)
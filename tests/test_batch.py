@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+from attr.validators import instance_of
+
+from footings.batch import run_batch, validate_records
+from footings.validators import not_equal_to
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_sensitivity,
+    def_intermediate,
+    def_return,
+    ModelRunError,
+)
+
+
+@model(steps=["_discount", "_project"])
+class Reserve:
+    policy_id = def_parameter()
+    benefit = def_parameter()
+    duration = def_parameter()
+    rate = def_sensitivity(default=0.05)
+    factor = def_intermediate()
+    reserve = def_return()
+    projection = def_return()
+
+    @step(uses=["duration", "rate"], impacts=["factor"], metadata={"vectorize": True})
+    def _discount(self):
+        self.factor = (1 + self.rate) ** -np.asarray(self.duration)
+
+    @step(
+        uses=["policy_id", "benefit", "factor", "duration"],
+        impacts=["reserve", "projection"],
+        metadata={"vectorize": True},
+    )
+    def _project(self):
+        self.reserve = np.asarray(self.benefit) * self.factor
+        ids = np.atleast_1d(self.policy_id)
+        durations = np.atleast_1d(self.duration)
+        self.projection = pd.DataFrame(
+            {
+                "policy_id": np.repeat(ids, durations),
+                "t": np.concatenate([np.arange(d) for d in durations]),
+            }
+        )
+
+
+def test_run_batch():
+    records = pd.DataFrame(
+        {"policy_id": ["a", "b", "c"], "benefit": [100, 200, 300], "duration": [1, 2, 3]}
+    )
+    results = run_batch(Reserve, records, keys=("policy_id",))
+    expected = [Reserve(**record).run() for record in records.to_dict(orient="records")]
+    assert len(results) == 3
+    for (reserve, projection), (exp_reserve, exp_projection) in zip(results, expected):
+        assert reserve == pytest.approx(float(exp_reserve))
+        pd.testing.assert_frame_equal(projection, exp_projection)
+
+    # a projection with many rows per record cannot be split without the keys
+    with pytest.raises(ModelRunError, match="cannot be split"):
+        run_batch(Reserve, records.iloc[1:])
+
+    reserve, projection = run_batch(
+        Reserve, records, constant_params={"rate": 0.0}, split=False
+    )
+    assert list(reserve) == [100, 200, 300]
+    assert len(projection) == 6
+
+
+def test_run_batch_errors():
+    @model(steps=["_calc"])
+    class NotVectorized:
+        x = def_parameter()
+        out = def_return()
+
+        @step(uses=["x"], impacts=["out"])
+        def _calc(self):
+            self.out = self.x
+
+    with pytest.raises(ModelRunError):
+        run_batch(NotVectorized, {"x": np.array([1, 2])})
+
+    with pytest.raises(ModelRunError):
+        run_batch(Reserve, {"benefit": [1], "duration": [1], "policy_id": [1], "z": [1]})
+
+
+def test_validate_records():
+    @model(steps=["_calc"])
+    class Validated:
+        x = def_parameter(validator=[instance_of(int), not_equal_to(0)])
+        out = def_return()
+
+        @step(uses=["x"], impacts=["out"], metadata={"vectorize": True})
+        def _calc(self):
+            self.out = self.x
+
+    assert validate_records(Validated, pd.DataFrame({"x": [1, 2, 2]}))
+    with pytest.raises(ModelRunError, match=r"\[x\]"):
+        validate_records(Validated, pd.DataFrame({"x": [1, 0]}))
+    with pytest.raises(ModelRunError, match=r"\[x\]"):
+        validate_records(Validated, {"x": [1, "a"]})
@@ -0,0 +1,253 @@
+import pickle
+from threading import Thread
+
+import pytest
+
+from footings.cache import LRUCache, DiskCache, fingerprint, shared_cache
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_sensitivity,
+    def_intermediate,
+    def_return,
+    ModelCreationError,
+)
+
+
+def test_fingerprint():
+    assert fingerprint(1, "a", [1, 2]) == fingerprint(1, "a", [1, 2])
+    assert fingerprint(1, "a", [1, 2]) != fingerprint(1, "a", [1, 3])
+    with pytest.raises(TypeError):
+        fingerprint(lambda x: x)
+
+
+def test_lru_cache():
+    cache = LRUCache(10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"  # a is now most recently used
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.nbytes == 8
+    cache.set("d", b"12345678901")  # larger than budget
+    assert cache.get("d") is None
+    assert len(cache) == 2
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (3, 2, 1, 2)
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+    cache = LRUCache(100, max_entries=2)
+    for key in "abc":
+        cache.set(key, b"1")
+    assert cache.get("a") is None and len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_shared_cache():
+    cache = shared_cache("test-shared", max_entries=10)
+    assert shared_cache("test-shared") is cache
+    assert cache.max_entries == 10
+    cache.set("a", b"1")
+    assert pickle.loads(pickle.dumps(cache)) is cache
+    new = pickle.loads(pickle.dumps(LRUCache(10)))
+    assert isinstance(new, LRUCache) and len(new) == 0
+
+
+def test_disk_cache(tmp_path):
+    disk = DiskCache(tmp_path / "cache")
+    assert disk.get("a") is None
+    disk.set("a", b"1234")
+    assert disk.get("a") == b"1234"
+
+    cache = LRUCache(10, backing=disk)
+    assert cache.get("a") == b"1234"
+    cache.set("b", b"5678")
+    assert DiskCache(tmp_path / "cache").get("b") == b"5678"
+
+
+def test_disk_cache_threads(tmp_path):
+    disk = DiskCache(tmp_path / "cache", version="1")
+    errors = []
+
+    def set_many():
+        try:
+            for _ in range(50):
+                disk.set("a", b"1234")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=set_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert disk.get("a") == b"1234"
+    assert (tmp_path / "cache" / "1" / "a.pkl").exists()
+    assert list((tmp_path / "cache" / "1").glob("*.tmp")) == []
+    assert DiskCache(tmp_path / "cache", version="2").get("a") is None
+
+
+def test_cached_step():
+    cache = LRUCache(1_000_000)
+
+    @model(steps=["_load", "_calculate"])
+    class Test:
+        table = def_parameter()
+        x = def_parameter()
+        shock = def_sensitivity(default=1)
+        loaded = def_intermediate()
+        out = def_return()
+
+        @step(uses=["table", "shock"], impacts=["loaded"], metadata={"cache": cache})
+        def _load(self):
+            self.loaded = [v * self.shock for v in self.table]
+
+        @step(uses=["loaded", "x"], impacts=["out"])
+        def _calculate(self):
+            self.out = sum(self.loaded) + self.x
+
+    assert Test(table=[1, 2], x=1).run() == 4
+    assert Test(table=[1, 2], x=2).run() == 5
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+    assert Test(table=[1, 2], x=2, shock=2).run() == 8
+    assert Test(table=[1, 3], x=2).run() == 6
+    assert cache.stats.hits == 1 and cache.stats.misses == 3
+    assert len(cache) == 3
+
+
+RATES = {"a": 1.0}
+
+
+def _rate(name):
+    return RATES[name]
+
+
+def test_cached_step_closure_and_globals():
+    cache = LRUCache(1_000_000)
+    factors = [2]
+
+    @model(steps=["_calculate"])
+    class Test:
+        a = def_parameter()
+        out = def_return()
+
+        @step(uses=["a"], impacts=["out"], metadata={"cache": cache})
+        def _calculate(self):
+            self.out = self.a * _rate("a") * factors[0]
+
+    assert Test(a=10).run() == Test(a=10).run() == 20.0
+    assert cache.stats.hits == 1
+    factors[0] = 3  # an edited closure value
+    assert Test(a=10).run() == 30.0
+    RATES["a"] = 2.0  # an edited table read by a module function
+    try:
+        assert Test(a=10).run() == 60.0
+    finally:
+        RATES["a"] = 1.0
+    assert cache.stats.hits == 1 and cache.stats.misses == 3
+
+
+EDITED_MODEL = """
+@model(steps=["_calculate"])
+class Edited:
+    a = def_parameter()
+    out = def_return()
+
+    @step(uses=["a"], impacts=["out"], metadata={{"cache": cache}})
+    def _calculate(self, factor={default}):
+        self.out = self.a * {factor} * factor
+"""
+
+
+def test_cached_step_code_edit(tmp_path):
+    def create(factor, default=1):
+        namespace = {
+            "__name__": __name__,
+            "model": model,
+            "step": step,
+            "def_parameter": def_parameter,
+            "def_return": def_return,
+            "cache": LRUCache(1_000_000, backing=DiskCache(tmp_path / "cache")),
+        }
+        exec(EDITED_MODEL.format(factor=factor, default=default), namespace)
+        return namespace["Edited"], namespace["cache"]
+
+    model_1, cache = create(1.05)
+    assert model_1(a=100).run() == pytest.approx(105.0)
+    model_2, cache = create(1.05)
+    assert model_2(a=100).run() == pytest.approx(105.0)
+    assert cache.stats.hits == 1  # restored from disk
+    model_3, cache = create(1.10)
+    assert model_3(a=100).run() == pytest.approx(110.0)
+    model_4, cache = create(1.10, default=2)
+    assert model_4(a=100).run() == pytest.approx(220.0)
+    assert cache.stats.hits == 0
+
+
+def test_cached_step_cache_key():
+    cache = shared_cache("test-cache-key")
+
+    @model(steps=["_load", "_calculate"])
+    class Test:
+        table = def_parameter()
+        x = def_parameter()
+        loaded = def_intermediate()
+        out = def_return()
+
+        @step(
+            uses=["table", "x"],
+            impacts=["loaded"],
+            metadata={"cache": cache, "cache_key": ("table",)},
+        )
+        def _load(self):
+            self.loaded = [v * 2 for v in self.table]
+
+        @step(uses=["loaded", "x"], impacts=["out"])
+        def _calculate(self):
+            self.out = sum(self.loaded) + self.x
+
+    assert [Test(table=[1, 2], x=x).run() for x in range(3)] == [6, 7, 8]
+    assert cache.stats.hits == 2 and cache.stats.misses == 1
+
+    # another model class with the same step shares the entries
+    @model(steps=["_load", "_calculate"])
+    class Other:
+        table = def_parameter()
+        y = def_parameter()
+        loaded = def_intermediate()
+        out = def_return()
+
+        @step(
+            uses=["table", "y"],
+            impacts=["loaded"],
+            metadata={"cache": cache, "cache_key": ("table",)},
+        )
+        def _load(self):
+            self.loaded = [v * 2 for v in self.table]
+
+        @step(uses=["loaded", "y"], impacts=["out"])
+        def _calculate(self):
+            self.out = max(self.loaded) * self.y
+
+    assert Other(table=[1, 2], y=10).run() == 40
+    assert cache.stats.hits == 3 and cache.stats.misses == 1
+
+    with pytest.raises(ModelCreationError):
+
+        @model(steps=["_load"])
+        class Invalid:
+            table = def_parameter()
+            out = def_return()
+
+            @step(
+                uses=["table"],
+                impacts=["out"],
+                metadata={"cache": cache, "cache_key": ("x",)},
+            )
+            def _load(self):
+                self.out = self.table
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from footings.checkpoint import Checkpoint
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_intermediate,
+    def_return,
+    ModelRunError,
+)
+
+CALLS = []
+FAIL = []
+
+
+@model(steps=["_load", "_expand", "_calculate"])
+class CheckpointModel:
+    x = def_parameter()
+    loaded = def_intermediate()
+    frame = def_intermediate()
+    out = def_return()
+
+    @step(uses=["x"], impacts=["loaded"])
+    def _load(self):
+        CALLS.append("_load")
+        self.loaded = {"x": self.x}
+
+    @step(uses=["loaded"], impacts=["frame"])
+    def _expand(self):
+        CALLS.append("_expand")
+        self.frame = pd.DataFrame({"t": range(self.loaded["x"])})
+
+    @step(uses=["frame"], impacts=["out"])
+    def _calculate(self):
+        CALLS.append("_calculate")
+        if len(FAIL) > 0:
+            raise ValueError("fail")
+        self.out = self.frame["t"].sum()
+
+
+@pytest.mark.parametrize("parquet", [True, False])
+def test_checkpoint_resume(tmp_path, parquet):
+    checkpoint = Checkpoint(tmp_path, steps=("_expand",), parquet=parquet)
+    FAIL.append(True)
+    with pytest.raises(ModelRunError):
+        CheckpointModel(x=4).run(checkpoint=checkpoint)
+    FAIL.clear()
+    assert checkpoint.exists(CheckpointModel(x=4), "_expand")
+    assert checkpoint.exists(CheckpointModel(x=4), "_load") is False
+    frame_file = tmp_path / "CheckpointModel" / "_expand" / "frame.parquet"
+    assert frame_file.exists() is parquet
+
+    CALLS.clear()
+    assert CheckpointModel(x=4).resume("_calculate", checkpoint) == 6
+    assert CALLS == ["_calculate"]
+
+    # the checkpoint was saved with different parameters
+    with pytest.raises(ModelRunError):
+        CheckpointModel(x=5).resume("_calculate", checkpoint)
+
+    # no checkpoint was saved after _load
+    with pytest.raises(ModelRunError):
+        CheckpointModel(x=4).resume("_expand", checkpoint)
+
+
+def test_checkpoint_resume_all_steps(tmp_path):
+    checkpoint = Checkpoint(tmp_path)
+    assert CheckpointModel(x=4).run(checkpoint=checkpoint) == 6
+    CALLS.clear()
+    assert CheckpointModel(x=4).resume("_expand", checkpoint) == 6
+    assert CALLS == ["_expand", "_calculate"]
+    CALLS.clear()
+    assert CheckpointModel(x=4).resume("_load", checkpoint) == 6
+    assert CALLS == ["_load", "_expand", "_calculate"]
+    with pytest.raises(ModelRunError):
+        CheckpointModel(x=4).resume("_zzz", checkpoint)
@@ -2,6 +2,7 @@ from functools import partial
 import re
 
 from attr import asdict
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,7 +14,7 @@ from footings.data_dictionary import (
     DataDictionary,
     data_dictionary,
 )
-from footings.validators import equal_to
+from footings.validators import equal_to, in_range
 from footings.exceptions import (
     DataDictionaryValidatorsConversionError,
     DataDictionaryPandasDtypeConversionError,
@@ -330,3 +331,212 @@ class TestDataDictionary:
     #    metadata={})
     #    """
     #    assert clean_str(repr(DD)) == clean_str(repr_str)
+
+
+def test_validation_report():
+    def positive(inst, attr, value):  # a validator without a mask method
+        if (value <= 0).any():
+            raise ValueError("not positive")
+
+    @data_dictionary
+    class ReportDD:
+        COL1 = def_column(dtype="int", validator=[equal_to(1)])
+        COL2 = def_column(dtype="int", validator=[positive])
+
+    df = pd.DataFrame({"COL1": [1, 2, 1, 3], "COL2": [1, 1, -1, 1]})
+    report = ReportDD.validation_report(df)
+    assert report.valid is False
+    assert report.rows == 4
+    assert list(report.failing_rows) == [1, 2, 3]
+    assert report.column_failures == {"COL1": 2, "COL2": 1}
+    assert report.validator_failures[("COL1", "equal_to(value=1) validator")] == 2
+    assert report.summary().to_dict(orient="list") == {
+        "column": ["COL1", "COL2"],
+        "passed": [2, 3],
+        "failed": [2, 1],
+    }
+    passed, failed = report.split(df)
+    assert list(passed.index) == [0] and list(failed.index) == [1, 2, 3]
+
+    assert ReportDD.validation_report(df.iloc[[0]]).valid is True
+    with pytest.raises(DataDictionaryValidateError):
+        ReportDD.validate(df)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_validate_file(tmp_path, suffix):
+    @data_dictionary
+    class FileDD:
+        COL1 = def_column(dtype="int", validator=[equal_to(1)])
+        COL2 = def_column(dtype="string")
+        COL3 = def_column(dtype="datetime64[ns]")
+
+    df = pd.DataFrame(
+        {
+            "COL1": [1, 2, 1, 1, 3],
+            "COL2": ["a", "b", "c", "d", "e"],
+            "COL3": pd.to_datetime(["2020-01-01"] * 5),
+        }
+    )
+    file = tmp_path / f"data{suffix}"
+    if suffix == ".csv":
+        df.to_csv(file, index=False)
+    else:
+        df.to_parquet(file, index=False)
+
+    chunks = list(FileDD.iter_file(file, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [chunks[0][col].dtype.name for col in FileDD.columns] == [
+        "int64",
+        "string",
+        "datetime64[ns]",
+    ]
+
+    report = FileDD.validate_file(file, chunksize=2)
+    assert report.rows == 5
+    assert list(report.failing_rows) == [1, 4]
+    assert report.column_failures == {"COL1": 2}
+    assert report.messages == ("The column [COL1] failed equal_to(value=1) validator.",)
+
+    with pytest.raises(ValueError):
+        FileDD.validate_file(tmp_path / "data.txt")
+
+    renamed = file.rename(tmp_path / "data.txt")
+    file_type = suffix[1:]
+    report = FileDD.validate_file(renamed, chunksize=2, file_type=file_type)
+    assert list(report.failing_rows) == [1, 4]
+    assert (
+        sum(len(chunk) for chunk in FileDD.iter_file(renamed, file_type=file_type)) == 5
+    )
+
+
+def test_validation_report_in_range_missing():
+    @data_dictionary
+    class RangeDD:
+        AGE = def_column(dtype="float", validator=[in_range(0, 120)])
+        COUNT = def_column(dtype="Int64", validator=[in_range(0, 10)])
+
+    df = pd.DataFrame(
+        {
+            "AGE": [20.0, np.nan, 130.0, 40.0],
+            "COUNT": pd.Series([1, 2, None, 3], dtype="Int64"),
+        }
+    )
+    report = RangeDD.validation_report(df)
+    assert list(report.failing_rows) == [1, 2]
+    assert report.column_failures == {"AGE": 2, "COUNT": 1}
+
+
+def test_validate_file_unparseable(tmp_path):
+    @data_dictionary
+    class ParseDD:
+        AGE = def_column(dtype="int", validator=[in_range(0, 120)])
+        AMOUNT = def_column(dtype="float")
+        ISSUED = def_column(dtype="datetime64[ns]")
+
+    file = tmp_path / "data.csv"
+    file.write_text(
+        "AGE,AMOUNT,ISSUED\n"
+        "20,1.5,2020-01-01\n"
+        "x,2.5,2020-01-01\n"
+        "30,y,2020-01-01\n"
+        "200,3.5,2020-01-01\n"
+        "40,4.5,not a date\n"
+        ",5.5,2020-01-01\n"
+    )
+    with pytest.raises(DataDictionaryValidateError):
+        list(ParseDD.iter_file(file))
+
+    report = ParseDD.validate_file(file, chunksize=4)
+    assert report.rows == 6
+    assert list(report.failing_rows) == [1, 2, 3, 4, 5]
+    assert report.column_failures == {"AGE": 3, "AMOUNT": 1, "ISSUED": 1}
+    assert report.validator_failures[("AGE", "type conversion to [int64]")] == 2
+    assert report.validator_failures[("AGE", str(in_range(0, 120))[1:-1])] == 1
+    assert not any("different from type" in msg for msg in report.messages)
+    assert (
+        "The column [AGE] has values that cannot be converted to type [int64]."
+        in report.messages
+    )
+    passed, _ = report.split(pd.read_csv(file))
+    assert list(passed.index) == [0]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_read_file(tmp_path, suffix):
+    @data_dictionary
+    class ReadDD:
+        AGE = def_column(dtype="int", validator=[in_range(0, 120)])
+        GENDER = def_column(dtype="string")
+        POLICY = def_column(dtype="string")
+        AMOUNT = def_column(dtype="float")
+
+    n = 10
+    df = pd.DataFrame(
+        {
+            "AGE": [20 + i for i in range(n)],
+            "GENDER": ["M", "F"] * (n // 2),
+            "POLICY": [f"P{i}" for i in range(n)],
+            "AMOUNT": [float(i) for i in range(n)],
+            "EXTRA": [1] * n,
+        }
+    )
+    file = tmp_path / f"data{suffix}"
+    if suffix == ".csv":
+        df.to_csv(file, index=False)
+        read = ReadDD.read_csv
+    else:
+        df.to_parquet(file, index=False)
+        read = ReadDD.read_parquet
+
+    result = read(file, chunksize=3)
+    assert list(result.columns) == ["AGE", "GENDER", "POLICY", "AMOUNT"]
+    assert [dtype.name for dtype in result.dtypes] == [
+        "uint8",
+        "string",
+        "string",
+        "float64",
+    ]
+    assert result["AGE"].tolist() == df["AGE"].tolist()
+    assert ReadDD.validate(result) is True
+
+    result = read(file, chunksize=3, categorical=True, downcast=False)
+    assert result["AGE"].dtype.name == "int64"
+    assert result["GENDER"].dtype.name == "category"
+    assert result["POLICY"].dtype.name == "string"  # high cardinality
+    assert result["GENDER"].tolist() == df["GENDER"].tolist()
+    assert ReadDD.validate(result) is True
+    assert ReadDD.validate(read(file, categorical=True)) is True
+
+    keyword = "usecols" if suffix == ".csv" else "columns"
+    result = read(file, categorical=True, **{keyword: ["GENDER", "AGE"]})
+    assert list(result.columns) == ["AGE", "GENDER"]
+    assert result["GENDER"].dtype.name == "category"
+    with pytest.raises(ValueError, match="EXTRA"):
+        read(file, **{keyword: ["AGE", "EXTRA"]})
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_read_file_errors(tmp_path, suffix):
+    @data_dictionary
+    class ReadDD:
+        AGE = def_column(dtype="int")
+        NOTE = def_column()
+
+    file = tmp_path / f"data{suffix}"
+    df = pd.DataFrame({"AGE": [1, 2], "NOTE": ["a", "b"]})
+    read = ReadDD.read_csv if suffix == ".csv" else ReadDD.read_parquet
+
+    (df.to_csv if suffix == ".csv" else df.to_parquet)(file, index=False)
+    result = read(file, categorical=("NOTE",))
+    assert result["NOTE"].dtype.name == "object"  # high cardinality without a dtype
+
+    empty = df.iloc[0:0]
+    (empty.to_csv if suffix == ".csv" else empty.to_parquet)(file, index=False)
+    result = read(file)
+    assert list(result.columns) == ["AGE", "NOTE"] and len(result) == 0
+
+    missing = df[["NOTE"]]
+    (missing.to_csv if suffix == ".csv" else missing.to_parquet)(file, index=False)
+    with pytest.raises(DataDictionaryValidateError):
+        read(file)
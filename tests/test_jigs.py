@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getfullargspec, signature
 
+import pytest
+
 from footings.model import (
     model,
     step,
     def_parameter,
+    def_sensitivity,
+    def_meta,
     def_return,
 )
 
@@ -48,6 +53,42 @@ def test_wrapped_model():
     assert signature(model) == signature(Model1)
     assert isinstance(model(k1="k1", a=1, b=2), Error)
 
+    trusted = WrappedModel(
+        Model1, iterator_keys=("k1",), pass_iterator_keys=("k1",), trusted=True
+    )
+    assert trusted(k1="1", k2="2", a=1, b=2) == 3
+    assert isinstance(trusted(k1="k1", a=1, b=2), Error)
+
+    pooled = WrappedModel(
+        Model1, iterator_keys=("k1",), pass_iterator_keys=("k1",), pooled=True
+    )
+    assert pooled(k1="1", k2="2", a=1, b=2) == 3
+    assert pooled(k1="1", k2="2", a=2, b=2) == 4
+    assert isinstance(pooled(k1="k1", a=1, b=2), Error)
+    assert pooled(k1="1", k2="2", a=1, b=1) == 2
+
+
+def test_wrapped_model_pooled_converted_defaults():
+    @model(steps=["_calc"])
+    class Converted:
+        k1 = def_parameter()
+        a = def_parameter()
+        s = def_sensitivity(default="2", converter=int)
+        m = def_meta(meta="10", converter=int)
+        r = def_return()
+
+        @step(uses=["a", "s", "m"], impacts=["r"])
+        def _calc(self):
+            self.r = self.a * self.s + self.m
+
+    unpooled = WrappedModel(Converted, iterator_keys=("k1",), pass_iterator_keys=("k1",))
+    pooled = WrappedModel(
+        Converted, iterator_keys=("k1",), pass_iterator_keys=("k1",), pooled=True
+    )
+    calls = [{"k1": "1", "a": 3}, {"k1": "2", "a": 4, "s": 3}, {"k1": "3", "a": 5}]
+    expected = [unpooled(**kwargs) for kwargs in calls]
+    assert [pooled(**kwargs) for kwargs in calls] == expected == [16, 22, 20]
+
 
 def test_mapped_model():
     mapping = {
@@ -97,6 +138,84 @@ def test_foreach_model():
     assert foreach2(records=records, b=2) == ([3, -1], [])
     assert getfullargspec(foreach1).kwonlyargs == ["records", "b"]
 
+    # test chunks
+    chunks = []
+
+    def chunk_wrap(func):
+        def inner(model, entries, kwargs):
+            chunks.append(len(entries))
+            return func(model, entries, kwargs)
+
+        return inner
+
+    records3 = [{"k1": "1", "k2": "1", "a": i} for i in range(5)] + [
+        {"k1": "x", "a": None}
+    ]
+    foreach3 = ForeachJig.create(
+        model=model,
+        iterator_name="records",
+        constant_params=("b",),
+        chunk_size=4,
+        chunk_wrap=chunk_wrap,
+    )
+    successes, errors = foreach3(records=(r for r in records3), b=2)
+    assert successes == [2, 3, 4, 5, 6]
+    assert len(errors) == 1 and isinstance(errors[0], Error)
+    assert chunks == [4, 2]
+    foreach4 = ForeachJig.create(
+        model=model, iterator_name="records", constant_params=("b",), partitions=4
+    )
+    assert foreach4(records=records3[:5], b=2) == ([2, 3, 4, 5, 6], [])
+    with pytest.raises(ValueError):
+        ForeachJig.create(model=model, iterator_name="records", chunk_size=0)
+
+    # test broadcast
+    broadcasts = []
+
+    def broadcast(kwargs):
+        broadcasts.append(kwargs)
+        return {k: v * 10 for k, v in kwargs.items()}
+
+    foreach5 = ForeachJig.create(
+        model=model, iterator_name="records", constant_params=("b",), broadcast=broadcast
+    )
+    assert foreach5(records=records, b=2) == ([21, 21], [])
+    assert broadcasts == [{"b": 2}]
+
+
+def test_foreach_stream():
+    model = WrappedModel(Model1, iterator_keys=("k1",), pass_iterator_keys=("k1",))
+    foreach = ForeachJig.create(
+        model=model, iterator_name="records", constant_params=("b",), success_wrap=sum
+    )
+    consumed = []
+
+    def records(n):
+        for i in range(n):
+            consumed.append(i)
+            yield {"k1": str(i), "k2": "1", "a": i if i != 3 else None}
+
+    # batches are run lazily as requested
+    stream = foreach.stream(records=records(5), b=2, batch_size=2)
+    assert next(stream) == (5, [])
+    assert consumed == [0, 1]
+    successes, errors = next(stream)
+    assert successes == 4 and len(errors) == 1 and isinstance(errors[0], Error)
+    assert list(stream) == [(6, [])]
+
+    # with an executor at most max_in_flight items are read ahead of the consumer
+    consumed.clear()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stream = foreach.stream(
+            records=records(10), b=2, executor=executor, max_in_flight=2, ordered=True
+        )
+        assert next(stream) == (2, [])
+        assert len(consumed) <= 3
+        assert [ret[0] for ret in stream if ret[0] != []] == [3, 4, 6, 7, 8, 9, 10, 11]
+
+        stream = foreach.stream(records=records(10), b=2, batch_size=3, executor=executor)
+        assert sorted(ret[0] for ret in stream) == [9, 11, 13, 27]
+
 
 def test_create_foreach_jig():
     records = [{"k1": "1", "k2": "1", "a": 1}, {"k1": "2", "k2": "1", "a": 1}]
@@ -109,3 +228,16 @@ def test_create_foreach_jig():
         constant_params=("b",),
     )
     assert foreach_model(records=records, b=2) == ([3, 3], [])
+
+    mapping = {"1": Model1, "2": Model2}
+    for options in [{}, {"trusted": True}, {"pooled": True}]:
+        foreach_mapped = create_foreach_jig(
+            mapping,
+            iterator_name="records",
+            iterator_keys=("k1",),
+            mapped_keys=("k1",),
+            pass_iterator_keys=("k1",),
+            constant_params=("b",),
+            **options,
+        )
+        assert foreach_mapped(records=records, b=2) == ([3, -1], [])
@@ -1,7 +1,11 @@
+import asyncio
 import inspect
+import pickle
+
 import pytest
 
-from attr import attrs, attrib
+from attr import attrs, attrib, Factory
+from attr.validators import instance_of
 from attr.setters import frozen, FrozenAttributeError
 from numpydoc.docscrape import Parameter
 
@@ -17,6 +21,8 @@ from footings.model import (
     FootingsDoc,
     ModelCreationError,
     ModelRunError,
+    RunPlan,
+    _LazyModelDoc,
 )
 
 
@@ -295,3 +301,364 @@ def test_model_run():
                 self.intermediate = self.parameter
 
         ModelNoSteps(parameter=1).run()
+
+
+def test_model_rerun():
+    calls = []
+
+    @model(steps=["_load", "_add", "_shock", "_subtract"])
+    class Test:
+        x = def_parameter()
+        y = def_parameter()
+        z = def_parameter()
+        shock = def_sensitivity(default=1)
+        table = def_intermediate()
+        out = def_return()
+        shocked = def_return()
+
+        @step(uses=["x"], impacts=["table"])
+        def _load(self):
+            calls.append("_load")
+            self.table = [self.x]
+
+        @step(uses=["table", "y"], impacts=["out"])
+        def _add(self):
+            calls.append("_add")
+            self.out = self.table[0] + self.y
+
+        @step(uses=["table", "shock"], impacts=["shocked"])
+        def _shock(self):
+            calls.append("_shock")
+            self.shocked = self.table[0] * self.shock
+
+        @step(uses=["out", "z"], impacts=["out"])
+        def _subtract(self):
+            calls.append("_subtract")
+            self.out = self.out - self.z
+
+    base = Test(x=1, y=2, z=3)
+    assert base.run() == (0, 1)
+
+    calls.clear()
+    assert base.rerun(shock=5) == (0, 5)
+    assert calls == ["_shock"]
+
+    # out is overwritten by _subtract so _add needs to be rerun too
+    calls.clear()
+    assert base.rerun(z=1) == (2, 1)
+    assert calls == ["_add", "_subtract"]
+
+    calls.clear()
+    assert base.rerun(x=2, shock=2) == Test(x=2, y=2, z=3, shock=2).run()
+    assert calls[:4] == ["_load", "_add", "_shock", "_subtract"]
+
+    # base model is unchanged
+    assert (base.out, base.shocked) == (0, 1)
+
+    with pytest.raises(ModelRunError):
+        base.rerun(table=[1])
+
+
+def test_model_rerun_requires_full_run():
+    @model(steps=["_add", "_report"])
+    class Test:
+        a = def_parameter()
+        s = def_sensitivity(default=1)
+        total = def_intermediate(init_value=None)
+        out = def_return()
+        report = def_return()
+
+        @step(uses=["a", "s"], impacts=["total"])
+        def _add(self):
+            self.total = self.a + self.s
+
+        @step(uses=["total"], impacts=["out", "report"])
+        def _report(self):
+            self.out = self.total * 2
+            self.report = f"total={self.total}"
+
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        Test(a=2).rerun(s=3)  # not run
+
+    pruned = Test(a=2)
+    pruned.run(returns="out")
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        pruned.rerun(s=3)
+
+    released = Test(a=2)
+    released.run(release_intermediates=True)
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        released.rerun(s=3)
+
+    partial_run = Test(a=2)
+    partial_run.run(to_step="_add")
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        partial_run.rerun(s=3)
+
+    full = Test(a=2)
+    full.run()
+    assert full.rerun(s=3) == (10, "total=5")
+    rebound = Test(a=2)
+    rebound.run()
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        rebound.rebind(a=3).rerun(s=3)
+    full.run(returns="out")  # a later partial run invalidates the full run
+    with pytest.raises(ModelRunError, match="not completed a full run"):
+        full.rerun(s=3)
+
+
+def test_model_run_returns():
+    calls = []
+
+    @model(steps=["_base", "_reserve", "_report", "_adjust"])
+    class Test:
+        x = def_parameter()
+        base = def_intermediate()
+        reserve = def_return()
+        report = def_return()
+
+        @step(uses=["x"], impacts=["base"])
+        def _base(self):
+            calls.append("_base")
+            self.base = self.x + 1
+
+        @step(uses=["base"], impacts=["reserve"])
+        def _reserve(self):
+            calls.append("_reserve")
+            self.reserve = self.base * 2
+
+        @step(uses=["base"], impacts=["report"])
+        def _report(self):
+            calls.append("_report")
+            self.report = f"base = {self.base}"
+
+        @step(uses=["reserve"], impacts=["reserve"])
+        def _adjust(self):
+            calls.append("_adjust")
+            self.reserve = self.reserve + 1
+
+    assert Test(x=1).run(returns=("reserve",)) == 5
+    assert calls == ["_base", "_reserve", "_adjust"]
+
+    calls.clear()
+    assert Test(x=1).run(returns=("report", "reserve")) == ("base = 2", 5)
+    assert calls == ["_base", "_reserve", "_report", "_adjust"]
+    assert Test(x=1).run(returns="report") == "base = 2"
+
+    with pytest.raises(ModelRunError):
+        Test(x=1).run(returns=("base",))
+
+
+def test_model_run_release_intermediates():
+    seen = {}
+
+    @model(steps=["_expand", "_total", "_check"])
+    class Test:
+        x = def_parameter()
+        frame = def_intermediate()
+        total = def_intermediate(init_value=0)
+        out = def_return()
+
+        @step(uses=["x"], impacts=["frame"])
+        def _expand(self):
+            self.frame = list(range(self.x))
+
+        @step(uses=["frame"], impacts=["total"])
+        def _total(self):
+            self.total = sum(self.frame)
+
+        @step(uses=["total"], impacts=["out"])
+        def _check(self):
+            seen["frame"] = self.frame
+            self.out = self.total
+
+    test = Test(x=4)
+    assert test.run(release_intermediates=True) == 6
+    assert seen["frame"] is None
+    assert test.frame is None
+    assert test.total == 0
+
+    test = Test(x=4)
+    assert test.run() == 6
+    assert seen["frame"] == [0, 1, 2, 3]
+    assert test.total == 6
+
+    with pytest.raises(ModelRunError):
+        Test(x=4).run(to_step="_total", release_intermediates=True)
+
+
+def test_model_run_plan():
+    @model(steps=["_add", "_subtract"])
+    class Test:
+        x = def_parameter()
+        y = def_parameter()
+        added = def_return()
+        subtracted = def_return()
+
+        @step(uses=["x", "y"], impacts=["added"])
+        def _add(self):
+            self.added = self.x + self.y
+
+        @step(uses=["x", "y"], impacts=["subtracted"])
+        def _subtract(self):
+            self.subtracted = self.x - self.y / 0
+
+    plan = Test.__model_run_plan__
+    assert isinstance(plan, RunPlan)
+    assert [name for name, _, _ in plan.steps] == ["_add", "_subtract"]
+    with pytest.raises(ModelRunError, match=r"At step \[_subtract\]"):
+        Test(x=1, y=2).run()
+
+
+def test_model_from_trusted():
+    @model(steps=["_calc"])
+    class Test:
+        x = def_parameter(converter=int, validator=instance_of(int))
+        s = def_sensitivity(default=2)
+        frame = def_intermediate(init_value=Factory(list))
+        out = def_return()
+
+        @step(uses=["x", "s", "frame"], impacts=["out"])
+        def _calc(self):
+            self.frame.append(self.x * self.s)
+            self.out = sum(self.frame)
+
+    assert Test.from_trusted(x=1).run() == Test(x=1).run() == 2
+    assert Test.from_trusted(x=1, s=3).run() == 3
+    assert Test.from_trusted(x=1.5).x == 1.5  # no converter or validator
+    with pytest.raises(ValueError):
+        Test(x="a")
+    with pytest.raises(TypeError):
+        Test.from_trusted(s=1)
+    with pytest.raises(TypeError):
+        Test.from_trusted(x=1, z=1)
+    with pytest.raises(FrozenAttributeError):
+        Test.from_trusted(x=1).x = 2
+
+
+def test_model_from_trusted_converted_defaults():
+    @model(steps=["_calc"])
+    class Test:
+        a = def_parameter()
+        s = def_sensitivity(default="2", converter=int)
+        m = def_meta(meta="10", converter=int)
+        out = def_return()
+
+        @step(uses=["a", "s", "m"], impacts=["out"])
+        def _calc(self):
+            self.out = self.a * self.s + self.m
+
+    assert Test(a=3).run() == Test.from_trusted(a=3).run() == 16
+    assert Test.from_trusted(a=3, s=3).run() == 19
+
+
+def test_model_rebind():
+    @model(steps=["_calc"])
+    class Test:
+        x = def_parameter()
+        s = def_sensitivity(default=2)
+        items = def_intermediate(init_value=Factory(list))
+        out = def_return()
+
+        @step(uses=["x", "s", "items"], impacts=["out"])
+        def _calc(self):
+            self.items.append(self.x * self.s)
+            self.out = list(self.items)
+
+    inst = Test(x=1, s=3)
+    first = inst.run()
+    assert first == [3]
+    assert inst.rebind(x=2) is inst
+    assert inst.items == [] and inst.out is None and inst.s == 2
+    assert inst.run() == Test(x=2).run() == [4]
+    assert first == [3]
+    with pytest.raises(TypeError):
+        inst.rebind(s=1)
+
+
+def test_model_arun():
+    @model(steps=["_fetch_x", "_fetch_y", "_add"])
+    class Test:
+        x = def_parameter()
+        y = def_parameter()
+        fetched_x = def_intermediate()
+        fetched_y = def_intermediate()
+        added = def_return()
+
+        @step(uses=["x"], impacts=["fetched_x"])
+        async def _fetch_x(self):
+            await asyncio.sleep(0.01)
+            self.fetched_x = self.x
+
+        @step(uses=["y"], impacts=["fetched_y"])
+        async def _fetch_y(self):
+            await asyncio.sleep(0.01)
+            self.fetched_y = self.y
+
+        @step(uses=["fetched_x", "fetched_y"], impacts=["added"])
+        def _add(self):
+            self.added = self.fetched_x + self.fetched_y
+
+    assert Test._fetch_x.is_async is True and Test._add.is_async is False
+    assert Test(x=1, y=2).run() == 3
+    assert asyncio.run(Test(x=1, y=2).arun()) == 3
+    assert asyncio.run(Test(x=1, y=2).arun(to_step="_fetch_y")).fetched_y == 2
+    with pytest.raises(ModelRunError, match=r"At step \[_add\]"):
+        asyncio.run(Test(x=1, y="a").arun())
+
+    with pytest.raises(ModelCreationError):
+
+        @step(uses=["x"], impacts=["added"], metadata={"cache": {}})
+        async def _cached(self):
+            pass
+
+
+@model(steps=["_calc"])
+class PickledModel:
+    x = def_parameter()
+    s = def_sensitivity(default=2)
+    items = def_intermediate(init_value=Factory(list))
+    out = def_return()
+
+    @step(uses=["x", "s", "items"], impacts=["out"])
+    def _calc(self):
+        self.items.append(self.x * self.s)
+        self.out = sum(self.items)
+
+
+def test_model_pickle():
+    assert PickledModel.__module__ == __name__
+    assert pickle.loads(pickle.dumps(PickledModel)) is PickledModel
+
+    inst = PickledModel(x=1, s=3)
+    reduced = inst.__reduce__()
+    assert reduced[1] == (PickledModel, {"x": 1, "s": 3}, {"items": []})
+    new = pickle.loads(pickle.dumps(inst))
+    assert isinstance(new, PickledModel)
+    assert new.run() == inst.run() == 3
+
+    inst.run()
+    new = pickle.loads(pickle.dumps(inst))
+    assert new.items == [3, 3] and new.out == 6
+    assert new.rerun(s=1) == 7  # the full run is kept
+
+
+def test_model_documentation_lazy():
+    @model(steps=["_add"])
+    class Test:
+        """Test summary."""
+
+        parameter = def_parameter(description="This is a parameter.")
+        ret = def_return(description="This is a return.")
+
+        @step(uses=["parameter"], impacts=["ret"])
+        def _add(self):
+            """Do addition."""
+            self.ret = self.parameter
+
+    assert isinstance(Test.__dict__["__doc__"], _LazyModelDoc)
+    assert Test.__dict__["__doc__"].doc is None
+    doc = Test.__doc__
+    assert doc.strip().startswith("Test summary.")
+    assert "Do addition." in doc
+    assert Test(parameter=1).__doc__ is doc
@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_intermediate,
+    def_return,
+)
+from footings.jigs import create_foreach_jig
+from footings.profiling import ProfileReport, StepProfile, profile
+
+
+@model(steps=["_create", "_total"])
+class ProfiledModel:
+    n = def_parameter()
+    frame = def_intermediate()
+    total = def_return()
+
+    @step(uses=["n"], impacts=["frame"])
+    def _create(self):
+        self.frame = pd.DataFrame({"x": range(self.n)})
+
+    @step(uses=["frame"], impacts=["total"])
+    def _total(self):
+        self.total = int(self.frame["x"].sum())
+
+
+def test_profile():
+    with profile() as report:
+        assert ProfiledModel(n=1000).run() == 499500
+        assert ProfiledModel(n=10).run() == 45
+    steps = report.steps
+    assert list(steps) == [("ProfiledModel", "_create"), ("ProfiledModel", "_total")]
+    create = steps[("ProfiledModel", "_create")]
+    assert create.calls == 2
+    assert create.wall_time > 0
+    assert create.peak_memory > 0
+    assert create.impact_size >= 8000
+
+    # outside of the context manager runs are not recorded
+    ProfiledModel(n=10).run()
+    assert report.steps[("ProfiledModel", "_create")].calls == 2
+
+    frame = report.to_dataframe()
+    assert list(frame["step"]) == ["_create", "_total"]
+    assert list(frame["calls"]) == [2, 2]
+
+
+def test_profile_run_argument():
+    report = ProfileReport(memory=False)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ProfiledModel(n=10).run(profile=report, executor=executor)
+    ProfiledModel(n=10).run(returns="total", profile=report)
+    assert report.steps[("ProfiledModel", "_total")].calls == 2
+    assert report.steps[("ProfiledModel", "_total")].peak_memory == 0
+
+    with pytest.raises(TypeError, match="ProfileReport"):
+        ProfiledModel(n=10).run(profile=True)
+
+
+def test_profile_threads():
+    jig = create_foreach_jig(
+        ProfiledModel,
+        iterator_name="records",
+        iterator_keys=("n",),
+        pass_iterator_keys=("n",),
+    )
+    records = [{"n": n} for n in range(4)]
+    with profile(memory=False) as report:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(jig.stream(records=records, executor=executor))
+    assert len(results) == 4
+    assert report.steps[("ProfiledModel", "_total")].calls == 4
+
+
+def test_profile_report_aggregate():
+    r1, r2 = ProfileReport(), ProfileReport()
+    r1.add(StepProfile("M", "_a", calls=1, wall_time=1.0, peak_memory=10))
+    r2.add(StepProfile("M", "_a", calls=2, wall_time=2.0, peak_memory=5))
+    r2.add(StepProfile("M", "_b", calls=1, wall_time=1.0))
+    report = ProfileReport.aggregate([r1, r2])
+    assert report.steps[("M", "_a")] == StepProfile(
+        "M", "_a", calls=3, wall_time=3.0, peak_memory=10
+    )
+    assert len((r1 + r2).steps) == 2
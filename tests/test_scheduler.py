@@ -0,0 +1,164 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_intermediate,
+    def_return,
+)
+from footings.exceptions import StepConflictWarning
+from footings.scheduler import StepGraph, run_steps_concurrently
+
+
+def test_step_graph():
+    graph = StepGraph.create(
+        {
+            "_a": (("parameter.x",), ("intermediate.a",)),
+            "_b": (("parameter.y",), ("intermediate.b",)),
+            "_c": (("intermediate.a", "intermediate.b"), ("return.c",)),
+            "_d": (("return.c",), ("return.c",)),
+        }
+    )
+    assert graph.steps == ("_a", "_b", "_c", "_d")
+    assert graph.predecessors == {
+        "_a": (),
+        "_b": (),
+        "_c": ("_a", "_b"),
+        "_d": ("_c",),
+    }
+    assert graph.conflicts == ()
+
+    graph = StepGraph.create(
+        {
+            "_a": (("parameter.x",), ("return.c",)),
+            "_b": (("parameter.y",), ("return.c",)),
+        }
+    )
+    assert graph.predecessors == {"_a": (), "_b": ("_a",)}
+    assert len(graph.conflicts) == 1
+
+
+def test_run_steps_concurrently():
+    graph = StepGraph.create(
+        {
+            "_a": ((), ("intermediate.a",)),
+            "_b": ((), ("intermediate.b",)),
+            "_c": (("intermediate.a", "intermediate.b"), ("return.c",)),
+        }
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+
+    def run_step(step):
+        if step in ("_a", "_b"):
+            barrier.wait()  # only passes if _a and _b run at the same time
+        order.append(step)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        run_steps_concurrently(graph.steps, graph, run_step, executor)
+    assert order[-1] == "_c"
+
+    def run_step_fail(step):
+        raise ValueError(step)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError):
+            run_steps_concurrently(graph.steps, graph, run_step_fail, executor)
+
+
+@model(steps=["_step_x", "_step_y", "_combine", "_scale"])
+class ModelParallel:
+    x = def_parameter()
+    y = def_parameter()
+    x2 = def_intermediate()
+    y2 = def_intermediate()
+    total = def_return()
+    scaled = def_return()
+
+    @step(uses=["x"], impacts=["x2"])
+    def _step_x(self):
+        self.x2 = self.x * 2
+
+    @step(uses=["y"], impacts=["y2"])
+    def _step_y(self):
+        self.y2 = self.y * 2
+
+    @step(uses=["x2", "y2"], impacts=["total"])
+    def _combine(self):
+        self.total = self.x2 + self.y2
+
+    @step(uses=["total"], impacts=["scaled"])
+    def _scale(self):
+        self.scaled = self.total * 10
+
+
+def test_model_run_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert ModelParallel(x=1, y=2).run(executor=executor) == (6, 60)
+        assert ModelParallel(x=1, y=2).run() == (6, 60)
+        ret = ModelParallel(x=1, y=2).run(to_step="_combine", executor=executor)
+        assert ret.total == 6
+        assert ret.scaled is None
+
+    with pytest.warns(StepConflictWarning, match=r"\[_first\] and \[_second\]"):
+
+        @model(steps=["_first", "_second"])
+        class ModelConflict:
+            x = def_parameter()
+            out = def_return()
+
+            @step(uses=["x"], impacts=["out"])
+            def _first(self):
+                self.out = self.x
+
+            @step(uses=["x"], impacts=["out"])
+            def _second(self):
+                self.out = self.x + 1
+
+    assert len(ModelConflict.__model_step_graph__.conflicts) == 1
+    assert ModelConflict(x=1).run() == 2
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert ModelConflict(x=1).run(executor=executor) == 2
+    assert asyncio.run(ModelConflict(x=1).arun()) == 2
+
+
+def test_step_graph_invalidated():
+    graph = StepGraph.create(
+        {
+            "_a": (("parameter.x",), ("intermediate.a",)),
+            "_b": (("intermediate.a", "parameter.y"), ("return.b",)),
+            "_c": (("return.b", "parameter.z"), ("return.b",)),
+            "_d": (("intermediate.a", "sensitivity.s"), ("return.d",)),
+        }
+    )
+    assert graph.invalidated(("sensitivity.s",)) == (("_d",), ())
+    assert graph.invalidated(("parameter.y",)) == (("_b", "_c"), ())
+    assert graph.invalidated(("parameter.z",)) == (("_b", "_c"), ())
+    assert graph.invalidated(("parameter.x",)) == (("_a", "_b", "_c", "_d"), ())
+
+    graph = StepGraph.create(
+        {
+            "_a": (("return.b", "parameter.x"), ("return.b",)),
+            "_b": (("return.b",), ("return.b",)),
+        }
+    )
+    assert graph.invalidated(("parameter.x",)) == (("_a", "_b"), ("return.b",))
+
+
+def test_step_graph_required():
+    graph = StepGraph.create(
+        {
+            "_a": (("parameter.x",), ("intermediate.a",)),
+            "_b": (("intermediate.a",), ("return.b",)),
+            "_c": (("intermediate.a",), ("return.c",)),
+            "_d": (("return.b",), ("return.b",)),
+        }
+    )
+    assert graph.required(("return.b",)) == ("_a", "_b", "_d")
+    assert graph.required(("return.c",)) == ("_a", "_c")
+    assert graph.required(("return.b",), steps=("_a", "_b")) == ("_a", "_b")
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_sensitivity,
+    def_intermediate,
+    def_return,
+    ModelRunError,
+)
+from footings.sensitivity import run_sensitivity_grid
+
+CALLS = []
+
+
+@model(steps=["_prepare", "_project", "_adjust"])
+class StressModel:
+    x = def_parameter()
+    rate = def_sensitivity(default=1)
+    lapse = def_sensitivity(default=0)
+    prepared = def_intermediate()
+    projected = def_return()
+
+    @step(uses=["x"], impacts=["prepared"])
+    def _prepare(self):
+        CALLS.append("_prepare")
+        self.prepared = [self.x] * 3
+
+    @step(uses=["prepared", "rate"], impacts=["projected"])
+    def _project(self):
+        CALLS.append("_project")
+        self.projected = [v * self.rate for v in self.prepared]
+
+    @step(uses=["projected", "lapse"], impacts=["projected"])
+    def _adjust(self):
+        CALLS.append("_adjust")
+        self.projected.append(self.lapse)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_run_sensitivity_grid(parallel):
+    CALLS.clear()
+    grid = {"rate": [1, 2], "lapse": [0, 5]}
+    if parallel:
+        with ThreadPoolExecutor(2) as executor:
+            results = run_sensitivity_grid(StressModel(x=1), grid, executor=executor)
+    else:
+        results = run_sensitivity_grid(StressModel(x=1), grid)
+
+    assert [scenario for scenario, _ in results] == [
+        {"rate": 1, "lapse": 0},
+        {"rate": 1, "lapse": 5},
+        {"rate": 2, "lapse": 0},
+        {"rate": 2, "lapse": 5},
+    ]
+    for scenario, output in results:
+        assert output == StressModel(x=1, **scenario).run()
+    assert CALLS.count("_prepare") == 1 + 4  # one shared plus one per expected run
+    assert CALLS.count("_project") == 4 + 4
+
+
+def test_run_sensitivity_grid_errors():
+    with pytest.raises(ModelRunError):
+        run_sensitivity_grid(StressModel(x=1), {"x": [1, 2]})
@@ -0,0 +1,64 @@
+import json
+
+from footings.model import (
+    model,
+    step,
+    def_parameter,
+    def_intermediate,
+    def_return,
+)
+from footings.jigs import create_foreach_jig
+from footings.tracing import active_tracer, trace
+
+
+@model(steps=["_double", "_add"])
+class TracedModel:
+    k = def_parameter()
+    x = def_parameter()
+    doubled = def_intermediate()
+    out = def_return()
+
+    @step(uses=["x"], impacts=["doubled"])
+    def _double(self):
+        self.doubled = self.x * 2
+
+    @step(uses=["doubled"], impacts=["out"])
+    def _add(self):
+        self.out = self.doubled + 1
+
+
+def test_trace_model_run(tmp_path):
+    assert active_tracer() is None
+    file = tmp_path / "model.trace.json"
+    with trace(file) as tracer:
+        assert active_tracer() is tracer
+        assert TracedModel(k=1, x=1).run() == 3
+    assert active_tracer() is None
+    assert [event["name"] for event in tracer.events] == [
+        "TracedModel._double",
+        "TracedModel._add",
+    ]
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in tracer.events)
+    assert json.loads(file.read_text()) == tracer.to_chrome_trace()
+
+    TracedModel(k=1, x=1).run()
+    assert len(tracer.events) == 2
+
+
+def test_trace_foreach_jig():
+    jig = create_foreach_jig(
+        TracedModel,
+        iterator_name="records",
+        iterator_keys=("k",),
+        pass_iterator_keys=("k",),
+    )
+    records = [{"k": 1, "x": 1}, {"k": 2, "x": None}]
+    with trace() as tracer:
+        successes, errors = jig(records=records)
+    assert successes == [3] and len(errors) == 1
+    names = [event["name"] for event in tracer.events]
+    assert names.count("WrappedModel.construct") == 2
+    assert names.count("TracedModel.run") == 2
+    assert names.count("TracedModel._double") == 2
+    assert names.count("TracedModel._add") == 1
+    assert "ForeachJig.dispatch" in names and "ForeachJig.partition" in names
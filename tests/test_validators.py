@@ -1,6 +1,7 @@
 import pytest
 
 from attr import Attribute, NOTHING
+import numpy as np
 import pandas as pd
 
 from footings import validators as validator_module
@@ -8,7 +9,7 @@ from footings.data_dictionary import data_dictionary, def_column
 
 # from footings.exceptions import DataDictionaryValidateError
 # from footings.model import model, def_parameter
-from footings.validators import equal_to, not_equal_to
+from footings.validators import equal_to, not_equal_to, in_range
 
 
 def simple_attr(name, validator=None):
@@ -159,8 +160,24 @@ def test_less_than_or_equal_to():
     pass
 
 
-def test_in_range():
-    pass
+def test_in_range(DD):
+    vald = in_range(1, 3)
+    df = _make_df([0, 1, 3, 4], int)
+    assert list(vald.mask(df["COL"])) == [True, False, False, True]
+    assert vald.bounds == (1, 3)
+    with pytest.raises(ValueError) as e:
+        vald(DD, simple_attr("COL"), df["COL"])
+    assert e.value.args == (
+        "COL failed in_range(min_value=1, max_value=3) validator 2 out of 4 rows.",
+    )
+    assert vald(None, simple_attr("test"), 2) is None
+    with pytest.raises(ValueError):
+        vald(None, simple_attr("test"), 4)
+    # missing values are not in range
+    assert list(vald.mask(pd.Series([1.0, np.nan, 4.0]))) == [False, True, True]
+    assert list(vald.mask(pd.Series([1, None], dtype="Int64"))) == [False, True]
+    with pytest.raises(ValueError):
+        vald(None, simple_attr("test"), float("nan"))
 
 
 def test_test_is_in():